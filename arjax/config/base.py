@@ -1,6 +1,8 @@
 # config.py
 """Configuration constants and settings for the Universal Package Helper CLI."""
 
+from types import MappingProxyType
+
 # Timeout values for different package managers (in seconds)
 TIMEOUTS = {
     'aur': 15,
@@ -14,15 +16,15 @@ TIMEOUTS = {
 }
 
 # Keywords used for filtering/scoring
-JUNK_KEYWORDS = ["icon", "dummy", "meta", "symlink", "wrap", "material", "launcher", "unionfs"]
-LOW_PRIORITY_KEYWORDS = ["extension", "plugin", "helper", "daemon", "patch", "theme"]
-BOOST_KEYWORDS = ["editor", "browser", "ide", "official", "gui", "android", "studio", "stable", "canary", "beta"]
+JUNK_KEYWORDS = frozenset(["icon", "dummy", "meta", "symlink", "wrap", "material", "launcher", "unionfs"])
+LOW_PRIORITY_KEYWORDS = frozenset(["extension", "plugin", "helper", "daemon", "patch", "theme"])
+BOOST_KEYWORDS = frozenset(["editor", "browser", "ide", "official", "gui", "android", "studio", "stable", "canary", "beta"])
 
 # Supported platforms
 SUPPORTED_PLATFORMS = ["arch", "debian", "ubuntu", "kali", "linuxmint", "mint", "fedora", "manjaro", "opensuse", "suse"]
 
-# Distribution mapping
-DISTRO_MAP = {
+# Distribution mapping (read-only; look up with DISTRO_MAP.get)
+DISTRO_MAP = MappingProxyType({
     "arch": "arch",
     "manjaro": "arch", 
     "endeavouros": "arch",
@@ -45,7 +47,7 @@ DISTRO_MAP = {
     "opensuse-tumbleweed": "suse",
     "suse": "suse",
     "sles": "suse"
-}
+})
 
 # AUR helpers in order of preference (paru is now preferred)
 AUR_HELPERS = ['paru', 'yay', 'trizen', 'yaourt']
@@ -5,11 +5,18 @@ Configuration management for arjax
 
 import json
 import os
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, Any, Iterator, Optional
+from dataclasses import dataclass, asdict, replace
 from arjax.config.logging import get_logger
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = get_logger(__name__)
 
 @dataclass
@@ -21,6 +28,8 @@ class UserConfig:
     auto_update_mode: str = "manual"  # "automatic" or "manual"
     update_check_interval_hours: int = 24
     background_download_enabled: bool = True
+    max_concurrent_downloads: int = 6
+    download_timeout_seconds: int = 60
     notification_enabled: bool = True
     auto_handle_arch_news: bool = True
     auto_review_aur_trust: bool = True
@@ -33,6 +42,9 @@ class ConfigManager:
     def __init__(self):
         self.config_dir = Path.home() / ".arjax"
         self.config_file = self.config_dir / "config.json"
+        self._cached: Optional[UserConfig] = None
+        self._batch_depth = 0
+        self._batch_dirty = False
         self._ensure_config_dir()
 
     def _ensure_config_dir(self) -> None:
@@ -45,29 +57,70 @@ class ConfigManager:
 
         try:
             # Write to temporary file first
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            if HAS_ORJSON:
+                with open(temp_file, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
 
             # Atomic move to final location
-            temp_file.replace(self.config_file)
+            os.replace(temp_file, self.config_file)
             logger.info(f"Configuration saved to {self.config_file}")
 
         except Exception as e:
             # Clean up temp file on error
-            if temp_file.exists():
-                temp_file.unlink()
+            temp_file.unlink(missing_ok=True)
             logger.error(f"Failed to save configuration: {e}")
             raise
 
+    def invalidate(self) -> None:
+        """Drop the cached configuration so the next load re-reads the file"""
+        self._cached = None
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defer writes from set_config_value until the outermost batch exits"""
+        self._batch_depth += 1
+        completed = False
+        try:
+            yield
+            completed = True
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_dirty:
+                self._batch_dirty = False
+                if completed:
+                    self._save_cached()
+                else:
+                    # Drop the unsaved changes rather than persisting half a batch
+                    self.invalidate()
+
+    def _save_cached(self) -> None:
+        """Write the cached configuration, dropping the cache if the write fails"""
+        try:
+            self.save_config(self._cached)
+        except Exception:
+            self.invalidate()
+            raise
+
     def load_config(self) -> UserConfig:
-        """Load configuration from file"""
+        """Load configuration from file, reusing the cached copy when available"""
+        if self._cached is not None:
+            return replace(self._cached)
+
         if not self.config_file.exists():
             logger.info("No configuration file found, using defaults")
-            return UserConfig()
+            self._cached = UserConfig()
+            return replace(self._cached)
 
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if HAS_ORJSON:
+                with open(self.config_file, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(self.config_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
 
             # Create config object from loaded data
             config = UserConfig()
@@ -76,7 +129,8 @@ class ConfigManager:
                     setattr(config, key, value)
 
             logger.info("Configuration loaded successfully")
-            return config
+            self._cached = config
+            return replace(config)
 
         except Exception as e:
             logger.warning(f"Failed to load configuration, using defaults: {e}")
@@ -86,6 +140,7 @@ class ConfigManager:
         """Save configuration to file atomically"""
         data = asdict(config)
         self._atomic_write(data)
+        self._cached = replace(config)
 
     def get_config_value(self, key: str) -> Any:
         """Get a specific configuration value"""
@@ -97,7 +152,11 @@ class ConfigManager:
         config = self.load_config()
         if hasattr(config, key):
             setattr(config, key, value)
-            self.save_config(config)
+            self._cached = config
+            if self._batch_depth:
+                self._batch_dirty = True
+            else:
+                self._save_cached()
             logger.info(f"Configuration updated: {key} = {value}")
         else:
             raise ValueError(f"Unknown configuration key: {key}")
@@ -115,6 +174,8 @@ class ConfigManager:
             f"  Auto-update mode: {config.auto_update_mode}",
             f"  Update check interval: {config.update_check_interval_hours} hours",
             f"  Background download: {config.background_download_enabled}",
+            f"  Max concurrent downloads: {config.max_concurrent_downloads}",
+            f"  Download timeout: {config.download_timeout_seconds} seconds",
             f"  Notifications: {config.notification_enabled}",
             f"  Auto-handle Arch news: {config.auto_handle_arch_news}",
             f"  Auto-review AUR trust: {config.auto_review_aur_trust}",
@@ -5,11 +5,16 @@ GitHub repository installation module for arjax
 
 import os
 import sys
+import json
 import shutil
 import tempfile
 import subprocess
 import re
-from typing import Optional, Dict, List, Tuple, Any
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Optional, Dict, List, Set, Tuple, Any
 from pathlib import Path
 from abc import ABC, abstractmethod
 
@@ -17,9 +22,37 @@ from arjax.config.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Parallel build jobs for make/ninja
+_NPROC = os.cpu_count() or 1
+
+# github:user/repo, https://github.com/user/repo[.git][/] or git@github.com:user/repo[.git]
+_GITHUB_REPO_RE = re.compile(
+    r"(?:github:|https://github\.com/)(?P<slug>[\w.-]+/[\w.-]+?)(?:\.git)?/?"
+    r"|(?P<ssh>git@github\.com:[\w.-]+/[\w.-]+)"
+)
+
+# Absolute executable paths, resolved once per tool name
+_TOOL_PATHS: Dict[str, str] = {}
+
+def _tool(name: str) -> str:
+    """Resolve a tool to its absolute path via PATH, caching the result"""
+    path = _TOOL_PATHS.get(name)
+    if path is None:
+        path = _TOOL_PATHS.setdefault(name, shutil.which(name) or name)
+    return path
+
+def _list_entries(repo_path: Path) -> Set[str]:
+    """Read the names in a repository's top-level directory with a single scan"""
+    with os.scandir(repo_path) as it:
+        return {entry.name for entry in it}
+
 class ProjectTypeHandler(ABC):
     """Abstract base class for project type handlers"""
 
+    # Held only around steps that write to shared install locations (pip, npm -g,
+    # make install, ...); builds run outside it so concurrent installs overlap them
+    install_lock: Optional[threading.Lock] = None
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -32,16 +65,28 @@ class ProjectTypeHandler(ABC):
         """Files that indicate this project type"""
         pass
 
-    @abstractmethod
     def can_handle(self, repo_path: Path) -> bool:
         """Check if this handler can handle the project"""
-        pass
+        return self.matches(_list_entries(repo_path))
+
+    @property
+    def detection_files(self) -> List[str]:
+        """Top-level file names whose presence alone selects this project type"""
+        return self.indicators
+
+    def matches(self, entries: Set[str]) -> bool:
+        """Check if the repository's top-level entry names indicate this project type"""
+        return any(name in entries for name in self.detection_files)
 
     @abstractmethod
     def build_and_install(self, repo_path: Path, temp_dir: Path) -> bool:
         """Build and install the project"""
         pass
 
+    def install_step(self):
+        """Context for the final install step, serialized across concurrent installs"""
+        return self.install_lock if self.install_lock is not None else nullcontext()
+
     def log_command(self, command: List[str], description: str) -> None:
         """Log a command execution"""
         logger.info(f"{description}: {' '.join(command)}")
@@ -58,26 +103,23 @@ class PythonHandler(ProjectTypeHandler):
     def indicators(self) -> List[str]:
         return ["setup.py", "pyproject.toml", "requirements.txt", "Pipfile"]
 
-    def can_handle(self, repo_path: Path) -> bool:
-        return any((repo_path / indicator).exists() for indicator in self.indicators)
-
     def build_and_install(self, repo_path: Path, temp_dir: Path) -> bool:
         try:
-            # Change to repo directory
-            os.chdir(repo_path)
-
-            # Check for setup.py or pyproject.toml
+            # pip builds and installs in a single command, so all of it is the install step
             if (repo_path / "setup.py").exists():
                 self.log_command(["pip", "install", "."], "Installing Python package")
-                result = subprocess.run(["pip", "install", "."], capture_output=True, text=True)
+                with self.install_step():
+                    result = subprocess.run([_tool("pip"), "install", "."], capture_output=True, text=True, cwd=repo_path)
             elif (repo_path / "pyproject.toml").exists():
                 self.log_command(["pip", "install", "."], "Installing Python package (PEP 517)")
-                result = subprocess.run(["pip", "install", "."], capture_output=True, text=True)
+                with self.install_step():
+                    result = subprocess.run([_tool("pip"), "install", "."], capture_output=True, text=True, cwd=repo_path)
             else:
                 print("  ⚠ No setup.py or pyproject.toml found, installing requirements if present")
                 if (repo_path / "requirements.txt").exists():
                     self.log_command(["pip", "install", "-r", "requirements.txt"], "Installing requirements")
-                    result = subprocess.run(["pip", "install", "-r", "requirements.txt"], capture_output=True, text=True)
+                    with self.install_step():
+                        result = subprocess.run([_tool("pip"), "install", "-r", "requirements.txt"], capture_output=True, text=True, cwd=repo_path)
                 else:
                     print("  ✗ No installation method found for Python project")
                     return False
@@ -104,36 +146,37 @@ class NodeJSHandler(ProjectTypeHandler):
     def indicators(self) -> List[str]:
         return ["package.json", "yarn.lock", "package-lock.json"]
 
-    def can_handle(self, repo_path: Path) -> bool:
-        return (repo_path / "package.json").exists()
+    @property
+    def detection_files(self) -> List[str]:
+        return ["package.json"]
 
     def build_and_install(self, repo_path: Path, temp_dir: Path) -> bool:
         try:
-            os.chdir(repo_path)
-
             # Check if yarn or npm should be used
             use_yarn = (repo_path / "yarn.lock").exists()
+            package_json = self._load_package_json(repo_path)
 
             if use_yarn:
                 # Install dependencies with yarn
                 self.log_command(["yarn", "install"], "Installing dependencies with yarn")
-                result = subprocess.run(["yarn", "install"], capture_output=True, text=True)
+                result = subprocess.run([_tool("yarn"), "install"], capture_output=True, text=True, cwd=repo_path)
                 if result.returncode != 0:
                     print(f"  ✗ Yarn install failed: {result.stderr}")
                     return False
 
                 # Build if build script exists
-                if self._has_build_script():
+                if self._has_build_script(package_json):
                     self.log_command(["yarn", "build"], "Building project with yarn")
-                    result = subprocess.run(["yarn", "build"], capture_output=True, text=True)
+                    result = subprocess.run([_tool("yarn"), "build"], capture_output=True, text=True, cwd=repo_path)
                     if result.returncode != 0:
                         print(f"  ✗ Yarn build failed: {result.stderr}")
                         return False
 
                 # Install globally if it's a CLI tool
-                if self._is_cli_tool():
+                if self._is_cli_tool(package_json):
                     self.log_command(["yarn", "global", "add", "."], "Installing CLI tool globally")
-                    result = subprocess.run(["yarn", "global", "add", "."], capture_output=True, text=True)
+                    with self.install_step():
+                        result = subprocess.run([_tool("yarn"), "global", "add", "."], capture_output=True, text=True, cwd=repo_path)
                 else:
                     print("  ⚠ Not a CLI tool, skipping global installation")
                     return True
@@ -141,23 +184,24 @@ class NodeJSHandler(ProjectTypeHandler):
             else:
                 # Use npm
                 self.log_command(["npm", "install"], "Installing dependencies with npm")
-                result = subprocess.run(["npm", "install"], capture_output=True, text=True)
+                result = subprocess.run([_tool("npm"), "install"], capture_output=True, text=True, cwd=repo_path)
                 if result.returncode != 0:
                     print(f"  ✗ NPM install failed: {result.stderr}")
                     return False
 
                 # Build if build script exists
-                if self._has_build_script():
+                if self._has_build_script(package_json):
                     self.log_command(["npm", "run", "build"], "Building project with npm")
-                    result = subprocess.run(["npm", "run", "build"], capture_output=True, text=True)
+                    result = subprocess.run([_tool("npm"), "run", "build"], capture_output=True, text=True, cwd=repo_path)
                     if result.returncode != 0:
                         print(f"  ✗ NPM build failed: {result.stderr}")
                         return False
 
                 # Install globally if it's a CLI tool
-                if self._is_cli_tool():
+                if self._is_cli_tool(package_json):
                     self.log_command(["npm", "install", "-g", "."], "Installing CLI tool globally")
-                    result = subprocess.run(["npm", "install", "-g", "."], capture_output=True, text=True)
+                    with self.install_step():
+                        result = subprocess.run([_tool("npm"), "install", "-g", "."], capture_output=True, text=True, cwd=repo_path)
                 else:
                     print("  ⚠ Not a CLI tool, skipping global installation")
                     return True
@@ -173,25 +217,23 @@ class NodeJSHandler(ProjectTypeHandler):
             print(f"  ✗ Node.js installation error: {e}")
             return False
 
-    def _has_build_script(self) -> bool:
-        """Check if package.json has a build script"""
+    def _load_package_json(self, repo_path: Path) -> Dict[str, Any]:
+        """Parse package.json, returning an empty dict if it is missing or invalid"""
         try:
-            import json
-            with open("package.json", "r") as f:
-                data = json.load(f)
-                return "scripts" in data and "build" in data["scripts"]
-        except:
-            return False
+            data = json.loads((repo_path / "package.json").read_bytes())
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
 
-    def _is_cli_tool(self) -> bool:
+    def _has_build_script(self, package_json: Dict[str, Any]) -> bool:
+        """Check if package.json has a build script"""
+        scripts = package_json.get("scripts")
+        return isinstance(scripts, dict) and "build" in scripts
+
+    def _is_cli_tool(self, package_json: Dict[str, Any]) -> bool:
         """Check if this is a CLI tool by looking for bin field"""
-        try:
-            import json
-            with open("package.json", "r") as f:
-                data = json.load(f)
-                return "bin" in data or ("name" in data and data["name"].startswith("@"))
-        except:
-            return False
+        name = package_json.get("name")
+        return "bin" in package_json or (isinstance(name, str) and name.startswith("@"))
 
 class CMakeHandler(ProjectTypeHandler):
     """Handler for CMake projects"""
@@ -204,44 +246,52 @@ class CMakeHandler(ProjectTypeHandler):
     def indicators(self) -> List[str]:
         return ["CMakeLists.txt", "cmake"]
 
-    def can_handle(self, repo_path: Path) -> bool:
-        return (repo_path / "CMakeLists.txt").exists()
+    @property
+    def detection_files(self) -> List[str]:
+        return ["CMakeLists.txt"]
 
     def build_and_install(self, repo_path: Path, temp_dir: Path) -> bool:
         try:
-            os.chdir(repo_path)
-
             # Create build directory
             build_dir = repo_path / "build"
             build_dir.mkdir(exist_ok=True)
-            os.chdir(build_dir)
+
+            # Prefer Ninja when available; it schedules parallel builds better than make
+            if shutil.which("ninja"):
+                builder = "ninja"
+                configure_cmd = ["cmake", "-G", "Ninja", ".."]
+            else:
+                builder = "make"
+                configure_cmd = ["cmake", ".."]
+            build_cmd = [builder, f"-j{_NPROC}"]
 
             # Configure with CMake
-            self.log_command(["cmake", ".."], "Configuring with CMake")
-            result = subprocess.run(["cmake", ".."], capture_output=True, text=True)
+            self.log_command(configure_cmd, "Configuring with CMake")
+            result = subprocess.run([_tool("cmake"), *configure_cmd[1:]], capture_output=True, text=True, cwd=build_dir)
             if result.returncode != 0:
                 print(f"  ✗ CMake configure failed: {result.stderr}")
                 return False
 
             # Build
-            self.log_command(["make", "-j$(nproc)"], "Building with make")
-            result = subprocess.run(["make", f"-j{os.cpu_count() or 1}"], capture_output=True, text=True)
+            self.log_command(build_cmd, f"Building with {builder}")
+            result = subprocess.run([_tool(builder), *build_cmd[1:]], capture_output=True, text=True, cwd=build_dir)
             if result.returncode != 0:
-                print(f"  ✗ Make build failed: {result.stderr}")
+                print(f"  ✗ {builder.capitalize()} build failed: {result.stderr}")
                 return False
 
             # Install
             from arjax.package_management.command_gen import build_privileged_command
             import shlex
-            cmd_str = build_privileged_command("make install")
+            cmd_str = build_privileged_command(f"{builder} install")
             cmd_list = shlex.split(cmd_str)
-            self.log_command(cmd_list, "Installing with make install")
-            result = subprocess.run(cmd_list, capture_output=True, text=True)
+            self.log_command(cmd_list, f"Installing with {builder} install")
+            with self.install_step():
+                result = subprocess.run(cmd_list, capture_output=True, text=True, cwd=build_dir)
             if result.returncode == 0:
                 print("  ✓ CMake project installed successfully")
                 return True
             else:
-                print(f"  ✗ Make install failed: {result.stderr}")
+                print(f"  ✗ {builder.capitalize()} install failed: {result.stderr}")
                 return False
 
         except Exception as e:
@@ -259,34 +309,36 @@ class MakefileHandler(ProjectTypeHandler):
     def indicators(self) -> List[str]:
         return ["Makefile", "makefile"]
 
-    def can_handle(self, repo_path: Path) -> bool:
-        return (repo_path / "Makefile").exists() or (repo_path / "makefile").exists()
-
     def build_and_install(self, repo_path: Path, temp_dir: Path) -> bool:
         try:
-            os.chdir(repo_path)
+            # Build the default target first so the compile overlaps other installs;
+            # some Makefiles only build from "install", so a failure here is not fatal
+            build_cmd = ["make", f"-j{_NPROC}"]
+            self.log_command(build_cmd, "Building with make")
+            result = subprocess.run([_tool("make"), *build_cmd[1:]], capture_output=True, text=True, cwd=repo_path)
+            if result.returncode != 0:
+                print("  ⚠ Default make target failed, trying make install directly")
+
+            with self.install_step():
+                # Try make install first
+                self.log_command(["make", "install"], "Installing with make")
+                result = subprocess.run([_tool("make"), "install"], capture_output=True, text=True, cwd=repo_path)
 
-            # Try make install first
-            self.log_command(["make", "install"], "Installing with make")
-            result = subprocess.run(["make", "install"], capture_output=True, text=True)
+                if result.returncode != 0:
+                    # Try with elevated privileges if needed
+                    from arjax.package_management.command_gen import build_privileged_command
+                    import shlex
+                    cmd_str = build_privileged_command("make install")
+                    cmd_list = shlex.split(cmd_str)
+                    self.log_command(cmd_list, "Installing with make install")
+                    result = subprocess.run(cmd_list, capture_output=True, text=True, cwd=repo_path)
 
             if result.returncode == 0:
                 print("  ✓ Makefile project installed successfully")
                 return True
             else:
-                # Try with elevated privileges if needed
-                from arjax.package_management.command_gen import build_privileged_command
-                import shlex
-                cmd_str = build_privileged_command("make install")
-                cmd_list = shlex.split(cmd_str)
-                self.log_command(cmd_list, "Installing with make install")
-                result = subprocess.run(cmd_list, capture_output=True, text=True)
-                if result.returncode == 0:
-                    print("  ✓ Makefile project installed successfully")
-                    return True
-                else:
-                    print(f"  ✗ Make install failed: {result.stderr}")
-                    return False
+                print(f"  ✗ Make install failed: {result.stderr}")
+                return False
 
         except Exception as e:
             print(f"  ✗ Makefile installation error: {e}")
@@ -303,16 +355,25 @@ class GoHandler(ProjectTypeHandler):
     def indicators(self) -> List[str]:
         return ["go.mod", "main.go", ".go"]
 
-    def can_handle(self, repo_path: Path) -> bool:
-        return (repo_path / "go.mod").exists() or any(f.suffix == ".go" for f in repo_path.glob("*.go"))
+    @property
+    def detection_files(self) -> List[str]:
+        return ["go.mod"]
+
+    def matches(self, entries: Set[str]) -> bool:
+        return super().matches(entries) or any(name.endswith(".go") for name in entries)
 
     def build_and_install(self, repo_path: Path, temp_dir: Path) -> bool:
         try:
-            os.chdir(repo_path)
+            # Compile first; go install then reuses the build cache and only copies the binary
+            self.log_command(["go", "build", "."], "Building Go package")
+            result = subprocess.run([_tool("go"), "build", "."], capture_output=True, text=True, cwd=repo_path)
+            if result.returncode != 0:
+                print(f"  ✗ Go build failed: {result.stderr}")
+                return False
 
-            # Install with go install
             self.log_command(["go", "install", "."], "Installing Go package")
-            result = subprocess.run(["go", "install", "."], capture_output=True, text=True)
+            with self.install_step():
+                result = subprocess.run([_tool("go"), "install", "."], capture_output=True, text=True, cwd=repo_path)
 
             if result.returncode == 0:
                 print("  ✓ Go package installed successfully")
@@ -336,16 +397,22 @@ class RustHandler(ProjectTypeHandler):
     def indicators(self) -> List[str]:
         return ["Cargo.toml", "Cargo.lock"]
 
-    def can_handle(self, repo_path: Path) -> bool:
-        return (repo_path / "Cargo.toml").exists()
+    @property
+    def detection_files(self) -> List[str]:
+        return ["Cargo.toml"]
 
     def build_and_install(self, repo_path: Path, temp_dir: Path) -> bool:
         try:
-            os.chdir(repo_path)
+            # Compile first; cargo install --path reuses the workspace target directory
+            self.log_command(["cargo", "build", "--release"], "Building Rust package")
+            result = subprocess.run([_tool("cargo"), "build", "--release"], capture_output=True, text=True, cwd=repo_path)
+            if result.returncode != 0:
+                print(f"  ✗ Cargo build failed: {result.stderr}")
+                return False
 
-            # Install with cargo
             self.log_command(["cargo", "install", "--path", "."], "Installing Rust package")
-            result = subprocess.run(["cargo", "install", "--path", "."], capture_output=True, text=True)
+            with self.install_step():
+                result = subprocess.run([_tool("cargo"), "install", "--path", "."], capture_output=True, text=True, cwd=repo_path)
 
             if result.returncode == 0:
                 print("  ✓ Rust package installed successfully")
@@ -371,38 +438,65 @@ class ProjectTypeRegistry:
             RustHandler(),
         ]
 
+        # Detection file name -> index of the first handler it selects
+        self._indicator_map: Dict[str, int] = {}
+        # Handlers with extra matching rules beyond their detection files
+        self._pattern_handlers: List[Tuple[int, ProjectTypeHandler]] = []
+        for index, handler in enumerate(self.handlers):
+            for name in handler.detection_files:
+                self._indicator_map.setdefault(name, index)
+            if type(handler).matches is not ProjectTypeHandler.matches:
+                self._pattern_handlers.append((index, handler))
+
     def detect_project_type(self, repo_path: Path) -> Optional[ProjectTypeHandler]:
         """Detect the project type and return appropriate handler"""
-        for handler in self.handlers:
-            if handler.can_handle(repo_path):
+        entries = _list_entries(repo_path)
+        best = min(
+            (self._indicator_map[name] for name in entries & self._indicator_map.keys()),
+            default=len(self.handlers),
+        )
+        # A higher-priority handler may still match through its own rules
+        for index, handler in self._pattern_handlers:
+            if index >= best:
+                break
+            if handler.matches(entries):
                 return handler
-        return None
+        return self.handlers[best] if best < len(self.handlers) else None
 
     def get_supported_types(self) -> List[str]:
         """Get list of supported project types"""
         return [handler.name for handler in self.handlers]
 
+@functools.lru_cache(maxsize=None)
+def _git_repo_class() -> Optional[Any]:
+    """Import GitPython's Repo once, remembering a failed import as None"""
+    try:
+        from git import Repo
+    except ImportError:
+        return None
+    return Repo
+
 def clone_repository(repo_url: str, temp_dir: Path) -> Optional[Path]:
     """Clone a GitHub repository to a temporary directory"""
     try:
         print(f"📥 Cloning repository: {repo_url}")
 
         # Use GitPython if available, otherwise use subprocess
-        try:
-            from git import Repo
+        Repo = _git_repo_class()
+        if Repo is not None:
             logger.info(f"Cloning {repo_url} to {temp_dir}")
-            Repo.clone_from(repo_url, temp_dir)
+            Repo.clone_from(repo_url, temp_dir, depth=1, single_branch=True)
             print("  ✓ Repository cloned successfully")
             return temp_dir
-        except ImportError:
-            # Fallback to subprocess
+        else:
+            # Fallback to subprocess; git's progress and errors go straight to the terminal
             logger.info(f"Cloning {repo_url} to {temp_dir} using subprocess")
-            result = subprocess.run(["git", "clone", repo_url, str(temp_dir)], capture_output=True, text=True)
+            result = subprocess.run([_tool("git"), "clone", "--depth=1", "--single-branch", repo_url, str(temp_dir)])
             if result.returncode == 0:
                 print("  ✓ Repository cloned successfully")
                 return temp_dir
             else:
-                print(f"  ✗ Git clone failed: {result.stderr}")
+                print(f"  ✗ Git clone failed (exit code {result.returncode})")
                 return None
 
     except Exception as e:
@@ -411,29 +505,31 @@ def clone_repository(repo_url: str, temp_dir: Path) -> Optional[Path]:
 
 def validate_github_url(url_or_repo: str) -> Optional[str]:
     """Validate and convert GitHub URL or user/repo format to full URL"""
-    # Handle github:user/repo format
+    match = _GITHUB_REPO_RE.fullmatch(url_or_repo)
+    if match:
+        # git@github.com:user/repo.git is kept as-is so SSH keys are used
+        if match.group("ssh"):
+            return url_or_repo
+        return f"https://github.com/{match.group('slug')}.git"
+
     if url_or_repo.startswith("github:"):
-        repo = url_or_repo[7:]  # Remove "github:" prefix
-        if "/" not in repo:
-            print("  ✗ Invalid GitHub repo format. Use: github:user/repo")
-            return None
-        return f"https://github.com/{repo}.git"
-
-    # Handle full GitHub URLs
-    if url_or_repo.startswith("https://github.com/"):
-        if not url_or_repo.endswith(".git"):
-            url_or_repo += ".git"
-        return url_or_repo
-
-    # Handle git@github.com:user/repo.git format
-    if url_or_repo.startswith("git@github.com:"):
-        return url_or_repo
-
-    print("  ✗ Invalid GitHub URL format. Use: github:user/repo or https://github.com/user/repo")
+        print("  ✗ Invalid GitHub repo format. Use: github:user/repo")
+    else:
+        print("  ✗ Invalid GitHub URL format. Use: github:user/repo or https://github.com/user/repo")
     return None
 
-def install_from_github(repo_spec: str) -> bool:
-    """Main function to install from GitHub repository"""
+def _remove_node_modules(repo_path: Path) -> None:
+    """Delete node_modules with rm -rf, which is much faster than shutil.rmtree on huge trees"""
+    node_modules = repo_path / "node_modules"
+    if node_modules.is_dir() and not node_modules.is_symlink():
+        subprocess.run([_tool("rm"), "-rf", "--", str(node_modules)], capture_output=True)
+
+def install_from_github(repo_spec: str, install_lock: Optional[threading.Lock] = None) -> bool:
+    """Main function to install from GitHub repository
+
+    When install_lock is given, the handler holds it only around its final install
+    commands, so concurrent callers overlap on cloning, detection and building.
+    """
     print(f"\n🔧 Installing from GitHub: {repo_spec}")
 
     # Validate the repo specification
@@ -442,9 +538,10 @@ def install_from_github(repo_spec: str) -> bool:
         return False
 
     # Create temporary directory
-    temp_dir = None
+    workdir = None
     try:
-        temp_dir = Path(tempfile.mkdtemp(prefix="arjax-github-"))
+        workdir = tempfile.TemporaryDirectory(prefix="arjax-github-")
+        temp_dir = Path(workdir.name)
         print(f"📁 Working in temporary directory: {temp_dir}")
 
         # Clone the repository
@@ -470,7 +567,8 @@ def install_from_github(repo_spec: str) -> bool:
 
         print(f"  🔍 Detected project type: {handler.name}")
 
-        # Build and install
+        # Build and install; the handler takes install_lock only around its install commands
+        handler.install_lock = install_lock
         success = handler.build_and_install(repo_path, temp_dir)
 
         if success:
@@ -486,14 +584,30 @@ def install_from_github(repo_spec: str) -> bool:
 
     finally:
         # Clean up temporary directory
-        if temp_dir and temp_dir.exists():
-            print(f"🧹 Cleaning up temporary directory: {temp_dir}")
+        if workdir is not None:
+            print(f"🧹 Cleaning up temporary directory: {workdir.name}")
             try:
-                shutil.rmtree(temp_dir)
+                _remove_node_modules(Path(workdir.name))
+                workdir.cleanup()
                 print("  ✓ Cleanup completed")
             except Exception as e:
                 print(f"  ⚠ Cleanup warning: {e}")
 
+def install_many_from_github(repo_specs: List[str]) -> Dict[str, bool]:
+    """Install several GitHub repositories, cloning and building them concurrently
+
+    The final install steps still run one at a time: package managers such as
+    pip and npm are not safe to run in parallel against the same environment.
+    """
+    specs = list(dict.fromkeys(repo_specs))
+    if not specs:
+        return {}
+
+    install_lock = threading.Lock()
+    with ThreadPoolExecutor(max_workers=min(len(specs), os.cpu_count() or 1)) as executor:
+        futures = {spec: executor.submit(install_from_github, spec, install_lock) for spec in specs}
+        return {spec: future.result() for spec, future in futures.items()}
+
 def check_dependencies() -> Dict[str, bool]:
     """Check if required dependencies are available"""
     deps = {
@@ -508,12 +622,11 @@ def check_dependencies() -> Dict[str, bool]:
         "cargo": False,
     }
 
-    # Check each dependency
-    for dep in deps.keys():
-        try:
-            result = subprocess.run([dep, "--version"], capture_output=True, timeout=5)
-            deps[dep] = result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
-            deps[dep] = False
+    # A PATH lookup is enough to know a tool is present; no need to run it
+    for dep in deps:
+        path = shutil.which(dep)
+        deps[dep] = path is not None
+        if path is not None:
+            _TOOL_PATHS[dep] = path
 
     return deps
\ No newline at end of file
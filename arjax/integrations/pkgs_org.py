@@ -11,13 +11,20 @@ Usage:
 from __future__ import annotations
 import os
 import time
+import atexit
 import json
 import hashlib
+import functools
 import logging
-from typing import List, Optional, Dict, Any
+import threading
+import weakref
+from concurrent.futures import Future, wait
+from typing import List, Optional, Dict, Any, Tuple
 from urllib.parse import quote_plus, urljoin
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Optional dependency for HTML parsing
 try:
@@ -25,6 +32,31 @@ try:
 except Exception:
     BeautifulSoup = None  # fallback will error with a nice message if needed
 
+# Prefer the libxml2-based lxml parser (much faster) when installed
+try:
+    import lxml.html as lxml_html
+    from lxml import etree
+    HTML_PARSER = "lxml"
+except ImportError:
+    lxml_html = None
+    etree = None
+    HTML_PARSER = "html.parser"
+
+# httpx with h2 installed lets every request to pkgs.org share one HTTP/2 connection
+try:
+    import httpx
+    import h2  # noqa: F401  (required by httpx for http2=True)
+    HAS_HTTP2 = True
+except ImportError:
+    httpx = None
+    HAS_HTTP2 = False
+
+# orjson parses and serializes several times faster than the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Basic logging
 logger = logging.getLogger("pkgs_org")
 logger.setLevel(logging.INFO)
@@ -36,16 +68,26 @@ if not logger.handlers:
 # Default endpoints (undocumented/unofficial)
 JSON_SEARCH_URL = "https://api.pkgs.org/v1/search?q={q}"
 HTML_SEARCH_URL = "https://pkgs.org/search/?q={q}"     # distro can be appended as &on=<distro>
+# URL prefixes of the above, so request URLs are built by concatenation
+_JSON_SEARCH_PREFIX = JSON_SEARCH_URL.replace("{q}", "")
+_HTML_SEARCH_PREFIX = HTML_SEARCH_URL.replace("{q}", "")
 
 # Default request settings
 DEFAULT_TIMEOUT = 10.0          # seconds
 RETRY_COUNT = 2
 RETRY_BACKOFF = 1.0            # seconds between retries
+RETRY_STATUSES = (429, 500, 502, 503, 504)
 MIN_REQUEST_INTERVAL = 0.5     # seconds - polite throttling
+HTML_HEAD_START = 1.0          # seconds the JSON endpoint gets before the HTML fallback is also requested
 
 # Cache settings
 DEFAULT_CACHE_DIR = os.path.expanduser("~/.cache/arjax")
 DEFAULT_CACHE_FILE = os.path.join(DEFAULT_CACHE_DIR, "pkgs_org_cache.json")
+MEM_CACHE_SIZE = 256           # searches kept in memory in front of the disk cache
+STALE_RETENTION = 7 * 86400    # seconds - expired entries with validators kept for conditional GETs
+VALIDATOR_FIELDS = ("etag", "last_modified", "source")
+EXPIRED_COMPACT_THRESHOLD = 64 # expired lookups before expired entries are dropped in bulk
+JOURNAL_COMPACT_THRESHOLD = 256  # journal records before they are folded into the cache file
 
 
 def _ensure_cache_dir(path: str) -> None:
@@ -53,46 +95,227 @@ def _ensure_cache_dir(path: str) -> None:
     os.makedirs(d, exist_ok=True)
 
 
+def _json_loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
 def _hash_key(s: str) -> str:
     return hashlib.sha256(s.encode("utf-8")).hexdigest()
 
 
+def _conditional_headers(state: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    """If-None-Match/If-Modified-Since headers for revalidating a cached response."""
+    headers = {}
+    if state:
+        if state.get("etag"):
+            headers["If-None-Match"] = state["etag"]
+        if state.get("last_modified"):
+            headers["If-Modified-Since"] = state["last_modified"]
+    return headers
+
+
+def _capture_validators(resp, state: Optional[Dict[str, Any]]) -> None:
+    """Record the ETag/Last-Modified of a fresh response in the caller's state dict."""
+    if state is None:
+        return
+    state["etag"] = resp.headers.get("ETag")
+    state["last_modified"] = resp.headers.get("Last-Modified")
+
+
+def _run_in_daemon(fn, *args, **kwargs) -> Future:
+    """Run fn on a daemon thread, so an in-flight request never holds up interpreter exit."""
+    future: Future = Future()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name="pkgs-org", daemon=True).start()
+    return future
+
+
+# Repeated queries and distro names are quoted once
+_quote = functools.lru_cache(maxsize=256)(quote_plus)
+
+
+@functools.lru_cache(maxsize=1024)
+def _search_cache_key(query: str, distro: Optional[str], limit: int) -> str:
+    return _hash_key(f"search:{distro or 'any'}:{limit}:{query}")
+
+
+def _requests_session(user_agent: str) -> requests.Session:
+    """Pooled requests session that retries transient failures."""
+    session = requests.Session()
+    session.headers.update({"User-Agent": user_agent, "Connection": "keep-alive"})
+    # urllib3 retries transient failures; the final response is still returned
+    # so the status checks in the client decide what counts as an error
+    retry = Retry(
+        total=RETRY_COUNT,
+        backoff_factor=RETRY_BACKOFF,
+        status_forcelist=RETRY_STATUSES,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _httpx_client(user_agent: str) -> "httpx.Client":
+    """HTTP/2 httpx client; concurrent requests are multiplexed over one connection."""
+    limits = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+    # No Connection header here: it is not allowed in HTTP/2 and keep-alive is the default
+    return httpx.Client(
+        headers={"User-Agent": user_agent},
+        timeout=DEFAULT_TIMEOUT,
+        follow_redirects=True,
+        transport=httpx.HTTPTransport(http2=True, limits=limits, retries=RETRY_COUNT),
+    )
+
+
 class DiskCache:
-    """A tiny file-backed JSON cache with TTL. Not highly concurrent; intended for CLI usage."""
+    """A tiny file-backed JSON cache with TTL. Not highly concurrent; intended for CLI usage.
+
+    set() appends one record to a journal next to the cache file instead of rewriting
+    the whole file; the journal is replayed on load and folded into the file by vacuum()
+    or once it grows as large as the file it extends.
+    """
     def __init__(self, path: str = DEFAULT_CACHE_FILE):
         self.path = os.path.expanduser(path)
+        self.journal_path = self.path + ".log"
         _ensure_cache_dir(self.path)
         self._load()
+        self._expired_count = 0
+        self._dirty = False
+        # Compaction only happens in memory; _flush_caches writes it out when the process ends
+        _open_caches.add(self)
 
     def _load(self):
         try:
-            with open(self.path, "r", encoding="utf-8") as f:
-                self._data = json.load(f)
+            with open(self.path, "rb") as f:
+                self._data = _json_loads(f.read())
         except Exception:
             self._data = {}
+        self._journal_len = 0
+        try:
+            with open(self.journal_path, "rb") as f:
+                for line in f:
+                    try:
+                        key, rec = _json_loads(line)
+                    except Exception:
+                        continue  # torn write from an interrupted process
+                    self._data[key] = rec
+                    self._journal_len += 1
+        except OSError:
+            pass
 
     def _save(self):
+        # Expired entries are dropped here rather than on every get(); those with
+        # validators stay a while longer so they can be revalidated with a 304
+        self._compact(time.time())
         tmp = self.path + ".tmp"
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(self._data, f, indent=2, ensure_ascii=False)
+        with open(tmp, "wb") as f:
+            f.write(_json_dumps(self._data))
         os.replace(tmp, self.path)
-
-    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        # Everything in the journal is now in the file
+        try:
+            os.remove(self.journal_path)
+        except FileNotFoundError:
+            pass
+        self._journal_len = 0
+        self._dirty = False
+
+    def _save_if_dirty(self):
+        if not self._dirty:
+            return
+        try:
+            self._save()
+        except OSError as e:
+            logger.debug("Could not save pkgs.org cache: %s", e)
+
+    def _compact(self, now: float):
+        """Drop prunable expired entries from memory; the file is rewritten on the next save."""
+        size = len(self._data)
+        self._data = {k: rec for k, rec in self._data.items() if not self._is_prunable(rec, now)}
+        self._expired_count = 0
+        if len(self._data) < size:
+            self._dirty = True
+
+    def get(self, key: str, now: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        rec = self.get_record(key, now)
+        return rec.get("value") if rec else None
+
+    def get_record(self, key: str, now: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Return the raw {value, expires_at} record for key, or None if missing or expired.
+
+        Expiry times are persisted, so they are wall-clock (time.time()) values;
+        callers doing several lookups can pass one sampled `now`.
+        """
         rec = self._data.get(key)
         if not rec:
             return None
-        now = time.time()
+        if now is None:
+            now = time.time()
         if rec.get("expires_at", 0) < now:
-            # expired
-            self._data.pop(key, None)
-            self._save()
+            # expired; left in place and dropped in bulk once enough have been seen
+            self._expired_count += 1
+            if self._expired_count > EXPIRED_COMPACT_THRESHOLD:
+                self._compact(now)
             return None
-        return rec.get("value")
+        return rec
+
+    def get_stale(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the raw record for key even if it has expired."""
+        return self._data.get(key)
+
+    @staticmethod
+    def _is_prunable(rec: Dict[str, Any], now: float) -> bool:
+        expires_at = rec.get("expires_at", 0)
+        if rec.get("etag") or rec.get("last_modified"):
+            expires_at += STALE_RETENTION
+        return expires_at < now
+
+    def vacuum(self):
+        """Drop expired entries and rewrite the cache file, folding in the journal."""
+        self._save()
 
-    def set(self, key: str, value: Any, ttl: int):
+    def set(self, key: str, value: Any, ttl: int, validators: Optional[Dict[str, Any]] = None):
         rec = {"value": value, "expires_at": time.time() + ttl}
+        if validators:
+            rec.update((k, v) for k, v in validators.items() if k in VALIDATOR_FIELDS and v)
         self._data[key] = rec
-        self._save()
+        with open(self.journal_path, "ab") as f:
+            f.write(_json_dumps([key, rec]) + b"\n")
+        self._journal_len += 1
+        # Folding only once the journal holds as many records as the last full write
+        # (at least half the cache) keeps set() amortized O(1)
+        if self._journal_len > max(JOURNAL_COMPACT_THRESHOLD, len(self._data) // 2):
+            self._save()
+
+
+# Live caches, flushed once at exit; weak so short-lived caches are not kept alive until then
+_open_caches: "weakref.WeakSet[DiskCache]" = weakref.WeakSet()
+
+
+def _flush_caches():
+    for cache in list(_open_caches):
+        cache._save_if_dirty()
+
+
+atexit.register(_flush_caches)
 
 
 class PkgsOrgClient:
@@ -105,69 +328,136 @@ class PkgsOrgClient:
     ):
         self.cache = DiskCache(cache_file)
         self.ttl = ttl
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": user_agent})
-        adapter = requests.adapters.HTTPAdapter(max_retries=RETRY_COUNT)
-        self.session.mount("https://", adapter)
-        self.session.mount("http://", adapter)
-        self._last_request = 0.0
+        if HAS_HTTP2:
+            self.session = _httpx_client(user_agent)
+        else:
+            self.session = _requests_session(user_agent)
+        # httpx only retries failed connections, so retryable statuses are handled in _get()
+        self._retry_statuses = HAS_HTTP2
+        # monotonic clock: only used for spacing requests within this process
+        self._last_request = float("-inf")
         self._min_request_interval = float(min_request_interval)
+        # the JSON and HTML requests may run on different threads
+        self._throttle_lock = threading.Lock()
+        # (query, distro, limit) -> (expires_at, results); checked before the disk cache
+        self._mem_cache: Dict[Tuple[str, Optional[str], int], Tuple[float, List[Dict[str, Any]]]] = {}
+
+    def _get(self, url: str, headers: Optional[Dict[str, str]] = None):
+        resp = self.session.get(url, timeout=DEFAULT_TIMEOUT, headers=headers)
+        if self._retry_statuses:
+            for attempt in range(RETRY_COUNT):
+                if resp.status_code not in RETRY_STATUSES:
+                    break
+                time.sleep(RETRY_BACKOFF * (2 ** attempt))
+                resp = self.session.get(url, timeout=DEFAULT_TIMEOUT, headers=headers)
+        return resp
 
     def _throttle(self):
-        delta = time.time() - self._last_request
-        if delta < self._min_request_interval:
-            time.sleep(self._min_request_interval - delta)
+        # Held while sleeping so concurrent requests are spaced one after another
+        with self._throttle_lock:
+            delta = time.monotonic() - self._last_request
+            if delta < self._min_request_interval:
+                time.sleep(self._min_request_interval - delta)
+            self._last_request = time.monotonic()
+
+    def _get_cached(self, key: str, mem_key: Optional[tuple] = None, now: Optional[float] = None):
+        rec = self.cache.get_record(key, now)
+        if rec is None:
+            return None
+        if mem_key is not None:
+            self._remember(mem_key, rec["expires_at"], rec.get("value"))
+        return rec.get("value")
 
-    def _get_cached(self, key: str):
-        return self.cache.get(key)
+    def _set_cached(self, key: str, value: Any, mem_key: Optional[tuple] = None,
+                    validators: Optional[Dict[str, Any]] = None):
+        self.cache.set(key, value, ttl=self.ttl, validators=validators)
+        if mem_key is not None:
+            self._remember(mem_key, time.time() + self.ttl, value)
 
-    def _set_cached(self, key: str, value: Any):
-        self.cache.set(key, value, ttl=self.ttl)
+    def _remember(self, mem_key: tuple, expires_at: float, value: Any):
+        self._mem_cache[mem_key] = (expires_at, value)
+        if len(self._mem_cache) > MEM_CACHE_SIZE:
+            # dicts keep insertion order, so the first key is the oldest entry
+            self._mem_cache.pop(next(iter(self._mem_cache)), None)
 
     def _cache_key_for_search(self, query: str, distro: Optional[str], limit: int):
-        key = f"search:{distro or 'any'}:{limit}:{query}"
-        return _hash_key(key)
+        return _search_cache_key(query, distro, limit)
 
     def search(self, query: str, distro: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
         """
         Search pkgs.org for 'query'. Returns a list of dicts:
           { name, version, distro, repo, url, summary }
         """
+        now = time.time()
+        mem_key = (query, distro, limit)
+        hit = self._mem_cache.get(mem_key)
+        if hit is not None and hit[0] >= now:
+            return hit[1]
+
         cache_key = self._cache_key_for_search(query, distro, limit)
-        cached = self._get_cached(cache_key)
+        cached = self._get_cached(cache_key, mem_key, now)
         if cached is not None:
             logger.debug("Cache hit for query=%s distro=%s", query, distro)
             return cached
 
-        # Try JSON endpoint first (fast)
+        # An expired entry's validators let the endpoint that produced it answer 304
+        stale = self.cache.get_stale(cache_key) or {}
+        json_state = {"source": "json"}
+        html_state = {"source": "html"}
+        if stale.get("source") == "json":
+            json_state.update(stale)
+        elif stale.get("source") == "html":
+            html_state.update(stale)
+
+        # The JSON endpoint is preferred and gets a head start; the HTML fallback is
+        # only requested alongside it when JSON has not answered by then, so a slow
+        # JSON call no longer delays it by a full timeout
+        json_future = _run_in_daemon(self._search_json, query, distro=distro, limit=limit, revalidate=json_state)
+        wait([json_future], timeout=HTML_HEAD_START)
+        html_future = None
+        if not json_future.done():
+            html_future = _run_in_daemon(self._search_html, query, distro=distro, limit=limit, revalidate=html_state)
+
         try:
-            results = self._search_json(query, distro=distro, limit=limit)
+            results = json_future.result()
             if results:
-                self._set_cached(cache_key, results)
+                self._set_cached(cache_key, results, mem_key, validators=json_state)
                 return results
         except Exception as e:
             logger.debug("JSON search failed: %s", e)
 
         # Fallback to HTML scraping
-        results = self._search_html(query, distro=distro, limit=limit)
-        self._set_cached(cache_key, results)
+        if html_future is None:
+            results = self._search_html(query, distro=distro, limit=limit, revalidate=html_state)
+        else:
+            results = html_future.result()
+        self._set_cached(cache_key, results, mem_key, validators=html_state)
         return results
 
-    def _search_json(self, query: str, distro: Optional[str], limit: int) -> List[Dict[str, Any]]:
+    def _search_json(
+        self, query: str, distro: Optional[str], limit: int, revalidate: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Use the unofficial JSON endpoint:
           https://api.pkgs.org/v1/search?q=...
         Note: undocumented; may change.
+
+        revalidate, if given, holds the validators and value of a previous response; a 304
+        returns that value, and a fresh response's validators are written back into it.
         """
         self._throttle()
-        url = JSON_SEARCH_URL.format(q=quote_plus(query))
+        url = _JSON_SEARCH_PREFIX + _quote(query)
         # Some sites accept distro hint via query param 'on', but JSON endpoint may not support it.
         logger.debug("JSON search %s", url)
-        resp = self.session.get(url, timeout=DEFAULT_TIMEOUT)
-        self._last_request = time.time()
+        resp = self._get(url, headers=_conditional_headers(revalidate))
+        self._last_request = time.monotonic()
+        if resp.status_code == 304 and revalidate and "value" in revalidate:
+            logger.debug("JSON search not modified: %s", url)
+            return revalidate["value"]
         if resp.status_code != 200:
             raise RuntimeError(f"JSON endpoint returned status {resp.status_code}")
-        data = resp.json()
+        _capture_validators(resp, revalidate)
+        data = _json_loads(resp.content)
         # The structure of the JSON is unofficial; we'll try to robustly extract results.
         results = []
         items = data.get("results") or data.get("packages") or data.get("data") or []
@@ -186,86 +476,34 @@ class PkgsOrgClient:
                 continue
         return results
 
-    def _search_html(self, query: str, distro: Optional[str], limit: int) -> List[Dict[str, Any]]:
+    def _search_html(
+        self, query: str, distro: Optional[str], limit: int, revalidate: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Scrape pkgs.org search page as fallback.
         Example URL: https://pkgs.org/search/?q=<query>&on=ubuntu
+        revalidate works as in _search_json.
         """
-        if BeautifulSoup is None:
+        if lxml_html is None and BeautifulSoup is None:
             raise RuntimeError("BeautifulSoup is required for HTML fallback. Install 'beautifulsoup4'.")
 
         self._throttle()
-        q = quote_plus(query)
-        url = HTML_SEARCH_URL.format(q=q)
+        url = _HTML_SEARCH_PREFIX + _quote(query)
         if distro:
-            url = url + "&on=" + quote_plus(distro)
+            url += "&on=" + _quote(distro)
         logger.debug("HTML search %s", url)
-        resp = self.session.get(url, timeout=DEFAULT_TIMEOUT)
-        self._last_request = time.time()
+        resp = self._get(url, headers=_conditional_headers(revalidate))
+        self._last_request = time.monotonic()
+        if resp.status_code == 304 and revalidate and "value" in revalidate:
+            logger.debug("HTML search not modified: %s", url)
+            return revalidate["value"]
         if resp.status_code != 200:
             raise RuntimeError(f"HTML search returned status {resp.status_code}")
+        _capture_validators(resp, revalidate)
 
-        soup = BeautifulSoup(resp.content, "html.parser")
-        results: List[Dict[str, Any]] = []
-
-        # pkgs.org search result HTML structure (best-effort parsing)
-        # Each result often appears as <div class="package"> or <div class="row"> with <a href="/.../pkg.html">Name</a>
-        # We'll search for links that look like package pages (contain '/download/' or end with '.html')
-        # and try to extract repo/distro text near them.
-        anchors = soup.find_all("a", href=True)
-        seen = set()
-        for a in anchors:
-            href = a["href"]
-            if ("/download/" in href) or href.endswith(".html") or "/package/" in href:
-                name_text = a.get_text(strip=True)
-                if not name_text:
-                    continue
-                # build absolute URL
-                package_url = urljoin("https://pkgs.org", href)
-                key = (name_text, package_url)
-                if key in seen:
-                    continue
-                seen.add(key)
-
-                # attempt to find a repository/distro string nearby
-                parent = a.parent
-                summary = ""
-                repo = ""
-                distro_hint = None
-                # look for small tags or spans
-                small = parent.find("small") if parent else None
-                if small:
-                    summary = small.get_text(" ", strip=True)
-
-                # sometimes repo/distro are in the same row; search siblings for a '.repo' or 'td' with distro text
-                sib = parent.find_next_sibling()
-                if sib:
-                    repo = sib.get_text(" ", strip=True)
-
-                results.append({"name": name_text, "version": "", "repo": repo, "url": package_url, "summary": summary, "distro": distro_hint})
-                if len(results) >= limit:
-                    break
-
-        # If nothing found, as last resort, try more structured table parsing
-        if not results:
-            # look for tables with search results
-            tables = soup.find_all("table")
-            for t in tables:
-                for row in t.find_all("tr"):
-                    cols = row.find_all("td")
-                    if len(cols) >= 2:
-                        link = cols[0].find("a", href=True)
-                        if link:
-                            name = link.get_text(strip=True)
-                            url = urljoin("https://pkgs.org", link["href"])
-                            repo = cols[1].get_text(" ", strip=True)
-                            results.append({"name": name, "version": "", "repo": repo, "url": url, "summary": "", "distro": None})
-                    if len(results) >= limit:
-                        break
-                if len(results) >= limit:
-                    break
-
-        return results
+        if lxml_html is not None:
+            return _parse_search_lxml(resp.content, limit)
+        return _parse_search_soup(resp.content, limit)
 
     def get_package_page(self, package_url: str) -> Dict[str, Any]:
         """
@@ -274,15 +512,15 @@ class PkgsOrgClient:
         """
         self._throttle()
         logger.debug("Fetching package page %s", package_url)
-        resp = self.session.get(package_url, timeout=DEFAULT_TIMEOUT)
-        self._last_request = time.time()
+        resp = self._get(package_url)
+        self._last_request = time.monotonic()
         if resp.status_code != 200:
             raise RuntimeError(f"Package page returned {resp.status_code}")
 
         if BeautifulSoup is None:
             raise RuntimeError("BeautifulSoup is required to parse package pages.")
 
-        soup = BeautifulSoup(resp.content, "html.parser")
+        soup = BeautifulSoup(resp.content, HTML_PARSER)
         # name usually in <h1>
         name_tag = soup.find("h1")
         name = name_tag.get_text(strip=True) if name_tag else ""
@@ -309,6 +547,170 @@ class PkgsOrgClient:
         return {"name": name, "version": version, "repo": repo, "distro": distro, "description": desc, "url": package_url}
 
 
+def _parse_search_soup(content: bytes, limit: int) -> List[Dict[str, Any]]:
+    """Extract search results from a pkgs.org search page with BeautifulSoup."""
+    soup = BeautifulSoup(content, HTML_PARSER)
+    results: List[Dict[str, Any]] = []
+
+    # pkgs.org search result HTML structure (best-effort parsing)
+    # Each result often appears as <div class="package"> or <div class="row"> with <a href="/.../pkg.html">Name</a>
+    # We'll search for links that look like package pages (contain '/download/' or end with '.html')
+    # and try to extract repo/distro text near them.
+    anchors = soup.find_all("a", href=True)
+    seen = set()
+    for a in anchors:
+        href = a["href"]
+        if ("/download/" in href) or href.endswith(".html") or "/package/" in href:
+            name_text = a.get_text(strip=True)
+            if not name_text:
+                continue
+            # build absolute URL
+            package_url = urljoin("https://pkgs.org", href)
+            key = (name_text, package_url)
+            if key in seen:
+                continue
+            seen.add(key)
+
+            # attempt to find a repository/distro string nearby
+            parent = a.parent
+            summary = ""
+            repo = ""
+            distro_hint = None
+            # look for small tags or spans
+            small = parent.find("small") if parent else None
+            if small:
+                summary = small.get_text(" ", strip=True)
+
+            # sometimes repo/distro are in the same row; search siblings for a '.repo' or 'td' with distro text
+            sib = parent.find_next_sibling()
+            if sib:
+                repo = sib.get_text(" ", strip=True)
+
+            results.append({"name": name_text, "version": "", "repo": repo, "url": package_url, "summary": summary, "distro": distro_hint})
+            if len(results) >= limit:
+                break
+
+    # If nothing found, as last resort, try more structured table parsing
+    if not results:
+        # look for tables with search results
+        tables = soup.find_all("table")
+        for t in tables:
+            for row in t.find_all("tr"):
+                cols = row.find_all("td")
+                if len(cols) >= 2:
+                    link = cols[0].find("a", href=True)
+                    if link:
+                        name = link.get_text(strip=True)
+                        url = urljoin("https://pkgs.org", link["href"])
+                        repo = cols[1].get_text(" ", strip=True)
+                        results.append({"name": name, "version": "", "repo": repo, "url": url, "summary": "", "distro": None})
+                if len(results) >= limit:
+                    break
+            if len(results) >= limit:
+                break
+
+    return results
+
+
+# Candidate package links on a search page, matched inside libxml2
+_RESULT_LINKS_XPATH = etree.XPath(
+    '//a[@href][contains(@href, "/download/") or contains(@href, "/package/")'
+    ' or substring(@href, string-length(@href) - 4) = ".html"]'
+) if lxml_html is not None else None
+
+if lxml_html is not None:
+    # Descendant text nodes as plain str (no parent back-references), collected in C
+    _TEXT_NODES_XPATH = etree.XPath(".//text()", smart_strings=False)
+    # Table fallback: rows with at least two cells, the first cell's link and the second cell
+    _TABLE_ROWS_XPATH = etree.XPath("//tr[count(.//td) >= 2]")
+    _ROW_LINK_XPATH = etree.XPath("((.//td)[1]//a[@href])[1]")
+    _ROW_REPO_CELL_XPATH = etree.XPath("(.//td)[2]")
+
+
+def _element_text(el, sep: str = "") -> str:
+    """Text of an element like BeautifulSoup's get_text(sep, strip=True)."""
+    return sep.join(t for t in (t.strip() for t in _TEXT_NODES_XPATH(el)) if t)
+
+
+def _next_element(el):
+    """Next sibling element, skipping comments and processing instructions."""
+    sib = el.getnext()
+    while sib is not None and not isinstance(sib.tag, str):
+        sib = sib.getnext()
+    return sib
+
+
+def _parse_search_lxml(content: bytes, limit: int) -> List[Dict[str, Any]]:
+    """Extract search results from a pkgs.org search page with lxml."""
+    try:
+        doc = lxml_html.fromstring(content)
+    except (etree.ParserError, ValueError):
+        return []
+    results: List[Dict[str, Any]] = []
+    seen = set()
+
+    for a in _RESULT_LINKS_XPATH(doc):
+        name_text = _element_text(a)
+        if not name_text:
+            continue
+        package_url = urljoin("https://pkgs.org", a.get("href"))
+        key = (name_text, package_url)
+        if key in seen:
+            continue
+        seen.add(key)
+
+        parent = a.getparent()
+        summary = ""
+        repo = ""
+        if parent is not None:
+            small = parent.find(".//small")
+            if small is not None:
+                summary = _element_text(small, " ")
+            sib = _next_element(parent)
+            if sib is not None:
+                repo = _element_text(sib, " ")
+
+        results.append({"name": name_text, "version": "", "repo": repo, "url": package_url, "summary": summary, "distro": None})
+        if len(results) >= limit:
+            return results
+
+    # If nothing found, as last resort, try more structured table parsing
+    if not results:
+        for row in _TABLE_ROWS_XPATH(doc):
+            links = _ROW_LINK_XPATH(row)
+            if links:
+                link = links[0]
+                results.append({
+                    "name": _element_text(link),
+                    "version": "",
+                    "repo": _element_text(_ROW_REPO_CELL_XPATH(row)[0], " "),
+                    "url": urljoin("https://pkgs.org", link.get("href")),
+                    "summary": "",
+                    "distro": None,
+                })
+                if len(results) >= limit:
+                    break
+
+    return results
+
+
+_DEFAULT_CLIENT: Optional[PkgsOrgClient] = None
+_DEFAULT_CLIENT_LOCK = threading.Lock()
+
+
+def get_default_client() -> PkgsOrgClient:
+    """
+    Return a process-wide client, created on first use, so repeated searches
+    share one cache load and one keep-alive session.
+    """
+    global _DEFAULT_CLIENT
+    if _DEFAULT_CLIENT is None:
+        with _DEFAULT_CLIENT_LOCK:
+            if _DEFAULT_CLIENT is None:
+                _DEFAULT_CLIENT = PkgsOrgClient()
+    return _DEFAULT_CLIENT
+
+
 # Small self-test when invoked directly
 if __name__ == "__main__":
     import argparse
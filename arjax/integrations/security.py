@@ -6,204 +6,339 @@ Security validations for arjax
 import hashlib
 import hmac
 import os
-from typing import Optional, Dict, Any
+import re
+import sys
+from bisect import bisect_right
+from functools import partial
+from dataclasses import asdict, dataclass, field
+from typing import Optional, Dict, Any, Iterable, List, Callable, Sequence, Tuple
 from pathlib import Path
+from types import MappingProxyType
 from arjax.config.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Checksum algorithm for integrity checks that never leave arjax; BLAKE2b outruns
+# SHA-256 on CPUs without SHA extensions. Use sha256 when comparing with upstream hashes.
+INTERNAL_HASH_ALGORITHM = 'blake2b'
+
+# Read size for checksum loops when hashlib.file_digest (Python 3.11+) is unavailable
+HASH_CHUNK_SIZE = 1 << 20
+
+# Checksum algorithms accepted in expected checksums; read-only since every
+# SecurityValidator shares it
+SUPPORTED_HASH_ALGORITHMS = MappingProxyType({
+    'md5': hashlib.md5,
+    'sha1': hashlib.sha1,
+    'sha256': hashlib.sha256,
+    'sha512': hashlib.sha512,
+    'blake2b': hashlib.blake2b,
+    'blake2s': hashlib.blake2s
+})
+
+# Trusted package sources and the warnings that come with each; one dict lookup
+# both checks trust and fetches the warnings
+_SOURCE_WARNINGS = {
+    'pacman': (),
+    'aur': ("AUR packages are user-contributed and may pose security risks",),
+    'flatpak': (),
+    'snap': (),
+    'apt': (),
+    'dnf': (),
+}
+# Package sources considered trusted by validate_package_source
+TRUSTED_SOURCES = frozenset(_SOURCE_WARNINGS)
+
+# Dangerous command patterns to block; matched as literal substrings of the lowercased command
+DANGEROUS_PATTERNS = (
+    'rm -rf /',
+    'rm -rf /*',
+    'dd if=',
+    'mkfs',
+    'fdisk',
+    'format',
+    'wget.*|.*curl.*|.*bash',
+    'chmod.*777',
+    'chown.*root',
+    'sudo.*su',
+    'passwd',
+    'shadow',
+    'sudoers'
+)
+# All patterns fused into one alternation so a command is scanned once; the named
+# group that matched (p<index>) identifies the pattern
+_DANGEROUS_RE = re.compile("|".join(
+    f"(?P<p{i}>{re.escape(pattern)})" for i, pattern in enumerate(DANGEROUS_PATTERNS)
+))
+
+def _dangerous_matches(commands_lower: Sequence[str]) -> List[Optional[re.Match]]:
+    """First dangerous-pattern match in each command, found with one scan over all of them"""
+    # No pattern contains NUL, so a match can never span two commands
+    blob = "\x00".join(commands_lower)
+    starts = []
+    offset = 0
+    for command in commands_lower:
+        starts.append(offset)
+        offset += len(command) + 1
+
+    matches: List[Optional[re.Match]] = [None] * len(commands_lower)
+    for match in _DANGEROUS_RE.finditer(blob):
+        index = bisect_right(starts, match.start()) - 1
+        if matches[index] is None:
+            matches[index] = match
+    return matches
+
+# Validation results are created per package checked, so they use slots where available
+_dataclass_options = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+class _ValidationResult:
+    """Base for validation results"""
+    __slots__ = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict form, as returned by the module-level helpers"""
+        return asdict(self)
+
+@dataclass(**_dataclass_options)
+class SourceValidation(_ValidationResult):
+    """Result of validate_package_source"""
+    valid: bool = False
+    reason: str = ""
+    warnings: List[str] = field(default_factory=list)
+
+@dataclass(**_dataclass_options)
+class CommandValidation(_ValidationResult):
+    """Result of validate_installation_safety"""
+    safe: bool = False
+    warnings: List[str] = field(default_factory=list)
+    blocked: bool = False
+    reason: str = ""
+
+@dataclass(**_dataclass_options)
+class IntegrityValidation(_ValidationResult):
+    """Result of validate_download_integrity"""
+    valid: bool = False
+    checksums_validated: List[Dict[str, Any]] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+
+@dataclass(**_dataclass_options)
+class PreUpdateResult(_ValidationResult):
+    """Result of pre_update_validation"""
+    approved: bool = False
+    source_valid: bool = False
+    command_safe: bool = False
+    warnings: List[str] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+
 class SecurityValidator:
     """Handles security validations for package updates"""
 
-    def __init__(self):
-        self.supported_hash_algorithms = {
-            'md5': hashlib.md5,
-            'sha1': hashlib.sha1,
-            'sha256': hashlib.sha256,
-            'sha512': hashlib.sha512
-        }
+    supported_hash_algorithms = SUPPORTED_HASH_ALGORITHMS
+
+    @staticmethod
+    def _hashes_match(calculated_hash: str, expected_hash: str) -> bool:
+        """Constant-time, case-insensitive comparison of hex digests"""
+        # hexdigest() is already lowercase; bytes also accept non-ASCII input
+        return hmac.compare_digest(calculated_hash.encode(), expected_hash.lower().encode())
+
+    def _digest(self, file_path: Path, hash_factory: Callable) -> str:
+        """Hex digest of a file; the read/update loop runs in C where available"""
+        with open(file_path, 'rb') as f:
+            if hasattr(hashlib, 'file_digest'):
+                return hashlib.file_digest(f, hash_factory).hexdigest()
+            hash_func = hash_factory()
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                hash_func.update(chunk)
+            return hash_func.hexdigest()
+
+    def _digest_multi(self, file_path: Path, algorithms: Iterable[str]) -> Dict[str, str]:
+        """Hex digests of a file for several algorithms from a single read pass"""
+        hash_funcs = {algorithm: self.supported_hash_algorithms[algorithm]() for algorithm in algorithms}
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                for hash_func in hash_funcs.values():
+                    hash_func.update(chunk)
+        return {algorithm: hash_func.hexdigest() for algorithm, hash_func in hash_funcs.items()}
+
+    def validate_checksums(self, file_path: Path, expected_checksums: Dict[str, str]) -> Dict[str, bool]:
+        """Validate a file against several checksums, reading it only once"""
+        supported = [algorithm for algorithm in expected_checksums
+                     if algorithm in self.supported_hash_algorithms]
+        for algorithm in expected_checksums:
+            if algorithm not in self.supported_hash_algorithms:
+                logger.error("Unsupported hash algorithm: %s", algorithm)
+
+        try:
+            if not supported:
+                digests = {}
+            elif len(supported) == 1:
+                digests = {supported[0]: self._digest(file_path, self.supported_hash_algorithms[supported[0]])}
+            else:
+                digests = self._digest_multi(file_path, supported)
+        except FileNotFoundError:
+            logger.error("File does not exist: %s", file_path)
+            return {algorithm: False for algorithm in expected_checksums}
+        except Exception as e:
+            logger.error("Error validating checksum for %s: %s", file_path, e)
+            return {algorithm: False for algorithm in expected_checksums}
+
+        results = {}
+        for algorithm, expected_hash in expected_checksums.items():
+            calculated_hash = digests.get(algorithm)
+            if calculated_hash is None:
+                results[algorithm] = False
+                continue
+            results[algorithm] = self._hashes_match(calculated_hash, expected_hash)
+            if results[algorithm]:
+                logger.info("Checksum validation passed for %s", file_path.name)
+            else:
+                logger.error("Checksum validation failed for %s", file_path.name)
+                logger.debug("Expected: %s", expected_hash)
+                logger.debug("Calculated: %s", calculated_hash)
+        return results
 
     def validate_checksum(self, file_path: Path, expected_hash: str,
                          algorithm: str = 'sha256') -> bool:
         """Validate file checksum against expected hash"""
-        if algorithm not in self.supported_hash_algorithms:
-            logger.error(f"Unsupported hash algorithm: {algorithm}")
-            return False
-
-        if not file_path.exists():
-            logger.error(f"File does not exist: {file_path}")
+        hash_factory = self.supported_hash_algorithms.get(algorithm)
+        if hash_factory is None:
+            logger.error("Unsupported hash algorithm: %s", algorithm)
             return False
 
         try:
-            hash_func = self.supported_hash_algorithms[algorithm]()
-
-            with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_func.update(chunk)
-
-            calculated_hash = hash_func.hexdigest()
-            is_valid = calculated_hash.lower() == expected_hash.lower()
+            calculated_hash = self._digest(file_path, hash_factory)
+            is_valid = self._hashes_match(calculated_hash, expected_hash)
 
             if is_valid:
-                logger.info(f"Checksum validation passed for {file_path.name}")
+                logger.info("Checksum validation passed for %s", file_path.name)
             else:
-                logger.error(f"Checksum validation failed for {file_path.name}")
-                logger.debug(f"Expected: {expected_hash}")
-                logger.debug(f"Calculated: {calculated_hash}")
+                logger.error("Checksum validation failed for %s", file_path.name)
+                logger.debug("Expected: %s", expected_hash)
+                logger.debug("Calculated: %s", calculated_hash)
 
             return is_valid
 
+        except FileNotFoundError:
+            logger.error("File does not exist: %s", file_path)
+            return False
         except Exception as e:
-            logger.error(f"Error validating checksum for {file_path}: {e}")
+            logger.error("Error validating checksum for %s: %s", file_path, e)
             return False
 
     def generate_checksum(self, file_path: Path, algorithm: str = 'sha256') -> Optional[str]:
-        """Generate checksum for a file"""
-        if algorithm not in self.supported_hash_algorithms:
-            logger.error(f"Unsupported hash algorithm: {algorithm}")
-            return None
-
-        if not file_path.exists():
-            logger.error(f"File does not exist: {file_path}")
+        """Generate checksum for a file
+
+        sha256 stays the default for comparing with published hashes; callers that
+        only compare against their own checksums should pass INTERNAL_HASH_ALGORITHM.
+        """
+        hash_factory = self.supported_hash_algorithms.get(algorithm)
+        if hash_factory is None:
+            logger.error("Unsupported hash algorithm: %s", algorithm)
             return None
 
         try:
-            hash_func = self.supported_hash_algorithms[algorithm]()
-
-            with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_func.update(chunk)
-
-            return hash_func.hexdigest()
+            return self._digest(file_path, hash_factory)
 
+        except FileNotFoundError:
+            logger.error("File does not exist: %s", file_path)
+            return None
         except Exception as e:
-            logger.error(f"Error generating checksum for {file_path}: {e}")
+            logger.error("Error generating checksum for %s: %s", file_path, e)
             return None
 
+# SecurityValidator holds no per-instance state, so a single instance is shared
+_VALIDATOR = SecurityValidator()
+
 class PackageSecurityValidator:
     """Validates package security and integrity"""
 
     def __init__(self):
-        self.security_validator = SecurityValidator()
+        self.security_validator = _VALIDATOR
         self.trusted_keys: Dict[str, str] = {}  # Package name -> expected public key
 
-    def validate_package_source(self, package_name: str, source: str) -> Dict[str, Any]:
+    def validate_package_source(self, package_name: str, source: str) -> SourceValidation:
         """Validate that the package source is trusted"""
-        result = {
-            "valid": False,
-            "reason": "",
-            "warnings": []
-        }
+        warnings = _SOURCE_WARNINGS.get(source)
 
         # Basic source validation
-        trusted_sources = ['pacman', 'aur', 'flatpak', 'snap', 'apt', 'dnf']
-
-        if source not in trusted_sources:
-            result["reason"] = f"Unknown package source: {source}"
-            logger.warning(f"Package {package_name} from unknown source: {source}")
-            return result
+        if warnings is None:
+            logger.warning("Package %s from unknown source: %s", package_name, source)
+            return SourceValidation(reason=f"Unknown package source: {source}")
 
-        # Additional validation for AUR (less trusted)
-        if source == 'aur':
-            result["warnings"].append(
-                "AUR packages are user-contributed and may pose security risks"
-            )
-            logger.warning(f"AUR package {package_name} - additional caution advised")
+        # Less trusted sources (the AUR) carry warnings
+        if warnings:
+            logger.warning("%s package %s - additional caution advised", source.upper(), package_name)
 
-        result["valid"] = True
-        logger.info(f"Package source validation passed for {package_name} from {source}")
+        result = SourceValidation(valid=True, warnings=list(warnings))
+        logger.info("Package source validation passed for %s from %s", package_name, source)
         return result
 
     def validate_download_integrity(self, download_path: Path,
-                                  expected_checksums: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+                                  expected_checksums: Optional[Dict[str, str]] = None) -> IntegrityValidation:
         """Validate downloaded package integrity"""
-        result = {
-            "valid": False,
-            "checksums_validated": [],
-            "errors": []
-        }
+        result = IntegrityValidation()
 
         if not download_path.exists():
-            result["errors"].append(f"Download file does not exist: {download_path}")
+            result.errors.append(f"Download file does not exist: {download_path}")
             return result
 
         # If no expected checksums provided, we can only do basic validation
         if not expected_checksums:
             logger.warning("No expected checksums provided - limited validation possible")
-            result["valid"] = True  # Allow but warn
-            result["warnings"] = ["No checksum validation available"]
+            result.valid = True  # Allow but warn
+            result.warnings.append("No checksum validation available")
             return result
 
-        # Validate against provided checksums
+        # Validate against provided checksums; the file is read once for all algorithms
         all_valid = True
-        for algorithm, expected_hash in expected_checksums.items():
-            is_valid = self.security_validator.validate_checksum(
-                download_path, expected_hash, algorithm
-            )
-
-            result["checksums_validated"].append({
+        validity = self.security_validator.validate_checksums(download_path, expected_checksums)
+        for algorithm, is_valid in validity.items():
+            result.checksums_validated.append({
                 "algorithm": algorithm,
                 "valid": is_valid
             })
 
             if not is_valid:
                 all_valid = False
-                result["errors"].append(f"{algorithm} checksum validation failed")
+                result.errors.append(f"{algorithm} checksum validation failed")
 
-        result["valid"] = all_valid
+        result.valid = all_valid
 
         if all_valid:
-            logger.info(f"Download integrity validation passed for {download_path.name}")
+            logger.info("Download integrity validation passed for %s", download_path.name)
         else:
-            logger.error(f"Download integrity validation failed for {download_path.name}")
+            logger.error("Download integrity validation failed for %s", download_path.name)
 
         return result
 
-    def validate_installation_safety(self, package_name: str, install_command: str) -> Dict[str, Any]:
+    def validate_installation_safety(self, package_name: str, install_command: str) -> CommandValidation:
         """Validate that the installation command is safe to execute"""
-        result = {
-            "safe": False,
-            "warnings": [],
-            "blocked": False,
-            "reason": ""
-        }
-
-        # Dangerous command patterns to block
-        dangerous_patterns = [
-            'rm -rf /',
-            'rm -rf /*',
-            'dd if=',
-            'mkfs',
-            'fdisk',
-            'format',
-            'wget.*|.*curl.*|.*bash',
-            'chmod.*777',
-            'chown.*root',
-            'sudo.*su',
-            'passwd',
-            'shadow',
-            'sudoers'
-        ]
-
         command_lower = install_command.lower()
-
-        for pattern in dangerous_patterns:
-            if pattern in command_lower:
-                result["blocked"] = True
-                result["reason"] = f"Command contains dangerous pattern: {pattern}"
-                logger.error(f"Blocked dangerous install command for {package_name}: {pattern}")
-                return result
+        return self._command_validation(package_name, command_lower, _DANGEROUS_RE.search(command_lower))
+
+    def _command_validation(self, package_name: str, command_lower: str,
+                            match: Optional[re.Match]) -> CommandValidation:
+        """Build the safety result for a lowercased command and its dangerous-pattern match"""
+        result = CommandValidation()
+
+        if match:
+            pattern = DANGEROUS_PATTERNS[int(match.lastgroup[1:])]
+            result.blocked = True
+            result.reason = f"Command contains dangerous pattern: {pattern}"
+            logger.error("Blocked dangerous install command for %s: %s", package_name, pattern)
+            return result
 
         # Check for sudo usage (warn but allow)
         if 'sudo' in command_lower:
-            result["warnings"].append("Command uses sudo - ensure you have appropriate permissions")
+            result.warnings.append("Command uses sudo - ensure you have appropriate permissions")
 
         # Check for network downloads in install commands (warn)
         if 'wget' in command_lower or 'curl' in command_lower:
-            result["warnings"].append("Command downloads from network - verify source trustworthiness")
+            result.warnings.append("Command downloads from network - verify source trustworthiness")
 
-        result["safe"] = True
-        logger.info(f"Installation safety validation passed for {package_name}")
+        result.safe = True
+        logger.info("Installation safety validation passed for %s", package_name)
         return result
 
 class UpdateSecurityManager:
@@ -213,42 +348,61 @@ class UpdateSecurityManager:
         self.package_validator = PackageSecurityValidator()
 
     def pre_update_validation(self, package_name: str, source: str,
-                            install_command: str) -> Dict[str, Any]:
+                            install_command: str) -> PreUpdateResult:
         """Perform all security validations before allowing an update"""
-        validation_result = {
-            "approved": False,
-            "source_valid": False,
-            "command_safe": False,
-            "warnings": [],
-            "errors": []
-        }
+        return self._pre_update(
+            package_name, source,
+            lambda: self.package_validator.validate_installation_safety(package_name, install_command)
+        )
+
+    def pre_update_validation_batch(self, items: Iterable[Tuple[str, str, str]]) -> List[PreUpdateResult]:
+        """pre_update_validation for many (package_name, source, install_command) items
+
+        All install commands are scanned for dangerous patterns in a single regex pass.
+        """
+        items = list(items)
+        commands_lower = [install_command.lower() for _, _, install_command in items]
+        matches = _dangerous_matches(commands_lower)
+
+        results = []
+        for (package_name, source, _), command_lower, match in zip(items, commands_lower, matches):
+            results.append(self._pre_update(
+                package_name, source,
+                partial(self.package_validator._command_validation, package_name, command_lower, match)
+            ))
+        return results
+
+    def _pre_update(self, package_name: str, source: str,
+                    check_command: Callable[[], CommandValidation]) -> PreUpdateResult:
+        """Combine the source check with check_command, which only runs for trusted sources"""
+        validation_result = PreUpdateResult()
 
         # Validate package source
         source_validation = self.package_validator.validate_package_source(package_name, source)
-        validation_result["source_valid"] = source_validation["valid"]
-        validation_result["warnings"].extend(source_validation.get("warnings", []))
+        validation_result.source_valid = source_validation.valid
+        validation_result.warnings.extend(source_validation.warnings)
 
-        if not source_validation["valid"]:
-            validation_result["errors"].append(f"Source validation failed: {source_validation['reason']}")
+        if not source_validation.valid:
+            validation_result.errors.append(f"Source validation failed: {source_validation.reason}")
             return validation_result
 
         # Validate installation command safety
-        command_validation = self.package_validator.validate_installation_safety(package_name, install_command)
-        validation_result["command_safe"] = command_validation["safe"]
-        validation_result["warnings"].extend(command_validation.get("warnings", []))
+        command_validation = check_command()
+        validation_result.command_safe = command_validation.safe
+        validation_result.warnings.extend(command_validation.warnings)
 
-        if command_validation["blocked"]:
-            validation_result["errors"].append(f"Command blocked: {command_validation['reason']}")
+        if command_validation.blocked:
+            validation_result.errors.append(f"Command blocked: {command_validation.reason}")
             return validation_result
 
         # All validations passed
-        validation_result["approved"] = True
-        logger.info(f"Pre-update security validation passed for {package_name}")
+        validation_result.approved = True
+        logger.info("Pre-update security validation passed for %s", package_name)
 
         return validation_result
 
     def validate_downloaded_package(self, package_name: str, download_path: Path,
-                                  expected_checksums: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+                                  expected_checksums: Optional[Dict[str, str]] = None) -> IntegrityValidation:
         """Validate a downloaded package before installation"""
         return self.package_validator.validate_download_integrity(download_path, expected_checksums)
 
@@ -257,8 +411,8 @@ security_manager = UpdateSecurityManager()
 
 def validate_update_security(package_name: str, source: str, install_command: str) -> Dict[str, Any]:
     """Validate security for a package update"""
-    return security_manager.pre_update_validation(package_name, source, install_command)
+    return security_manager.pre_update_validation(package_name, source, install_command).to_dict()
 
 def validate_download_integrity(download_path: Path, expected_checksums: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
     """Validate download integrity"""
-    return security_manager.validate_downloaded_package("unknown", download_path, expected_checksums)
\ No newline at end of file
+    return security_manager.validate_downloaded_package("unknown", download_path, expected_checksums).to_dict()
\ No newline at end of file
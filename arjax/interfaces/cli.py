@@ -5,15 +5,17 @@
 import sys
 import os
 import re
+import shlex
 import subprocess
 import webbrowser
 import threading
 import time
 import shutil
-from typing import List, Tuple, Optional
+import functools
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Tuple, Optional
 from pathlib import Path
 from rich.console import Console
-from rich.table import Table
 from rich.panel import Panel
 import logging
 
@@ -43,10 +45,9 @@ from arjax.config.manager import save_user_config
 from arjax.config.manager import UserConfig
 from arjax.package_management.update import check_for_updates, trigger_update_check
 from arjax.package_management.download import install_updates, start_background_update_service, stop_background_update_service
-from arjax.package_management.installed import add_installed_package, get_all_installed_packages, get_packages_with_updates
+from arjax.package_management.installed import add_installed_package, get_all_installed_packages, get_packages_with_updates, format_timestamp
 from arjax.intelligence.suggest import suggest_apps, list_purposes
 from arjax.integrations.cache import get_cache_manager, CacheConfig
-from arjax.integrations.pkgs_org import PkgsOrgClient
 from arjax.package_management.snapshot import (
     create_snapshot, 
     list_snapshots, 
@@ -54,9 +55,6 @@ from arjax.package_management.snapshot import (
     delete_snapshot,
     detect_snapshot_tool
 )
-from arjax.installation.orchestrator import InstallationOrchestrator
-from arjax.installation.recipes import RecipeStore
-from arjax.installation.providers import ProviderManager
 from arjax.intelligence.advisor import apply_user_mode_defaults, get_arch_news, assess_aur_trust
 from arjax.search.ranking import deduplicate_packages, get_top_matches, is_valid_package
 
@@ -65,6 +63,7 @@ logger = get_logger(__name__)
 
 # Constants
 PANEL_PADDING = 4  # Padding for panel borders in terminal width calculations
+MAX_TABLE_WIDTH = 120  # Upper bound for result tables regardless of terminal size
 INSTALL_ROOT = Path.home() / ".local" / "share" / "archpkg-helper"
 VENV_DIR = INSTALL_ROOT / "venv"
 BIN_PATH = Path.home() / ".local" / "bin" / "archpkg"
@@ -77,14 +76,22 @@ STARTUP_BLOCK = (
     "fi\n"
 )
 
-def normalize_query(query: str) -> List[str]:
+def _table_width() -> int:
+    """Width for result tables, read from the console once per table."""
+    return min(getattr(console, 'width', MAX_TABLE_WIDTH), MAX_TABLE_WIDTH)
+
+
+@functools.lru_cache(maxsize=256)
+def normalize_query(query: str) -> Tuple[str, ...]:
     """Generate query variations for better matching.
+
+    Results are memoized, so the returned tuple is shared between callers.
     
     Args:
         query: Original search query
         
     Returns:
-        List of query variations to try
+        Tuple of query variations to try
     """
     variations = [query]
 
@@ -115,7 +122,7 @@ def normalize_query(query: str) -> List[str]:
         variations.append(concatenated)
         logger.debug(f"Added concatenated variation: '{concatenated}'")
     
-    return variations
+    return tuple(variations)
 
 # Create Typer app
 app = typer.Typer(
@@ -141,8 +148,11 @@ except ModuleNotFoundError as e:
     ))
     sys.exit(1)
 
+@functools.lru_cache(maxsize=1)
 def detect_distro() -> str:
     """Detect the current Linux distribution with detailed error handling.
+
+    The result is cached for the lifetime of the process.
     
     Returns:
         str: Detected distribution family ('arch', 'debian', 'fedora', or 'unknown')
@@ -253,7 +263,9 @@ def search_pkgs_org(query: str, detected_distro: str, limit: int = 10) -> List[d
     """
     try:
         logger.debug("Attempting pkgs.org search as supplementary source")
-        client = PkgsOrgClient()
+        # Imported lazily: BeautifulSoup is only needed once a search reaches pkgs.org
+        from arjax.integrations.pkgs_org import get_default_client
+        client = get_default_client()
         
         # Search with distro hint
         results = client.search(query, distro=detected_distro, limit=limit)
@@ -603,6 +615,34 @@ def handle_search_errors(source_name: str, error: Exception) -> None:
     message = error_messages.get(source_name, {}).get(error_type, f"{source_name} search encountered an error.")
     console.print(f"[yellow]{source_name.upper()}: {message}[/yellow]")
 
+def _aur_trust_display(pkg: str) -> str:
+    """Format the AUR trust score of a package for the results table."""
+    try:
+        score = assess_aur_trust(pkg).get('score', 0)
+    except Exception:
+        return "?"
+    if score >= 75:
+        return f"[green]{score}[/green]"
+    if score >= 50:
+        return f"[yellow]{score}[/yellow]"
+    return f"[red]{score}[/red]"
+
+def _resolve_aur_trust(pkg: str, future: "Future[str]") -> None:
+    future.set_result(_aur_trust_display(pkg))
+
+def _prefetch_aur_trust(matches: List[Tuple[str, str, str]]) -> Dict[str, "Future[str]"]:
+    """Start AUR trust lookups for the AUR entries in matches without waiting on them.
+
+    Like the pkgs.org prefetch, the lookups run on daemon threads, so paths that never
+    render the table (errors, early returns) are not held up at exit by pending lookups.
+    """
+    futures: Dict[str, "Future[str]"] = {}
+    for pkg, _, source in matches:
+        if source == 'aur':
+            futures[pkg] = Future()
+            threading.Thread(target=_resolve_aur_trust, args=(pkg, futures[pkg]), daemon=True).start()
+    return futures
+
 def batch_install_packages(package_names: List[str]) -> None:
     """Install multiple packages in batch mode with progress tracking."""
     logger.info(f"Starting batch installation for packages: {package_names}")
@@ -711,14 +751,30 @@ def batch_install_packages(package_names: List[str]) -> None:
         console.print(f"  Command: [dim]{command}[/dim]")
         
         logger.info(f"Installing package {i}/{len(validated_packages)}: {pkg} from {source}")
-        exit_code = os.system(command)
+        # generate_command() rejects shell metacharacters in package names, so no shell is needed
+        try:
+            argv = shlex.split(command)
+        except ValueError as e:
+            # e.g. an unbalanced quote in the package name; only this package fails
+            logger.error(f"Cannot parse install command for {pkg}: {e}")
+            console.print(f"  [red]✗[/red] Failed to install {pkg} (invalid command: {e})")
+            failed_installs.append((pkg, f"invalid command: {e}"))
+            continue
+        try:
+            exit_code = subprocess.run(argv, check=False).returncode
+        except OSError as e:
+            # e.g. sudo or the package manager is not installed; only this package fails
+            logger.error(f"Cannot run install command for {pkg}: {e}")
+            console.print(f"  [red]✗[/red] Failed to install {pkg} (cannot run command: {e})")
+            failed_installs.append((pkg, f"cannot run command: {e}"))
+            continue
         
         if exit_code == 0:
             console.print(f"  [green]✓[/green] Successfully installed {pkg}")
             successful_installs.append(pkg)
         else:
             console.print(f"  [red]✗[/red] Failed to install {pkg} (exit code: {exit_code})")
-            failed_installs.append((pkg, exit_code))
+            failed_installs.append((pkg, f"exit code: {exit_code}"))
     
     # Show summary
     console.print(f"\n[bold]Batch Installation Summary:[/bold]")
@@ -730,8 +786,8 @@ def batch_install_packages(package_names: List[str]) -> None:
     
     if failed_installs:
         console.print(f"[red]Failed: {len(failed_installs)}[/red]")
-        for pkg, code in failed_installs:
-            console.print(f"  - {pkg} (exit code: {code})")
+        for pkg, reason in failed_installs:
+            console.print(f"  - {pkg} ({reason})")
     
     if failed_installs:
         console.print(f"\n[yellow]Note: {len(failed_installs)} package(s) failed to install. Check the errors above.[/yellow]")
@@ -840,6 +896,13 @@ Search once. Install from the best available source.
 """
     console.print(help_text)
 
+def _command_names() -> set:
+    """Names of the registered subcommands, as Typer exposes them on the command line."""
+    return {
+        info.name or info.callback.__name__.lower().replace('_', '-')
+        for info in app.registered_commands
+    }
+
 def main() -> None:
     """
     Main entrypoint for CLI search + install flow.
@@ -851,11 +914,8 @@ def main() -> None:
         show_custom_help()
         return
     
-    # Check if first argument is a known subcommand
-    known_commands = ['search', 'install', 'suggest', 'upgrade', 'web', 'update', 'config', 'list-installed', 'service', 'cleanup', 'snapshot', 'setup', 'gui', 'uninstall']
-    
-    # If no arguments or first arg is not a known command, inject 'search' for backward compatibility
-    if len(sys.argv) > 1 and sys.argv[1] not in known_commands and not sys.argv[1].startswith('-'):
+    # If the first arg is not a known command, inject 'search' for backward compatibility
+    if len(sys.argv) > 1 and not sys.argv[1].startswith('-') and sys.argv[1] not in _command_names():
         # First argument is not a known command, treat it as a search query
         logger.info(f"No known subcommand detected, injecting 'search' command")
         sys.argv.insert(1, 'search')
@@ -949,6 +1009,10 @@ def install(
         
     package_name = " ".join(package)
 
+    from arjax.installation.orchestrator import InstallationOrchestrator
+    from arjax.installation.recipes import RecipeStore
+    from arjax.installation.providers import ProviderManager
+
     recipe_store = RecipeStore()
     provider_manager = ProviderManager()
     
@@ -1008,6 +1072,8 @@ def search(
     
     Supports multi-word queries: arjax search visual studio code
     """
+    from rich.table import Table
+
     if debug:
         PackageHelperLogger.set_debug_mode(True)
 
@@ -1047,8 +1113,10 @@ def search(
     # Use the shortest variation for external sources (pkgs.org) to improve hit rate
     pkgs_org_query = min(query_variations, key=len)
 
-    results = []
-    search_errors = []
+    # Unique (name, source) -> package tuple; repeat hits across variations are dropped on arrival
+    results: Dict[Tuple[str, str], Tuple[str, str, str]] = {}
+    # Insertion-ordered set of sources that failed for the original query
+    search_errors: Dict[str, None] = {}
     use_cache = not no_cache
     
     # Start async pkgs.org search in background
@@ -1068,107 +1136,102 @@ def search(
     pkgs_org_thread = threading.Thread(target=async_pkgs_org_search, daemon=True)
     pkgs_org_thread.start()
 
-    # Search with all query variations
+    # Backends to query for every variation, as (label, search function) pairs
+    cache = cache_manager if use_cache else None
+    backends: List[Tuple[str, Callable[[str], List[Tuple[str, str, str]]]]] = []
+    if detected_family == "arch":
+        backends.append(("AUR", lambda q: search_aur(q, cache, sort_by=aur_sortby)))
+        backends.append(("Pacman", lambda q: search_pacman(q, cache)))
+    elif detected_family == "debian":
+        backends.append(("APT", lambda q: search_apt(q, cache)))
+    elif detected_family == "fedora":
+        backends.append(("DNF", lambda q: search_dnf(q, cache)))
+        # Fallback to RPM if DNF fails
+        backends.append(("RPM", lambda q: search_rpm(q, limit=limit)))
+    elif detected_family == "suse":
+        logger.info("Searching openSUSE-based repositories (Zypper)")
+        backends.append(("Zypper", lambda q: search_zypper(q, cache)))
+
+    # Universal package managers
+    backends.append(("Flatpak", lambda q: search_flatpak(q, cache)))
+    backends.append(("Snap", lambda q: search_snap(q, cache)))
+
+    # Backends match case-insensitively, so variations that only differ in case
+    # or surrounding whitespace would repeat the same subprocess/HTTP call
+    unique_variations: Dict[str, str] = {}
     for query_variant in query_variations:
-        logger.debug(f"Searching with query variant: '{query_variant}'")
-        
-        # Search based on detected distribution
-        if detected_family == "arch":
-            try:
-                logger.debug("Starting AUR search")
-                aur_results = search_aur(
-                    query_variant,
-                    cache_manager if use_cache else None,
-                    sort_by=aur_sortby,
-                )
-                results.extend(aur_results)
-            except Exception as e:
-                logger.debug(f"AUR search failed: {e}")
-                if query_variant == query_str:  # Only log errors for the original query
-                    search_errors.append("AUR")
-
-            try:
-                logger.debug("Starting pacman search")
-                pacman_results = search_pacman(query_variant, cache_manager if use_cache else None) 
-                results.extend(pacman_results)
-            except Exception as e:
-                logger.debug(f"Pacman search failed: {e}")
-                if query_variant == query_str:
-                    search_errors.append("Pacman")
-
-        elif detected_family == "debian":
-            try:
-                logger.debug("Starting APT search")
-                apt_results = search_apt(query_variant, cache_manager if use_cache else None)
-                results.extend(apt_results)
-            except Exception as e:
-                logger.debug(f"APT search failed: {e}")
-                if query_variant == query_str:
-                    search_errors.append("APT")
-
-        elif detected_family == "fedora":
-            try:
-                logger.debug("Starting DNF search")
-                dnf_results = search_dnf(query_variant, cache_manager if use_cache else None)
-                results.extend(dnf_results)
-            except Exception as e:
-                logger.debug(f"DNF search failed: {e}")
-                if query_variant == query_str:
-                    search_errors.append("DNF")
-            
-            # Fallback to RPM if DNF fails
-            try:
-                logger.debug("Starting RPM search as fallback")
-                rpm_results = search_rpm(query_variant, limit=limit)
-                results.extend(rpm_results)
-            except Exception as e:
-                logger.debug(f"RPM search failed: {e}")
-                
-        elif detected_family == "suse":
-            logger.info("Searching openSUSE-based repositories (Zypper)")
-            
-            try:
-                logger.debug("Starting Zypper search")
-                zypper_results = search_zypper(query_variant, cache_manager if use_cache else None)
-                results.extend(zypper_results)
-                logger.info(f"Zypper search returned {len(zypper_results)} results")
-            except Exception as e:
-                if query_variant == query_str:
-                    handle_search_errors("zypper", e)
-                    search_errors.append("Zypper")
-
-        # Universal package managers
-        try:
-            logger.debug("Starting Flatpak search")
-            flatpak_results = search_flatpak(query_variant, cache_manager if use_cache else None)
-            results.extend(flatpak_results)
-        except Exception as e:
-            logger.debug(f"Flatpak search failed: {e}")
-            if query_variant == query_str:
-                search_errors.append("Flatpak")
-
-        try:
-            logger.debug("Starting Snap search")
-            snap_results = search_snap(query_variant, cache_manager if use_cache else None)
-            results.extend(snap_results)
-        except Exception as e:
-            logger.debug(f"Snap search failed: {e}")
-            if query_variant == query_str:
-                search_errors.append("Snap")
-    
-    # Remove duplicate error messages
-    search_errors = list(set(search_errors))
+        unique_variations.setdefault(query_variant.strip().lower(), query_variant)
+    if len(unique_variations) < len(query_variations):
+        logger.debug(f"Collapsed {len(query_variations)} query variations to {len(unique_variations)}")
+
+    # Backends are I/O bound (subprocesses and HTTP), so each round runs its
+    # (variation, backend) pairs concurrently. The original query goes first;
+    # the other variations are only searched when it found no package whose
+    # name is an exact match, unless --aur asks for the full picture.
+    variants = list(unique_variations.values())
+    futures: Dict["Future[List[Tuple[str, str, str]]]", Tuple[str, str]] = {}
+    with ThreadPoolExecutor(max_workers=len(backends) * len(variants)) as executor:
+        for round_variants in (variants[:1], variants[1:]):
+            if not round_variants:
+                continue
+            round_futures = {
+                executor.submit(search_fn, query_variant): (label, query_variant)
+                for query_variant in round_variants
+                for label, search_fn in backends
+            }
+            futures.update(round_futures)
+
+            for future in as_completed(round_futures):
+                label, query_variant = round_futures[future]
+                error = future.exception()
+                if error is None:
+                    logger.debug(f"{label} search for '{query_variant}' returned {len(future.result())} results")
+                    continue
+
+                logger.debug(f"{label} search failed for '{query_variant}': {error}")
+                # Only report errors for the original query; RPM is a silent fallback
+                if query_variant != query_str or label == "RPM":
+                    continue
+                if label == "Zypper":
+                    handle_search_errors("zypper", error)
+                search_errors.setdefault(label, None)
+
+            if not aur and any(
+                pkg.lower() in unique_variations
+                for future in round_futures if future.exception() is None
+                for pkg, _, _ in future.result()
+            ):
+                logger.debug("Exact name match found, skipping remaining query variations")
+                break
+
+    # Collect in submission order so ranking ties stay stable between runs
+    for future in futures:
+        if future.exception() is None:
+            for pkg, desc, source in future.result():
+                results.setdefault((pkg, source), (pkg, desc, source))
+
+    search_errors = list(search_errors)
 
     # Show available vs unavailable sources only in debug mode
     if search_errors:
         logger.debug(f"Note: Some sources unavailable: {', '.join(search_errors)}")
     
+    # Rank now so AUR trust lookups overlap the pkgs.org wait and recipe loading below
+    top_matches: List[Tuple[str, str, str]] = []
+    trust_futures: Dict[str, "Future[str]"] = {}
+    if results:
+        deduplicated_results = deduplicate_packages(list(results.values()), prefer_aur=aur)
+        logger.info(f"After deduplication: {len(deduplicated_results)} unique packages")
+        top_matches = get_top_matches(query_str, deduplicated_results, limit=limit)
+        trust_futures = _prefetch_aur_trust(top_matches)
+
     # Wait for background pkgs.org search to complete (max 5 seconds)
     if pkgs_org_thread and pkgs_org_thread.is_alive():
         logger.debug("Waiting for background pkgs.org search...")
         pkgs_org_thread.join(timeout=5.0)
 
     # Search recipes
+    from arjax.installation.recipes import RecipeStore
     recipe_store = RecipeStore()
     recipe_matches = []
     lower_query = query_str.lower()
@@ -1247,9 +1310,6 @@ def search(
         github_fallback(query_str, search_errors)
         return
 
-    deduplicated_results = deduplicate_packages(results, prefer_aur=aur)
-    logger.info(f"After deduplication: {len(deduplicated_results)} unique packages")
-    
     # Show pkgs.org supplementary results if available (even when local results exist)
     if pkgs_org_results and len(pkgs_org_results) > 0:
         console.print("\n[dim]📦 Additional packages available on other distributions:[/dim]")
@@ -1264,7 +1324,6 @@ def search(
         else:
             console.print()
 
-    top_matches = get_top_matches(query_str, deduplicated_results, limit=limit)
     if not top_matches:
         if not recipe_matches:
             console.print("[yellow]No close matches found.[/yellow]")
@@ -1274,31 +1333,20 @@ def search(
             return
 
     # Display results with terminal width constraints
-    console_width = console.width if hasattr(console, 'width') else 120
-    table = Table(title="Repository Matches", width=min(console_width, 120), expand=False)
+    table = Table(title="Repository Matches", width=_table_width(), expand=False)
     table.add_column("Index", style="cyan", no_wrap=True)
     table.add_column("Package Name", style="green")
-    table.add_column("Source", style="blue")
+    table.add_column("Source", style="blue", no_wrap=True)
     table.add_column("Trust", style="yellow", no_wrap=True)
     table.add_column("Description", style="magenta")
 
-    for idx, (pkg, desc, source) in enumerate(top_matches, 1):
-        # Calculate trust score for AUR packages
-        trust_display = "-"
-        if source == 'aur':
-            try:
-                trust_result = assess_aur_trust(pkg)
-                score = trust_result.get('score', 0)
-                if score >= 75:
-                    trust_display = f"[green]{score}[/green]"
-                elif score >= 50:
-                    trust_display = f"[yellow]{score}[/yellow]"
-                else:
-                    trust_display = f"[red]{score}[/red]"
-            except Exception:
-                trust_display = "?"
-        
-        table.add_row(str(idx), pkg, source, trust_display, desc or "No description")
+    trust_displays = {pkg: future.result() for pkg, future in trust_futures.items()}
+    rows = [
+        (str(idx), pkg, source, trust_displays.get(pkg, "-") if source == 'aur' else "-", desc or "No description")
+        for idx, (pkg, desc, source) in enumerate(top_matches, 1)
+    ]
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
     console.print("\n[cyan]Search is now read-only. Install with: arjax install <package>[/cyan]")
@@ -1697,12 +1745,18 @@ def config(
             # Convert value to appropriate type
             from typing import Any
             converted_value: Any = value
-            if value.lower() in ('true', 'false'):
-                converted_value = value.lower() == 'true'
-            elif value.isdigit():
-                converted_value = int(value)
-            elif value.replace('.', '').isdigit():
-                converted_value = float(value)
+            lowered = value.lower()
+            if lowered in ('true', 'false'):
+                converted_value = lowered == 'true'
+            else:
+                # Handles negatives and scientific notation as well
+                try:
+                    converted_value = int(value)
+                except ValueError:
+                    try:
+                        converted_value = float(value)
+                    except ValueError:
+                        pass
 
             set_config_option(key, converted_value)
             console.print(f"[green]Updated {key} = {converted_value}[/green]")
@@ -1717,6 +1771,8 @@ def list_installed(
     """
     List all installed packages being tracked for updates.
     """
+    from rich.table import Table
+
     if debug:
         PackageHelperLogger.set_debug_mode(True)
 
@@ -1728,8 +1784,7 @@ def list_installed(
         return
 
     # Apply terminal width constraints
-    console_width = console.width if hasattr(console, 'width') else 120
-    table = Table(title="Tracked Installed Packages", width=min(console_width, 120), expand=False)
+    table = Table(title="Tracked Installed Packages", width=_table_width(), expand=False)
     table.add_column("Package Name", style="green")
     table.add_column("Source", style="blue")
     table.add_column("Installed Version", style="cyan")
@@ -1738,7 +1793,7 @@ def list_installed(
 
     for pkg in packages:
         update_status = "[green]No[/green]" if not pkg.update_available else "[red]Yes[/red]"
-        last_updated = pkg.last_update_check or pkg.install_date or "Never"
+        last_updated = format_timestamp(pkg.last_update_check or pkg.install_date) or "Never"
         table.add_row(
             pkg.name,
             pkg.source,
@@ -2107,6 +2162,7 @@ def snapshot(
                 console.print("[yellow]No snapshots found.[/yellow]")
                 return
             
+            from rich.table import Table
             table = Table(title="Available Snapshots")
             table.add_column("ID", style="cyan")
             table.add_column("Date", style="green")
@@ -4,185 +4,322 @@ Background downloading and installation for arjax
 """
 
 import os
+import sys
+import errno
 import hashlib
+import shutil
 import tempfile
 import threading
-import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Dict, List, Optional, Any, Callable
 from pathlib import Path
 from datetime import datetime, timezone
-from urllib.request import urlopen, Request
-from urllib.error import URLError, HTTPError
+from urllib.parse import urlparse
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from arjax.config.logging import get_logger
 from arjax.package_management.installed import (
     get_all_installed_packages,
     update_package_info,
     get_packages_with_updates
 )
-from arjax.config.manager import get_user_config
+from arjax.config.manager import UserConfig, config_manager, get_user_config
 
 logger = get_logger(__name__)
 
+# Bounds for the streaming chunk size, scaled to the download size
+MIN_CHUNK_SIZE = 8192
+MAX_CHUNK_SIZE = 1024 * 1024
+
+# Minimum number of bytes between progress percentage updates
+PROGRESS_STEP = 256 * 1024
+
+# (connect, read) timeouts in seconds; the read timeout is configurable
+DEFAULT_TIMEOUT = (5, 60)
+
+@dataclass(**({"slots": True} if sys.version_info >= (3, 10) else {}))
+class DownloadJob:
+    """State of a single background download"""
+    download_id: str
+    package_name: str
+    url: str
+    temp_file: Path
+    destination: Optional[Path] = None
+    callback: Optional[Callable] = None
+    status: str = "starting"
+    progress: float = 0
+    total_size: int = 0
+    downloaded_size: int = 0
+    sha256: Optional[str] = None
+    error: Optional[str] = None
+    future: Optional[Future] = None
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of data to fd, retrying after short writes"""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+def _finalize(temp_path: Path, final_path: Path) -> None:
+    """Move a finished download into place"""
+    final_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        # Same filesystem: a rename, no data copied
+        os.replace(temp_path, final_path)
+        return
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+
+    # Across filesystems copyfile uses sendfile(2) on Linux, keeping the copy in-kernel
+    shutil.copyfile(temp_path, final_path)
+    os.unlink(temp_path)
+
 class DownloadManager:
     """Manages background downloads with resumability"""
 
     def __init__(self):
-        self.active_downloads: Dict[str, Dict[str, Any]] = {}
+        self.active_downloads: Dict[str, DownloadJob] = {}
+        # Guards active_downloads and the lazily created executor
+        self._lock = threading.Lock()
         self.download_dir = Path.home() / ".arjax" / "downloads"
         self.download_dir.mkdir(parents=True, exist_ok=True)
 
-    def start_download(self, package_name: str, download_url: str,
-                      callback: Optional[Callable] = None) -> str:
-        """Start a background download"""
-        if package_name in self.active_downloads:
-            logger.warning(f"Download already in progress for {package_name}")
-            return self.active_downloads[package_name]["download_id"]
+        # Shared session so keep-alive connections are reused across downloads
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.5)
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        # Created on first download so importing this module stays cheap
+        self._executor: Optional[ThreadPoolExecutor] = None
 
+        # Whether each host honours byte-range requests, probed once per host
+        self._range_support: Dict[str, bool] = {}
+
+    def start_download(self, package_name: str, download_url: str,
+                      callback: Optional[Callable] = None,
+                      destination: Optional[Path] = None) -> str:
+        """Start a background download, optionally moved to destination when done"""
+        with self._lock:
+            if package_name in self.active_downloads:
+                logger.warning(f"Download already in progress for {package_name}")
+                return self.active_downloads[package_name].download_id
+            return self._submit_download(package_name, download_url, callback, destination)
+
+    def _submit_download(self, package_name: str, download_url: str,
+                         callback: Optional[Callable], destination: Optional[Path]) -> str:
+        """Register and submit a download; the caller must hold self._lock"""
         download_id = f"{package_name}_{int(datetime.now(timezone.utc).timestamp())}"
         temp_file = self.download_dir / f"{download_id}.tmp"
 
-        download_info = {
-            "download_id": download_id,
-            "package_name": package_name,
-            "url": download_url,
-            "temp_file": temp_file,
-            "status": "starting",
-            "progress": 0,
-            "total_size": 0,
-            "downloaded_size": 0,
-            "callback": callback,
-            "thread": None
-        }
+        job = DownloadJob(
+            download_id=download_id,
+            package_name=package_name,
+            url=download_url,
+            temp_file=temp_file,
+            destination=destination,
+            callback=callback
+        )
 
-        self.active_downloads[package_name] = download_info
+        self.active_downloads[package_name] = job
 
-        # Start download in background thread
-        thread = threading.Thread(
-            target=self._download_worker,
-            args=(download_info,),
-            daemon=True,
-            name=f"download-{package_name}"
-        )
-        download_info["thread"] = thread
-        thread.start()
+        # Run the download on the bounded worker pool
+        job.future = self._get_executor().submit(self._download_worker, job)
 
         logger.info(f"Started download for {package_name}: {download_id}")
         return download_id
 
-    def _download_worker(self, download_info: Dict[str, Any]) -> None:
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the download worker pool, sized from the user configuration"""
+        if self._executor is None:
+            max_workers = get_user_config().max_concurrent_downloads or min(8, os.cpu_count() or 1)
+            self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="arjax-dl")
+        return self._executor
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the download worker pool"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def _supports_ranges(self, url: str) -> bool:
+        """Check with a HEAD request whether the server accepts byte ranges"""
+        host = urlparse(url).netloc
+        if host not in self._range_support:
+            try:
+                response = self._session.head(url, allow_redirects=True, timeout=DEFAULT_TIMEOUT)
+            except requests.RequestException as e:
+                logger.debug(f"Range support probe failed for {host}: {e}")
+                return False
+            accept_ranges = response.headers.get("accept-ranges", "").lower()
+            self._range_support[host] = accept_ranges == "bytes"
+        return self._range_support[host]
+
+    def _download_worker(self, job: DownloadJob) -> None:
         """Background download worker"""
-        package_name = download_info["package_name"]
-        url = download_info["url"]
-        temp_file = download_info["temp_file"]
+        package_name = job.package_name
+        url = job.url
+        temp_file = job.temp_file
 
         try:
-            download_info["status"] = "downloading"
+            job.status = "downloading"
 
             # Create request with resume support
             headers = {}
-            if temp_file.exists():
+            try:
+                downloaded_size = os.stat(temp_file).st_size
+            except FileNotFoundError:
+                downloaded_size = 0
+            if downloaded_size > 0 and not self._supports_ranges(url):
+                logger.info(f"Server doesn't advertise range support for {package_name}, restarting")
+                downloaded_size = 0
+            if downloaded_size > 0:
                 # Resume download
-                downloaded_size = temp_file.stat().st_size
                 headers["Range"] = f"bytes={downloaded_size}-"
-                download_info["downloaded_size"] = downloaded_size
+                job.downloaded_size = downloaded_size
                 logger.info(f"Resuming download for {package_name} from {downloaded_size} bytes")
 
-            req = Request(url, headers=headers)
+            timeout = (DEFAULT_TIMEOUT[0], get_user_config().download_timeout_seconds or DEFAULT_TIMEOUT[1])
 
-            with urlopen(req) as response:
+            with self._session.get(url, headers=headers, stream=True, timeout=timeout) as response:
+                response.raise_for_status()
                 total_size = int(response.headers.get("content-length", 0))
-                download_info["total_size"] = total_size
-
-                if total_size > 0 and download_info["downloaded_size"] > 0:
+                if response.status_code == 206 and total_size > 0:
+                    # Content-Length only covers the remaining range
+                    total_size += job.downloaded_size
+                job.total_size = total_size
+                # Aim for roughly a thousand reads per file instead of one per 8 KiB
+                buffer_size = max(MIN_CHUNK_SIZE, min(MAX_CHUNK_SIZE, total_size // 1000))
+
+                if total_size > 0 and job.downloaded_size > 0:
                     # Verify we're resuming correctly
-                    if response.code != 206:  # 206 Partial Content
+                    if response.status_code != 206:  # 206 Partial Content
                         logger.warning(f"Server doesn't support resume for {package_name}, restarting")
-                        download_info["downloaded_size"] = 0
-                        temp_file.unlink(missing_ok=True)
-
-                mode = "ab" if download_info["downloaded_size"] > 0 else "wb"
-
-                with open(temp_file, mode) as f:
-                    downloaded = download_info["downloaded_size"]
-
+                        job.downloaded_size = 0
+                        try:
+                            os.unlink(temp_file)
+                        except FileNotFoundError:
+                            pass
+
+                # Write straight to the fd; chunks are already large, so a
+                # buffered file object would only add another copy
+                flags = os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0)
+                flags |= os.O_APPEND if job.downloaded_size > 0 else os.O_TRUNC
+                fd = os.open(temp_file, flags, 0o666)
+                try:
+                    downloaded = job.downloaded_size
+                    # Hash while streaming so the file never has to be re-read for verification
+                    digest = hashlib.sha256()
+                    if downloaded > 0:
+                        with open(temp_file, "rb") as existing:
+                            for block in iter(lambda: existing.read(MAX_CHUNK_SIZE), b""):
+                                digest.update(block)
+
+                    # Refresh the percentage ~200 times per file at most
+                    progress_step = max(total_size // 200, PROGRESS_STEP)
+                    next_progress_at = 0
+
+                    # Read from the urllib3 response directly rather than through
+                    # iter_content's generator chain; decode_content keeps gzip handling
                     while True:
-                        chunk = response.read(8192)
+                        chunk = response.raw.read(buffer_size, decode_content=True)
                         if not chunk:
                             break
 
-                        f.write(chunk)
+                        _write_all(fd, chunk)
+                        digest.update(chunk)
                         downloaded += len(chunk)
-                        download_info["downloaded_size"] = downloaded
+                        job.downloaded_size = downloaded
+
+                        if total_size > 0 and downloaded >= next_progress_at:
+                            job.progress = (downloaded / total_size) * 100
+                            next_progress_at = downloaded + progress_step
+
+                    if total_size > 0:
+                        job.progress = (downloaded / total_size) * 100
+                finally:
+                    os.close(fd)
 
-                        if total_size > 0:
-                            progress = (downloaded / total_size) * 100
-                            download_info["progress"] = progress
+                job.sha256 = digest.hexdigest()
 
-            download_info["status"] = "completed"
+            if job.destination is not None:
+                _finalize(temp_file, job.destination)
+
+            job.status = "completed"
             logger.info(f"Download completed for {package_name}")
 
             # Notify callback if provided
-            if download_info["callback"]:
+            if job.callback:
                 try:
-                    download_info["callback"](download_info)
+                    job.callback(job)
                 except Exception as e:
                     logger.error(f"Download callback error for {package_name}: {e}")
 
-        except HTTPError as e:
-            download_info["status"] = "failed"
-            download_info["error"] = f"HTTP {e.code}: {e.reason}"
+        except requests.HTTPError as e:
+            job.status = "failed"
+            job.error = f"HTTP {e.response.status_code}: {e.response.reason}"
             logger.error(f"Download failed for {package_name}: {e}")
-        except URLError as e:
-            download_info["status"] = "failed"
-            download_info["error"] = str(e.reason)
+        except requests.RequestException as e:
+            job.status = "failed"
+            job.error = str(e)
             logger.error(f"Download failed for {package_name}: {e}")
         except Exception as e:
-            download_info["status"] = "failed"
-            download_info["error"] = str(e)
+            job.status = "failed"
+            job.error = str(e)
             logger.error(f"Download failed for {package_name}: {e}")
 
-    def get_download_status(self, package_name: str) -> Optional[Dict[str, Any]]:
+    def get_download_status(self, package_name: str) -> Optional[DownloadJob]:
         """Get status of a download"""
         return self.active_downloads.get(package_name)
 
     def cancel_download(self, package_name: str) -> bool:
         """Cancel a download"""
-        if package_name not in self.active_downloads:
+        with self._lock:
+            job = self.active_downloads.pop(package_name, None)
+        if job is None:
             return False
 
-        download_info = self.active_downloads[package_name]
-        download_info["status"] = "cancelled"
+        job.status = "cancelled"
 
         # Clean up temp file
-        temp_file = download_info["temp_file"]
+        temp_file = job.temp_file
         if temp_file.exists():
             temp_file.unlink()
 
-        del self.active_downloads[package_name]
         logger.info(f"Download cancelled for {package_name}")
         return True
 
-    def get_completed_downloads(self) -> List[Dict[str, Any]]:
+    def get_completed_downloads(self) -> List[DownloadJob]:
         """Get list of completed downloads"""
-        return [
-            info for info in self.active_downloads.values()
-            if info["status"] == "completed"
-        ]
+        with self._lock:
+            downloads = list(self.active_downloads.values())
+        return [job for job in downloads if job.status == "completed"]
 
     def cleanup_old_downloads(self, days_old: int = 7) -> None:
         """Clean up old temporary download files"""
         cutoff_time = datetime.now(timezone.utc).timestamp() - (days_old * 24 * 3600)
 
-        for temp_file in self.download_dir.glob("*.tmp"):
-            if temp_file.stat().st_mtime < cutoff_time:
-                temp_file.unlink()
-                logger.debug(f"Cleaned up old download file: {temp_file}")
+        # scandir yields name and type without a stat per entry; only .tmp files are stat'ed
+        with os.scandir(self.download_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".tmp") and entry.stat().st_mtime < cutoff_time:
+                    os.unlink(entry.path)
+                    logger.debug(f"Cleaned up old download file: {entry.path}")
 
 class UpdateInstaller:
     """Handles installation of downloaded updates"""
 
-    def __init__(self):
-        self.download_manager = DownloadManager()
+    def __init__(self, download_manager: Optional[DownloadManager] = None):
+        self.download_manager = download_manager or DownloadManager()
 
     def install_updates(self, package_names: Optional[List[str]] = None) -> Dict[str, Any]:
         """Install updates for specified packages or all available updates"""
@@ -200,9 +337,17 @@ class UpdateInstaller:
         failed_count = 0
         results = []
 
-        for package_name in package_names:
+        # Installs are mostly I/O bound, so run them concurrently on a bounded pool
+        with ThreadPoolExecutor(max_workers=min(8, len(package_names))) as executor:
+            futures = {
+                executor.submit(self._install_single_update, package_name): package_name
+                for package_name in package_names
+            }
+
+        # Report in request order once every install has finished
+        for future, package_name in futures.items():
             try:
-                result = self._install_single_update(package_name)
+                result = future.result()
                 results.append(result)
 
                 if result["status"] == "success":
@@ -263,23 +408,46 @@ class UpdateInstaller:
 class BackgroundUpdateService:
     """Complete background update service"""
 
-    def __init__(self):
-        self.download_manager = DownloadManager()
-        self.update_installer = UpdateInstaller()
+    def __init__(self, download_manager: Optional[DownloadManager] = None,
+                 update_installer: Optional[UpdateInstaller] = None):
+        self.download_manager = download_manager or DownloadManager()
+        self.update_installer = update_installer or UpdateInstaller(self.download_manager)
         self.is_running = False
         self.background_thread = None
+        self._stop_event = threading.Event()
+        self._config: Optional[UserConfig] = None
+        self._config_mtime: Optional[int] = None
+
+    def _current_config(self) -> UserConfig:
+        """Get the user config, re-reading it only when the file changed on disk"""
+        try:
+            mtime = os.stat(config_manager.config_file).st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+
+        if self._config is None or mtime != self._config_mtime:
+            # The file may have been edited by another arjax process
+            config_manager.invalidate()
+            self._config = get_user_config()
+            self._config_mtime = mtime
+        return self._config
+
+    def invalidate_config(self) -> None:
+        """Force the next config access to re-read the file"""
+        self._config = None
 
     def start_service(self) -> None:
         """Start the background update service"""
         if self.is_running:
             return
 
-        config = get_user_config()
+        config = self._current_config()
         if not config.auto_update_enabled:
             logger.info("Auto-update not enabled")
             return
 
         self.is_running = True
+        self._stop_event.clear()
 
         self.background_thread = threading.Thread(
             target=self._background_worker,
@@ -293,17 +461,19 @@ class BackgroundUpdateService:
     def stop_service(self) -> None:
         """Stop the background update service"""
         self.is_running = False
+        self._stop_event.set()
         if self.background_thread:
             self.background_thread.join(timeout=5)
+        self.download_manager.shutdown(wait=False)
         logger.info("Background update service stopped")
 
     def _background_worker(self) -> None:
         """Background worker for automatic updates"""
         logger.info("Background update worker started")
 
-        while self.is_running:
+        while not self._stop_event.is_set():
             try:
-                config = get_user_config()
+                config = self._current_config()
 
                 if config.auto_install_updates:
                     # Automatically install available updates
@@ -316,27 +486,30 @@ class BackgroundUpdateService:
                 # Clean up old downloads periodically
                 self.download_manager.cleanup_old_downloads()
 
-                # Sleep for check interval
+                # Sleep for check interval; stop_service() wakes us immediately
                 sleep_time = config.update_check_interval_hours * 3600
-                time.sleep(min(sleep_time, 3600))  # Sleep in 1-hour chunks
+                if self._stop_event.wait(sleep_time):
+                    break
 
             except Exception as e:
                 logger.error(f"Background update worker error: {e}")
-                time.sleep(3600)  # Wait 1 hour before retrying
+                if self._stop_event.wait(3600):  # Wait 1 hour before retrying
+                    break
 
         logger.info("Background update worker stopped")
 
-# Global instances
+# Global instances, sharing one DownloadManager (and so one HTTP pool and worker pool)
 download_manager = DownloadManager()
-update_installer = UpdateInstaller()
-background_update_service = BackgroundUpdateService()
+update_installer = UpdateInstaller(download_manager)
+background_update_service = BackgroundUpdateService(download_manager, update_installer)
 
 def start_download(package_name: str, download_url: str,
-                  callback: Optional[Callable] = None) -> str:
+                  callback: Optional[Callable] = None,
+                  destination: Optional[Path] = None) -> str:
     """Start a background download"""
-    return download_manager.start_download(package_name, download_url, callback)
+    return download_manager.start_download(package_name, download_url, callback, destination)
 
-def get_download_status(package_name: str) -> Optional[Dict[str, Any]]:
+def get_download_status(package_name: str) -> Optional[DownloadJob]:
     """Get download status"""
     return download_manager.get_download_status(package_name)
 
@@ -4,13 +4,23 @@ Installed applications tracking for arjax
 """
 
 import json
+import mmap
 import os
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from typing import Dict, Iterator, List, Optional, Any, Tuple
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from arjax.config.logging import get_logger
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = get_logger(__name__)
 
 @dataclass
@@ -19,18 +29,57 @@ class InstalledPackage:
     name: str
     version: Optional[str] = None
     source: str = "unknown"
-    install_date: str = ""
-    last_update_check: Optional[str] = None
+    install_date: float = 0.0  # Unix epoch seconds
+    last_update_check: Optional[float] = None  # Unix epoch seconds
     available_version: Optional[str] = None
     update_available: bool = False
     install_method: str = "arjax"  # "arjax", "github", "manual"
 
+# installed.json files larger than this are memory-mapped instead of read when orjson is available
+MMAP_THRESHOLD = 64 * 1024
+
+# Fields stored as Unix epoch seconds; older files kept ISO 8601 strings here
+TIMESTAMP_FIELDS = ("install_date", "last_update_check")
+
+def _to_epoch(value: Any) -> Optional[float]:
+    """Convert a stored timestamp (epoch number or legacy ISO string) to epoch seconds"""
+    if value is None or isinstance(value, (int, float)):
+        return value
+    try:
+        parsed = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+def _normalize_timestamps(pkg_data: Dict[str, Any]) -> None:
+    """Convert legacy ISO timestamps in a raw package entry to epoch seconds in place"""
+    for field in TIMESTAMP_FIELDS:
+        value = pkg_data.get(field)
+        if isinstance(value, str):
+            pkg_data[field] = _to_epoch(value) or (0.0 if field == "install_date" else None)
+
+def format_timestamp(value: Optional[float]) -> str:
+    """Format an epoch timestamp for display"""
+    if not value:
+        return ""
+    return datetime.fromtimestamp(value, timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+
 class InstalledAppsManager:
     """Manages tracking of installed applications"""
 
     def __init__(self):
         self.config_dir = Path.home() / ".arjax"
         self.installed_file = self.config_dir / "installed.json"
+        # Serializes read-modify-write cycles on installed.json across threads
+        self._lock = threading.RLock()
+        # Parsed installed.json, valid while the file's mtime matches _mtime.
+        # Treated as read-only; writers build a new dict and swap it in.
+        self._cache: Optional[Dict[str, Dict[str, Any]]] = None
+        self._mtime: Optional[int] = None
+        self._batch_depth = 0
+        self._batch_dirty = False
         self._ensure_config_dir()
 
     def _ensure_config_dir(self) -> None:
@@ -43,61 +92,125 @@ class InstalledAppsManager:
 
         try:
             # Write to temporary file first
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-
-            # Atomic move to final location
-            temp_file.replace(self.installed_file)
+            if HAS_ORJSON:
+                with open(temp_file, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+                    os.fsync(f.fileno())
+            else:
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
+                    f.flush()
+                    os.fsync(f.fileno())
+
+            # Atomic move to final location; the fsync above keeps the rename
+            # from landing before the data on a crash
+            os.replace(temp_file, self.installed_file)
+            self._cache = data
+            self._mtime = self.installed_file.stat().st_mtime_ns
             logger.debug(f"Installed apps data saved to {self.installed_file}")
 
         except Exception as e:
-            # Clean up temp file on error
-            if temp_file.exists():
-                temp_file.unlink()
+            # Clean up temp file on error; a batch may have left unsaved data in the cache
+            temp_file.unlink(missing_ok=True)
+            self._cache = None
             logger.error(f"Failed to save installed apps data: {e}")
             raise
 
     def _load_installed_data(self) -> Dict[str, Dict[str, Any]]:
         """Load installed packages data from file"""
-        if not self.installed_file.exists():
+        if self._batch_dirty:
+            # Unsaved changes from the current batch are newer than the file
+            return self._cache
+
+        try:
+            mtime = self.installed_file.stat().st_mtime_ns
+        except FileNotFoundError:
             logger.debug("No installed apps file found, starting fresh")
             return {}
 
+        if self._cache is not None and mtime == self._mtime:
+            return self._cache
+
         try:
-            with open(self.installed_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                logger.debug(f"Loaded installed apps data with {len(data)} packages")
-                return data
+            if HAS_ORJSON:
+                with open(self.installed_file, 'rb') as f:
+                    if os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+                        # Let orjson parse straight from the page cache without a read() copy
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            with memoryview(mm) as view:
+                                data = orjson.loads(view)
+                    else:
+                        data = orjson.loads(f.read())
+            else:
+                with open(self.installed_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            logger.debug(f"Loaded installed apps data with {len(data)} packages")
+            # Older files stored ISO strings; convert once here, rewritten on next save
+            for pkg_data in data.values():
+                _normalize_timestamps(pkg_data)
+            self._cache = data
+            self._mtime = mtime
+            return data
 
         except Exception as e:
             logger.warning(f"Failed to load installed apps data, starting fresh: {e}")
             return {}
 
+    def _iter_raw(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield (name, raw package dict) pairs without building dataclasses"""
+        yield from self._load_installed_data().items()
+
     def _save_installed_data(self, data: Dict[str, Dict[str, Any]]) -> None:
         """Save installed packages data to file atomically"""
-        self._atomic_write(data)
+        if self._batch_depth:
+            # Keep it in memory; the outermost batch() writes it once on exit
+            self._cache = data
+            self._batch_dirty = True
+        else:
+            self._atomic_write(data)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defer installed.json writes until the outermost batch exits"""
+        with self._lock:
+            self._batch_depth += 1
+            completed = False
+            try:
+                yield
+                completed = True
+            finally:
+                self._batch_depth -= 1
+                if self._batch_depth == 0 and self._batch_dirty:
+                    self._batch_dirty = False
+                    if completed:
+                        self._atomic_write(self._cache)
+                    else:
+                        # Drop the unsaved changes rather than persisting half a batch
+                        self._cache = None
 
     def add_package(self, package: InstalledPackage) -> None:
         """Add a package to the installed list"""
-        data = self._load_installed_data()
-
         # Set install date if not provided
         if not package.install_date:
-            package.install_date = datetime.now(timezone.utc).isoformat()
+            package.install_date = time.time()
 
-        data[package.name] = asdict(package)
-        self._save_installed_data(data)
+        with self._lock:
+            data = dict(self._load_installed_data())
+            data[package.name] = dict(package.__dict__)  # flat dataclass, no need for asdict()'s deep copy
+            _normalize_timestamps(data[package.name])
+            self._save_installed_data(data)
         logger.info(f"Added package to tracking: {package.name} ({package.source})")
 
     def remove_package(self, package_name: str) -> bool:
         """Remove a package from the installed list"""
-        data = self._load_installed_data()
+        with self._lock:
+            data = dict(self._load_installed_data())
 
-        if package_name in data:
-            del data[package_name]
-            self._save_installed_data(data)
-            logger.info(f"Removed package from tracking: {package_name}")
-            return True
+            if package_name in data:
+                del data[package_name]
+                self._save_installed_data(data)
+                logger.info(f"Removed package from tracking: {package_name}")
+                return True
 
         logger.warning(f"Package not found in tracking: {package_name}")
         return False
@@ -124,54 +237,57 @@ class InstalledAppsManager:
 
     def update_package_info(self, package_name: str, **updates) -> bool:
         """Update information for an installed package"""
-        data = self._load_installed_data()
-
-        if package_name in data:
-            # Update the package data
-            data[package_name].update(updates)
-
-            # Update last update check timestamp if we're checking for updates
-            if 'last_update_check' not in updates:
-                data[package_name]['last_update_check'] = datetime.now(timezone.utc).isoformat()
-
-            self._save_installed_data(data)
-            logger.debug(f"Updated package info: {package_name}")
+        if self.update_packages_info({package_name: updates}):
             return True
 
         logger.warning(f"Package not found for update: {package_name}")
         return False
 
-    def get_packages_needing_update_check(self, max_age_hours: int = 24) -> List[InstalledPackage]:
-        """Get packages that need update checking"""
-        packages = self.get_all_packages()
-        needing_check = []
+    def update_packages_info(self, updates: Dict[str, Dict[str, Any]]) -> int:
+        """Update several installed packages with a single save, returning how many were found"""
+        with self._lock:
+            data = dict(self._load_installed_data())
+            now = time.time()
+            updated = 0
 
-        now = datetime.now(timezone.utc)
+            for package_name, package_updates in updates.items():
+                if package_name not in data:
+                    continue
 
-        for pkg in packages:
-            needs_check = True
+                # Update a copy so the cached entry stays intact if the save fails
+                data[package_name] = {**data[package_name], **package_updates}
+                _normalize_timestamps(data[package_name])
 
-            if pkg.last_update_check:
-                try:
-                    last_check = datetime.fromisoformat(pkg.last_update_check.replace('Z', '+00:00'))
-                    hours_since_check = (now - last_check).total_seconds() / 3600
+                # Update last update check timestamp if we're checking for updates
+                if 'last_update_check' not in package_updates:
+                    data[package_name]['last_update_check'] = now
+
+                updated += 1
+                logger.debug(f"Updated package info: {package_name}")
 
-                    if hours_since_check < max_age_hours:
-                        needs_check = False
-                except ValueError:
-                    # Invalid timestamp, needs check
-                    pass
+            if updated:
+                self._save_installed_data(data)
+        return updated
 
-            if needs_check:
-                needing_check.append(pkg)
+    def get_packages_needing_update_check(self, max_age_hours: int = 24) -> List[InstalledPackage]:
+        """Get packages that need update checking"""
+        cutoff = time.time() - max_age_hours * 3600
+        needing_check = [
+            InstalledPackage(**pkg_data)
+            for _, pkg_data in self._iter_raw()
+            if not pkg_data.get('last_update_check') or pkg_data['last_update_check'] <= cutoff
+        ]
 
         logger.debug(f"Found {len(needing_check)} packages needing update check")
         return needing_check
 
     def get_packages_with_updates(self) -> List[InstalledPackage]:
         """Get packages that have available updates"""
-        packages = self.get_all_packages()
-        with_updates = [pkg for pkg in packages if pkg.update_available]
+        with_updates = [
+            InstalledPackage(**pkg_data)
+            for _, pkg_data in self._iter_raw()
+            if pkg_data.get('update_available')
+        ]
 
         logger.debug(f"Found {len(with_updates)} packages with available updates")
         return with_updates
@@ -182,7 +298,7 @@ class InstalledAppsManager:
             package_name,
             available_version=available_version,
             update_available=True,
-            last_update_check=datetime.now(timezone.utc).isoformat()
+            last_update_check=time.time()
         )
 
     def mark_update_installed(self, package_name: str, new_version: str) -> bool:
@@ -192,18 +308,18 @@ class InstalledAppsManager:
             version=new_version,
             available_version=None,
             update_available=False,
-            last_update_check=datetime.now(timezone.utc).isoformat()
+            last_update_check=time.time()
         )
 
     def get_stats(self) -> Dict[str, int]:
         """Get statistics about installed packages"""
-        packages = self.get_all_packages()
-        with_updates = len([p for p in packages if p.update_available])
+        data = self._load_installed_data()
+        with_updates = sum(1 for pkg_data in data.values() if pkg_data.get('update_available'))
 
         return {
-            'total_packages': len(packages),
+            'total_packages': len(data),
             'packages_with_updates': with_updates,
-            'packages_up_to_date': len(packages) - with_updates,
+            'packages_up_to_date': len(data) - with_updates,
         }
 
     def show_installed_packages(self) -> str:
@@ -222,9 +338,9 @@ class InstalledAppsManager:
 
             lines.append(f"  {pkg.name} ({pkg.version or 'unknown'}) - {pkg.source}")
             lines.append(f"    Status: {status}")
-            lines.append(f"    Installed: {pkg.install_date}")
+            lines.append(f"    Installed: {format_timestamp(pkg.install_date)}")
             if pkg.last_update_check:
-                lines.append(f"    Last checked: {pkg.last_update_check}")
+                lines.append(f"    Last checked: {format_timestamp(pkg.last_update_check)}")
             lines.append("")
 
         return "\n".join(lines)
@@ -252,6 +368,10 @@ def update_package_info(package_name: str, **updates) -> bool:
     """Update information for an installed package"""
     return installed_apps_manager.update_package_info(package_name, **updates)
 
+def update_packages_info(updates: Dict[str, Dict[str, Any]]) -> int:
+    """Update several installed packages with a single save"""
+    return installed_apps_manager.update_packages_info(updates)
+
 def get_packages_needing_update_check(max_age_hours: int = 24) -> List[InstalledPackage]:
     """Get packages that need update checking"""
     return installed_apps_manager.get_packages_needing_update_check(max_age_hours)
@@ -10,7 +10,7 @@ from datetime import datetime, timezone
 from arjax.config.logging import get_logger
 from arjax.package_management.installed import (
     get_all_installed_packages,
-    update_package_info,
+    update_packages_info,
     InstalledPackage,
     get_packages_needing_update_check
 )
@@ -52,6 +52,8 @@ class UpdateChecker:
 
             updates_found = 0
             checked_count = 0
+            # Collected per package and saved to installed.json in one write
+            package_updates: Dict[str, Dict[str, Any]] = {}
 
             for package in packages:
                 try:
@@ -59,25 +61,26 @@ class UpdateChecker:
                     checked_count += 1
 
                     if has_update:
-                        update_package_info(
-                            package.name,
-                            available_version=latest_version,
-                            update_available=True,
-                            last_update_check=datetime.now(timezone.utc).isoformat()
-                        )
+                        package_updates[package.name] = {
+                            "available_version": latest_version,
+                            "update_available": True,
+                            "last_update_check": time.time(),
+                        }
                         updates_found += 1
                         logger.info(f"Update found for {package.name}: {latest_version}")
                     else:
-                        update_package_info(
-                            package.name,
-                            update_available=False,
-                            last_update_check=datetime.now(timezone.utc).isoformat()
-                        )
+                        package_updates[package.name] = {
+                            "update_available": False,
+                            "last_update_check": time.time(),
+                        }
 
                 except Exception as e:
                     logger.error(f"Failed to check updates for {package.name}: {e}")
                     continue
 
+            if package_updates:
+                update_packages_info(package_updates)
+
             result = {
                 "status": "success",
                 "checked": checked_count,
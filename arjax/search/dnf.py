@@ -2,21 +2,93 @@
 """DNF search module with standardized error handling and consistent source naming.
 IMPROVEMENTS: Standardized source name to lowercase, used config timeouts, unified exception handling."""
 
+import logging
 import subprocess
 import re
+import threading
 from typing import List, Tuple, Optional
 from arjax.config.base import TIMEOUTS
 from arjax.core.exceptions import PackageManagerNotFound, PackageSearchException, TimeoutError, ValidationError, NetworkError
 from arjax.config.logging import get_logger, PackageHelperLogger
+from arjax.search.process import CommandStream
 
 logger = get_logger(__name__)
 
-def search_dnf(query: str, cache_manager: Optional[object] = None) -> List[Tuple[str, str, str]]:
+# DNF classic format: "name : description"
+_DNF_COLON_RE = re.compile(r"^(\S+)\s*:\s*(.+)$")
+# DNF5 format often uses tabs or multiple spaces: "name<TAB>description"
+_DNF_SPACES_RE = re.compile(r"^(\S+)\s{2,}(.+)$")
+_DNF_TAB_RE = re.compile(r"^(\S+)\t+(.+)$")
+# Architecture suffixes (e.g., .x86_64, .noarch) on package names
+_ARCHES = frozenset({"x86_64", "i686", "armv7hl", "aarch64", "ppc64le", "s390x", "noarch"})
+# Prefixes (lowercased) of meta/info lines in DNF output
+_SKIP_PREFIXES = (
+    "last metadata",
+    "updating",
+    "repositories",
+    "matched fields",
+    "error:",
+    "warning:",
+)
+# First words of the prefixes above, checked before the full prefix test
+_SKIP_HEADS = frozenset(prefix.split()[0].rstrip(":") for prefix in _SKIP_PREFIXES)
+
+# Result of the one-time "dnf --version" probe: None until probed, then True, or
+# False with _DNF_PROBE_ERROR holding the (exception class, args) to raise again
+_DNF_AVAILABLE: Optional[bool] = None
+_DNF_PROBE_ERROR: Optional[Tuple[type, tuple]] = None
+_DNF_PROBE_LOCK = threading.Lock()
+
+
+def _check_dnf_available() -> None:
+    """Probe dnf once per process and re-raise a cached failure on later calls.
+    
+    Raises:
+        PackageManagerNotFound: When DNF is not installed
+        PackageSearchException: When DNF is installed but broken
+        TimeoutError: When DNF does not answer (not cached; it may be transient)
+    """
+    global _DNF_AVAILABLE, _DNF_PROBE_ERROR
+
+    if _DNF_AVAILABLE is None:
+        with _DNF_PROBE_LOCK:
+            if _DNF_AVAILABLE is None:
+                logger.debug("Checking DNF availability")
+                try:
+                    subprocess.run(
+                        ["dnf", "--version"],
+                        capture_output=True,
+                        check=True,
+                        timeout=TIMEOUTS['command_check']
+                    )
+                    logger.debug("DNF is available and responsive")
+                    _DNF_AVAILABLE = True
+                except FileNotFoundError:
+                    logger.debug("dnf command not found")
+                    _DNF_PROBE_ERROR = (PackageManagerNotFound, ("dnf",))
+                    _DNF_AVAILABLE = False
+                except subprocess.CalledProcessError as e:
+                    logger.debug("DNF version check failed with return code %s", e.returncode)
+                    _DNF_PROBE_ERROR = (PackageSearchException, ("dnf is installed but not working properly.",))
+                    _DNF_AVAILABLE = False
+                except subprocess.TimeoutExpired:
+                    logger.debug("DNF version check timed out")
+                    raise TimeoutError("dnf is not responding.")
+
+    if not _DNF_AVAILABLE:
+        exc_type, args = _DNF_PROBE_ERROR
+        raise exc_type(*args)
+
+
+def search_dnf(
+    query: str, cache_manager: Optional[object] = None, max_results: Optional[int] = None
+) -> List[Tuple[str, str, str]]:
     """Search for packages using DNF package manager.
     
     Args:
         query: Search query string
         cache_manager: Optional cache manager for storing/retrieving results
+        max_results: Stop dnf once this many packages have been parsed (default: no limit)
         
     Returns:
         List[Tuple[str, str, str]]: List of (name, description, source) tuples
@@ -28,7 +100,7 @@ def search_dnf(query: str, cache_manager: Optional[object] = None) -> List[Tuple
         NetworkError: When network connection fails
         PackageSearchException: For other search-related errors
     """
-    logger.info(f"Starting DNF search for query: '{query}'")
+    logger.info("Starting DNF search for query: '%s'", query)
     
     if not query or not query.strip():
         logger.debug("Empty search query provided to DNF search")
@@ -38,49 +110,72 @@ def search_dnf(query: str, cache_manager: Optional[object] = None) -> List[Tuple
     if cache_manager:
         cached_results = cache_manager.get(query, 'dnf')
         if cached_results is not None:
-            logger.info(f"Retrieved {len(cached_results)} DNF results from cache")
+            logger.info("Retrieved %d DNF results from cache", len(cached_results))
             return cached_results
 
-    # Check if DNF is available and working
-    logger.debug("Checking DNF availability")
-    try:
-        subprocess.run(
-            ["dnf", "--version"],
-            capture_output=True,
-            check=True,
-            timeout=TIMEOUTS['command_check']
-        )
-        logger.debug("DNF is available and responsive")
-    except FileNotFoundError:
-        logger.debug("dnf command not found")
-        raise PackageManagerNotFound("dnf")
-    except subprocess.CalledProcessError as e:
-        logger.debug(f"DNF version check failed with return code {e.returncode}")
-        raise PackageSearchException("dnf is installed but not working properly.")
-    except subprocess.TimeoutExpired:
-        logger.debug("DNF version check timed out")
-        raise TimeoutError("dnf is not responding.")
+    # Check if DNF is available and working (probed once per process)
+    _check_dnf_available()
 
     try:
-        logger.debug(f"Executing dnf search with timeout {TIMEOUTS['dnf']}s")
-        # IMPROVED: Use config timeout value
-        result = subprocess.run(
-            ["dnf", "search", query.strip()],
-            capture_output=True,
-            text=True,
-            timeout=TIMEOUTS['dnf'],
-            check=False
-        )
-
-        logger.debug(f"DNF search completed with return code: {result.returncode}")
+        logger.debug("Executing dnf search with timeout %ss", TIMEOUTS['dnf'])
+        # Parse DNF/DNF5 output as it streams in. DNF5 may not emit explicit headers and
+        # can use tabs or multiple spaces between package name and description. We avoid
+        # relying on a header toggle and instead parse any reasonable package line.
+        packages = []
+        lines_processed = 0
+        # Checked once: per-package debug lines are skipped entirely when DEBUG is off
+        debug = logger.isEnabledFor(logging.DEBUG)
+        truncated = False
+
+        with CommandStream(["dnf", "search", query.strip()], timeout=TIMEOUTS['dnf']) as stream:
+            for line in stream:
+                line = line.strip()
+                lines_processed += 1
+
+                if not line:
+                    continue
+
+                match = _DNF_COLON_RE.match(line) or _DNF_SPACES_RE.match(line) or _DNF_TAB_RE.match(line)
+
+                if match:
+                    name_version = match.group(1).strip()
+
+                    # Skip meta/info lines that happen to look like "name : description"
+                    # (e.g. "Error: ..."); only lines whose first word is a known meta
+                    # word pay for the full lowercase prefix check
+                    if (name_version.lower().rstrip(":") in _SKIP_HEADS
+                            and line.lower().startswith(_SKIP_PREFIXES)):
+                        continue
+
+                    desc = match.group(2).strip()
+
+                    # Remove architecture suffix (e.g., .x86_64, .noarch) if present
+                    dot = name_version.rfind(".")
+                    if dot != -1 and name_version[dot + 1:] in _ARCHES:
+                        name = name_version[:dot]
+                    else:
+                        name = name_version
+
+                    packages.append((name, desc, "dnf"))
+                    if debug:
+                        logger.debug("Found DNF package: %s", name)
+                    if max_results is not None and len(packages) >= max_results:
+                        # DNF lists its best matches first, so the rest can be dropped
+                        truncated = True
+                        break
+
+            # A search we cut short is terminated on purpose; treat it as successful
+            returncode = 0 if truncated else stream.returncode
+            error_msg = stream.stderr.strip() if returncode not in (0, 1) else ""
+
+        logger.debug("DNF search completed with return code: %s", returncode)
 
         # Handle DNF exit codes
-        if result.returncode == 1:  # no matches found
+        if returncode == 1:  # no matches found
             logger.info("DNF search found no matches (normal result)")
             return []
-        elif result.returncode != 0:
-            error_msg = result.stderr.strip()
-            logger.debug(f"DNF search failed with error: {error_msg}")
+        elif returncode != 0:
+            logger.debug("DNF search failed with error: %s", error_msg)
             
             # Parse common DNF error messages
             if "Error: Cache disabled" in error_msg:
@@ -97,75 +192,23 @@ def search_dnf(query: str, cache_manager: Optional[object] = None) -> List[Tuple
                     "Permission denied accessing DNF. Try: sudo dnf search"
                 )
             else:
-                logger.debug(f"DNF search failed with unknown error: {error_msg}")
+                logger.debug("DNF search failed with unknown error: %s", error_msg)
                 raise PackageSearchException(
                     f"dnf search failed: {error_msg or 'Unknown error'}"
                 )
 
-        output = result.stdout.strip()
-        if not output:
-            logger.info("DNF search returned empty output")
-            return []
-
-        logger.debug("Parsing DNF search results")
-        # Parse DNF/DNF5 output. DNF5 may not emit explicit headers and can use tabs or
-        # multiple spaces between package name and description. We avoid relying on a
-        # header toggle and instead parse any reasonable package line.
-        packages = []
-        lines_processed = 0
-
-        arch_pattern = r"\.(x86_64|i686|armv7hl|aarch64|ppc64le|s390x|noarch)$"
-
-        for line in output.split("\n"):
-            line = line.strip()
-            lines_processed += 1
-
-            if not line:
-                continue
+        logger.info("DNF search completed: %d packages found from %d lines", len(packages), lines_processed)
 
-            # Skip meta/info lines
-            lower_line = line.lower()
-            if lower_line.startswith((
-                "last metadata",
-                "updating",
-                "repositories",
-                "matched fields",
-                "error:",
-                "warning:"
-            )):
-                continue
-
-            # DNF classic format: "name : description"
-            match = re.match(r"^(\S+)\s*:\s*(.+)$", line)
-
-            # DNF5 format often uses tabs or multiple spaces: "name<TAB>description"
-            if not match:
-                match = re.match(r"^(\S+)\s{2,}(.+)$", line) or re.match(r"^(\S+)\t+(.+)$", line)
-
-            if match:
-                name_version = match.group(1).strip()
-                desc = match.group(2).strip()
-
-                # Remove architecture suffix (e.g., .x86_64, .noarch) if present
-                name = re.sub(arch_pattern, "", name_version)
-
-                packages.append((name, desc, "dnf"))
-                logger.debug(f"Found DNF package: {name}")
-                continue
-
-        logger.info(f"DNF search completed: {len(packages)} packages found from {lines_processed} lines")
-
-        logger.info(f"DNF search completed: {len(packages)} packages found from {lines_processed} lines")
-        
-        # Cache results if cache manager is available
-        if cache_manager and packages:
+        # Cache results if cache manager is available; truncated results would
+        # shadow a later full search for the same query
+        if cache_manager and packages and not truncated:
             cache_manager.set(query, 'dnf', packages)
-            logger.debug(f"Cached {len(packages)} DNF results")
+            logger.debug("Cached %d DNF results", len(packages))
         
         return packages
 
     except subprocess.TimeoutExpired:
-        logger.debug(f"DNF search timed out after {TIMEOUTS['dnf']}s")
+        logger.debug("DNF search timed out after %ss", TIMEOUTS['dnf'])
         raise TimeoutError("DNF search timed out. This can happen with large repositories.")
     except (ValidationError, PackageManagerNotFound, TimeoutError, NetworkError, PackageSearchException):
         # Re-raise our specific exceptions
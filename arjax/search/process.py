@@ -0,0 +1,89 @@
+"""Streaming subprocess helper shared by the command-line search backends.
+
+Package manager searches can print thousands of lines. Reading them as they
+arrive lets a backend parse incrementally and stop the command early once it
+has enough results, instead of buffering the whole output first.
+"""
+
+import subprocess
+import tempfile
+import threading
+from typing import Iterator, List, Optional
+
+
+class CommandStream:
+    """Run a command and iterate over its stdout lines as they are produced.
+
+    Use as a context manager. Leaving the block before the output is exhausted
+    terminates the command. If the command runs longer than ``timeout`` seconds
+    it is killed and iteration raises ``subprocess.TimeoutExpired``, like
+    ``subprocess.run(..., timeout=...)``.
+
+    Args:
+        args: Command and arguments to execute
+        timeout: Maximum run time in seconds
+
+    Raises:
+        FileNotFoundError: When the command does not exist
+    """
+
+    def __init__(self, args: List[str], timeout: float):
+        self.args = args
+        self.timeout = timeout
+        self.returncode: Optional[int] = None
+        self.stopped_early = False
+        self._timed_out = False
+        # stderr goes to a temp file so a chatty command can never block on a full pipe
+        self._stderr = tempfile.TemporaryFile()
+        try:
+            self._proc = subprocess.Popen(
+                args,
+                stdout=subprocess.PIPE,
+                stderr=self._stderr,
+                # Decoded by the C incremental decoder as lines arrive; a stray
+                # non-UTF-8 byte in a package summary must not abort the search
+                encoding="utf-8",
+                errors="replace",
+                bufsize=1,
+            )
+        except BaseException:
+            self._stderr.close()
+            raise
+        self._timer = threading.Timer(timeout, self._kill_on_timeout)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _kill_on_timeout(self) -> None:
+        self._timed_out = True
+        self._proc.kill()
+
+    def __enter__(self) -> "CommandStream":
+        return self
+
+    def __iter__(self) -> Iterator[str]:
+        for line in self._proc.stdout:
+            yield line.rstrip("\n")
+        self.returncode = self._proc.wait()
+        self._timer.cancel()
+        if self._timed_out:
+            raise subprocess.TimeoutExpired(self.args, self.timeout)
+
+    @property
+    def stderr(self) -> str:
+        """Everything the command wrote to stderr, once it has finished."""
+        self._stderr.seek(0)
+        return self._stderr.read().decode("utf-8", errors="replace")
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._timer.cancel()
+        if self._proc.poll() is None:
+            # The caller stopped reading early; the rest of the output is not needed
+            self.stopped_early = True
+            self._proc.terminate()
+            try:
+                self._proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._proc.kill()
+        self._proc.stdout.close()
+        self.returncode = self._proc.wait()
+        self._stderr.close()
@@ -7,6 +7,7 @@ This module contains the core ranking algorithm used by both CLI and GUI
 to rank and deduplicate search results for optimal user experience.
 """
 
+import functools
 import re
 from typing import List, Tuple, Optional
 from arjax.config.base import JUNK_KEYWORDS, LOW_PRIORITY_KEYWORDS, BOOST_KEYWORDS
@@ -23,6 +24,10 @@ logger = get_logger(__name__)
 # Minimum length for meaningful prefix matching in scoring
 MIN_PREFIX_LENGTH = 3
 
+# Single-pass substring scanners for the keyword sets
+_JUNK_RE = re.compile("|".join(map(re.escape, sorted(JUNK_KEYWORDS))))
+_LOW_PRIORITY_RE = re.compile("|".join(map(re.escape, sorted(LOW_PRIORITY_KEYWORDS))))
+
 
 def _normalize_for_match(text: str) -> str:
     """Normalize text for fuzzy matching consistency."""
@@ -39,16 +44,26 @@ def _acronym(tokens: List[str]) -> str:
     return "".join(token[0] for token in tokens if token)
 
 
+@functools.lru_cache(maxsize=32)
+def _query_features(query: str) -> Tuple[str, str]:
+    """Normalize a query once per search instead of once per scored package.
+
+    Returns:
+        Tuple[str, str]: Normalized query and its token acronym
+    """
+    query_n = _normalize_for_match(query)
+    return query_n, _acronym(_tokenize(query_n))
+
+
 def _rapidfuzz_score(query: str, package_name: str, description: str) -> int:
     """Compute fuzzy relevance score using RapidFuzz (0-140)."""
     if not HAS_RAPIDFUZZ:
         return 0
 
-    query_n = _normalize_for_match(query)
+    query_n, query_acr = _query_features(query)
     name_n = _normalize_for_match(package_name)
     desc_n = _normalize_for_match(description)
 
-    query_tokens = _tokenize(query_n)
     name_tokens = _tokenize(name_n)
 
     # Focus mostly on package name, lightly on description
@@ -65,8 +80,7 @@ def _rapidfuzz_score(query: str, package_name: str, description: str) -> int:
     )
 
     # Acronym support helps many real-world queries (e.g., vscode, k8s, nvim)
-    if query_tokens and name_tokens:
-        query_acr = _acronym(query_tokens)
+    if query_acr and name_tokens:
         name_acr = _acronym(name_tokens)
         if query_acr and name_acr:
             acr_score = max(
@@ -90,7 +104,7 @@ def is_valid_package(name: str, desc: Optional[str]) -> bool:
         bool: True if package is valid, False if it's a junk/meta package
     """
     desc = (desc or "").lower()
-    is_junk = any(bad in desc for bad in JUNK_KEYWORDS)
+    is_junk = _JUNK_RE.search(desc) is not None
     
     if is_junk:
         logger.debug(f"Package '{name}' filtered out as junk package")
@@ -171,9 +185,12 @@ def get_top_matches(query: str, all_packages: List[Tuple[str, str, str]], limit:
     # Create hyphenated and concatenated versions for better matching
     query_hyphenated = query.replace(" ", "-")
     query_concat = "".join(_tokenize(query))
+    query_wants_low_priority = not LOW_PRIORITY_KEYWORDS.isdisjoint(query_tokens)
     scored_results = []
+    # Fuzzy scores by package index, reused by the typo fallback below
+    fuzzy_scores = {}
 
-    for name, desc, source in all_packages:
+    for index, (name, desc, source) in enumerate(all_packages):
         if not is_valid_package(name, desc):
             continue
 
@@ -181,6 +198,7 @@ def get_top_matches(query: str, all_packages: List[Tuple[str, str, str]], limit:
         desc_l = (desc or "").lower()
         name_tokens = set(_tokenize(name_l))
         desc_tokens = set(_tokenize(desc_l))
+        name_is_low_priority = _LOW_PRIORITY_RE.search(name_l) is not None
 
         score = 0
 
@@ -199,7 +217,7 @@ def get_top_matches(query: str, all_packages: List[Tuple[str, str, str]], limit:
             logger.debug(f"Concatenated match bonus for '{name}': +130")
         # Substring match
         elif query in name_l:
-            if any(bad in name_l for bad in LOW_PRIORITY_KEYWORDS) and not any(bad in query_tokens for bad in LOW_PRIORITY_KEYWORDS):
+            if name_is_low_priority and not query_wants_low_priority:
                 score += 20
                 logger.debug(f"Low-priority substring bonus for '{name}': +20")
             else:
@@ -207,7 +225,7 @@ def get_top_matches(query: str, all_packages: List[Tuple[str, str, str]], limit:
                 logger.debug(f"Substring match bonus for '{name}': +80")
         # Check if hyphenated query is in name
         elif query_hyphenated in name_l:
-            if any(bad in name_l for bad in LOW_PRIORITY_KEYWORDS) and not any(bad in query_tokens for bad in LOW_PRIORITY_KEYWORDS):
+            if name_is_low_priority and not query_wants_low_priority:
                 score += 15
                 logger.debug(f"Low-priority hyphenated substring bonus for '{name}': +15")
             else:
@@ -252,6 +270,7 @@ def get_top_matches(query: str, all_packages: List[Tuple[str, str, str]], limit:
 
         # RapidFuzz semantic/fuzzy layer (handles abbreviations, typos, reordered tokens)
         fuzzy_bonus = _rapidfuzz_score(query, name_l, desc_l)
+        fuzzy_scores[index] = fuzzy_bonus
         score += fuzzy_bonus
 
         # Penalize missing intent tokens to reduce false positives
@@ -283,11 +302,11 @@ def get_top_matches(query: str, all_packages: List[Tuple[str, str, str]], limit:
                     score -= 24
 
         # Extra penalty when low-priority marker is in package name itself
-        if any(bad in name_l for bad in LOW_PRIORITY_KEYWORDS) and not any(bad in query_tokens for bad in LOW_PRIORITY_KEYWORDS):
+        if name_is_low_priority and not query_wants_low_priority:
             score -= 20
 
         # Strong demotion for wrapper/helper packages on generic single-token queries
-        if len(query_tokens) == 1 and any(bad in name_l for bad in LOW_PRIORITY_KEYWORDS):
+        if len(query_tokens) == 1 and name_is_low_priority:
             score -= 45
 
         # Mild penalty for very long package names with weak lexical signal
@@ -326,10 +345,10 @@ def get_top_matches(query: str, all_packages: List[Tuple[str, str, str]], limit:
     # Fallback for typo-heavy or sparse matches: return best available scored results
     if not top:
         fallback_scored = []
-        for name, desc, source in all_packages:
-            if not is_valid_package(name, desc):
+        for index, (name, desc, source) in enumerate(all_packages):
+            if index not in fuzzy_scores:
                 continue
-            base_score = _rapidfuzz_score(query, name.lower(), (desc or "").lower())
+            base_score = fuzzy_scores[index]
             base_score += {
                 "pacman": 25, "apt": 25, "dnf": 25, "zypper": 25,
                 "aur": 12, "flatpak": 8, "snap": 5
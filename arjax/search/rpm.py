@@ -4,13 +4,56 @@ RPM search module for generic RPM-based distributions.
 Handles rpm command for querying packages.
 """
 
+import shutil
 import subprocess
 import re
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 import logging
 
+from arjax.search.process import CommandStream
+
 logger = logging.getLogger(__name__)
 
+# "name : description" lines in yum search output
+_YUM_LINE_RE = re.compile(r'^(\S+)\s*:\s*(.+)$')
+# Repository names dnf repoquery reports for installed packages
+_INSTALLED_REPOS = frozenset({"@System", "installed", "@commandline"})
+
+
+def _search_repoquery(query: str, limit: int) -> Optional[List[Tuple[str, str, str]]]:
+    """
+    Search installed and available packages with a single dnf repoquery call.
+
+    Returns:
+        List of tuples (package_name, description, source), or None if dnf
+        is missing or the query failed and the rpm/yum search should be used
+    """
+    if shutil.which("dnf") is None:
+        return None
+
+    cmd = [
+        "dnf", "repoquery", "--quiet",
+        "--queryformat", "%{name}\t%{version}\t%{summary}\t%{reponame}\n",
+        f"*{query}*",
+    ]
+    results = []
+    with CommandStream(cmd, timeout=15) as stream:
+        for line in stream:
+            # NAME, VERSION, SUMMARY, REPONAME; blank lines come from dnf4 adding its own newline
+            parts = line.split('\t', 3)
+            if len(parts) < 4:
+                continue
+            name, version, summary, repo = (part.strip() for part in parts)
+            source = "RPM (Installed)" if repo in _INSTALLED_REPOS else "RPM (Available)"
+            results.append((name, f"{summary} (v{version})", source))
+            if len(results) >= limit:
+                break
+    if not stream.stopped_early and stream.returncode != 0:
+        logger.debug("dnf repoquery failed with return code %s", stream.returncode)
+        return None
+    return results
+
+
 def search_rpm(query: str, limit: int = 10) -> List[Tuple[str, str, str]]:
     """
     Search for packages using rpm command.
@@ -24,58 +67,53 @@ def search_rpm(query: str, limit: int = 10) -> List[Tuple[str, str, str]]:
         List of tuples (package_name, description, source)
     """
     try:
-        # Try rpm -qa for installed packages first
+        # One dnf repoquery covers both installed and available packages
+        results = _search_repoquery(query, limit)
+        if results is not None:
+            return results
+
+        # Without dnf, try rpm -qa for installed packages first
         cmd = ["rpm", "-qa", "--queryformat", "%{NAME}\t%{VERSION}\t%{SUMMARY}\\n", f"*{query}*"]
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=10,
-            check=False
-        )
-        
         results = []
-        
-        if result.returncode == 0 and result.stdout.strip():
-            lines = result.stdout.strip().split('\n')
-            
-            for line in lines[:limit]:
-                parts = line.split('\t')
+
+        # Output is parsed as it arrives; leaving the block early stops rpm once we have enough
+        with CommandStream(cmd, timeout=10) as stream:
+            for line in stream:
+                # NAME, VERSION, SUMMARY; the summary may itself contain tabs
+                parts = line.split('\t', 2)
                 if len(parts) >= 3:
                     name = parts[0].strip()
                     version = parts[1].strip()
                     summary = parts[2].strip()
                     results.append((name, f"{summary} (v{version})", "RPM (Installed)"))
+                    if len(results) >= limit:
+                        break
+        if not stream.stopped_early and stream.returncode != 0:
+            results = []
         
         # If no results or need more, try yum/dnf search
         if len(results) < limit:
             try:
                 # Try yum first (older systems)
-                yum_cmd = ["yum", "search", query]
-                yum_result = subprocess.run(
-                    yum_cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=15,
-                    check=False
-                )
-                
-                if yum_result.returncode == 0:
+                available = []
+                with CommandStream(["yum", "search", query], timeout=15) as yum_stream:
                     in_results = False
-                    for line in yum_result.stdout.split('\n'):
+                    for line in yum_stream:
                         if '=====' in line or 'Matched' in line.lower():
                             in_results = True
                             continue
                         
                         if in_results and ':' in line:
-                            match = re.match(r'^(\S+)\s*:\s*(.+)$', line)
+                            match = _YUM_LINE_RE.match(line)
                             if match:
                                 name = match.group(1).strip()
                                 desc = match.group(2).strip()
-                                results.append((name, desc, "RPM (Available)"))
+                                available.append((name, desc, "RPM (Available)"))
                                 
-                                if len(results) >= limit:
+                                if len(results) + len(available) >= limit:
                                     break
+                if yum_stream.stopped_early or yum_stream.returncode == 0:
+                    results.extend(available)
             except FileNotFoundError:
                 logger.debug("yum not found, skipping")
         
@@ -2,18 +2,70 @@
 """Zypper search module with standardized error handling and consistent source naming.
 Supports openSUSE's zypper package manager."""
 
+import csv
+import functools
+import logging
 import subprocess
 import re
 from typing import List, Tuple, Optional
 from arjax.config.base import TIMEOUTS
 from arjax.core.exceptions import PackageManagerNotFound, PackageSearchException, TimeoutError, ValidationError, NetworkError
 from arjax.config.logging import get_logger, PackageHelperLogger
+from arjax.search.process import CommandStream
 
 logger = get_logger(__name__)
 
+# Section header lines: "---"/"===" rules or the "S | Name | ..." table header
+_HEADER_RE = re.compile(r"^(?:---|===)|\|.*Name|Name.*\|")
+_SEP = "|"
+# Cell values that only appear in table header rows
+_HEADER_CELLS = frozenset({"S", "Status", "Name"})
+
+
+@functools.lru_cache(maxsize=1)
+def _zypper_probe() -> Optional[Tuple[type, tuple]]:
+    """Run "zypper --version" once per process.
+    
+    Returns:
+        None when zypper is usable, otherwise the (exception class, args) to raise.
+        A timeout is raised instead of returned so it is not cached.
+    """
+    logger.debug("Checking Zypper availability")
+    try:
+        subprocess.run(
+            ["zypper", "--version"],
+            capture_output=True,
+            check=True,
+            timeout=TIMEOUTS['command_check']
+        )
+        logger.debug("Zypper is available and responsive")
+        return None
+    except FileNotFoundError:
+        logger.debug("zypper command not found")
+        return (PackageManagerNotFound, ("zypper command not found. This system may not be openSUSE-based.",))
+    except subprocess.CalledProcessError as e:
+        logger.debug("Zypper version check failed with return code %s", e.returncode)
+        return (PackageSearchException, ("zypper is installed but not working properly.",))
+    except subprocess.TimeoutExpired:
+        logger.debug("Zypper version check timed out")
+        raise TimeoutError("zypper is not responding.")
+
+
+def _check_zypper_available() -> None:
+    """Raise the cached zypper probe failure, if any."""
+    error = _zypper_probe()
+    if error is not None:
+        exc_type, args = error
+        raise exc_type(*args)
+
+
 def search_zypper(query: str, cache_manager: Optional[object] = None) -> List[Tuple[str, str, str]]:
     """Search for packages using Zypper package manager.
     
+    The query is stripped once on entry; the normalized form is what zypper
+    searches for and what results are cached under, so "vim " and "vim"
+    share a cache entry.
+
     Args:
         query: Search query string
         cache_manager: Optional cache manager for storing/retrieving results
@@ -28,9 +80,10 @@ def search_zypper(query: str, cache_manager: Optional[object] = None) -> List[Tu
         NetworkError: When network connection fails
         PackageSearchException: For other search-related errors
     """
-    logger.info(f"Starting Zypper search for query: '{query}'")
+    logger.info("Starting Zypper search for query: '%s'", query)
     
-    if not query or not query.strip():
+    query = query.strip() if query else ""
+    if not query:
         logger.debug("Empty search query provided to Zypper search")
         raise ValidationError("Empty search query provided")
 
@@ -38,51 +91,67 @@ def search_zypper(query: str, cache_manager: Optional[object] = None) -> List[Tu
     if cache_manager:
         cached_results = cache_manager.get(query, 'zypper')
         if cached_results is not None:
-            logger.info(f"Retrieved {len(cached_results)} Zypper results from cache")
+            logger.info("Retrieved %d Zypper results from cache", len(cached_results))
             return cached_results
 
-    # Check if Zypper is available and working
-    logger.debug("Checking Zypper availability")
-    try:
-        subprocess.run(
-            ["zypper", "--version"],
-            capture_output=True,
-            check=True,
-            timeout=TIMEOUTS['command_check']
-        )
-        logger.debug("Zypper is available and responsive")
-    except FileNotFoundError:
-        logger.debug("zypper command not found")
-        raise PackageManagerNotFound(
-            "zypper command not found. This system may not be openSUSE-based."
-        )
-    except subprocess.CalledProcessError as e:
-        logger.debug(f"Zypper version check failed with return code {e.returncode}")
-        raise PackageSearchException("zypper is installed but not working properly.")
-    except subprocess.TimeoutExpired:
-        logger.debug("Zypper version check timed out")
-        raise TimeoutError("zypper is not responding.")
+    # Check if Zypper is available and working (probed once per process)
+    _check_zypper_available()
 
     try:
-        logger.debug(f"Executing zypper search with timeout {TIMEOUTS['zypper']}s")
-        # Use zypper search with non-interactive mode and detailed output
-        result = subprocess.run(
-            ["zypper", "--non-interactive", "search", "--details", query.strip()],
-            capture_output=True,
-            text=True,
+        logger.debug("Executing zypper search with timeout %ss", TIMEOUTS['zypper'])
+        # Use zypper search with non-interactive mode and detailed output; the
+        # output is parsed as it streams in rather than buffered first
+        packages = []
+        lines_processed = 0
+        # Checked once: per-package debug lines are skipped entirely when DEBUG is off
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        with CommandStream(
+            ["zypper", "--non-interactive", "search", "--details", query],
             timeout=TIMEOUTS['zypper'],
-            check=False
-        )
+        ) as stream:
+            lines = iter(stream)
+
+            # Skip the "Loading repository data..." preamble up to the table header
+            for line in lines:
+                lines_processed += 1
+                if _HEADER_RE.search(line):
+                    logger.debug("Found Zypper results section header")
+                    break
+
+            # Package rows use the table format with | separators:
+            # S | Name | Type | Version | Arch | Repository
+            # The rest of the stream is split by the C csv reader; rule lines
+            # ("--+---") and blank lines come out with fewer than three cells
+            rows = csv.reader(lines, delimiter=_SEP, skipinitialspace=True, quoting=csv.QUOTE_NONE)
+            append = packages.append
+            for row in rows:
+                # At least Status, Name, Type; skip repeated header rows
+                if len(row) < 3 or row[0].strip() in _HEADER_CELLS:
+                    continue
+
+                # Name is the column after the status (i, v, or empty when not installed)
+                name = row[1].strip()
+                if not name or name in _HEADER_CELLS:
+                    continue
 
-        logger.debug(f"Zypper search completed with return code: {result.returncode}")
+                # Since --details doesn't show description inline, we use a default
+                append((name, "Package from openSUSE repository", "zypper"))
+                if debug:
+                    logger.debug("Found Zypper package: %s", name)
+            lines_processed += rows.line_num
+
+            returncode = stream.returncode
+            error_msg = stream.stderr.strip() if returncode not in (0, 104) else ""
+
+        logger.debug("Zypper search completed with return code: %s", returncode)
 
         # Handle Zypper exit codes
-        if result.returncode == 104:  # no matches found
+        if returncode == 104:  # no matches found
             logger.info("Zypper search found no matches (normal result)")
             return []
-        elif result.returncode != 0:
-            error_msg = result.stderr.strip()
-            logger.debug(f"Zypper search failed with error: {error_msg}")
+        elif returncode != 0:
+            logger.debug("Zypper search failed with error: %s", error_msg)
             
             # Parse common Zypper error messages
             if "ZYPPER_EXIT_INF_REBOOT_NEEDED" in error_msg or "System management is locked" in error_msg:
@@ -102,87 +171,26 @@ def search_zypper(query: str, cache_manager: Optional[object] = None) -> List[Tu
                     "Permission denied accessing Zypper. Try running with sudo if needed."
                 )
             else:
-                logger.debug(f"Zypper search failed with unknown error: {error_msg}")
+                logger.debug("Zypper search failed with unknown error: %s", error_msg)
                 raise PackageSearchException(
                     f"zypper search failed: {error_msg or 'Unknown error'}"
                 )
 
-        output = result.stdout.strip()
-        if not output:
+        if not lines_processed:
             logger.info("Zypper search returned empty output")
             return []
 
-        logger.debug("Parsing Zypper search results")
-        # Parse Zypper output
-        packages = []
-        in_results = False
-        lines_processed = 0
-
-        for line in output.split("\n"):
-            line = line.strip()
-            lines_processed += 1
-            
-            if not line:
-                continue
-
-            # Detect start of results section (zypper --details produces table format)
-            if line.startswith("---") or line.startswith("===") or ("|" in line and "Name" in line):
-                logger.debug("Found Zypper results section header")
-                in_results = True
-                continue
-
-            # Process package lines - zypper --details uses table format with | separators
-            # Format: | Status | Name | Type | Version | Arch | Repository
-            if in_results and "|" in line:
-                # Split by | and clean up
-                parts = [p.strip() for p in line.split("|")]
-                
-                # Filter out empty parts and header repetitions
-                parts = [p for p in parts if p and not p.startswith("-")]
-                
-                if len(parts) >= 3:  # At least Status, Name, Type
-                    # Skip if it's a header line
-                    if parts[0] in ["S", "Status"] or "Name" in parts:
-                        continue
-                    
-                    # Extract package name (usually second column after status)
-                    # Status is usually in first column (i, v, etc.)
-                    name_idx = 1 if len(parts) > 1 else 0
-                    if name_idx < len(parts):
-                        name = parts[name_idx].strip()
-                        
-                        # For zypper, descriptions are often in summary field
-                        # Since --details doesn't show description inline, we'll use a default
-                        desc = "Package from openSUSE repository"
-                        
-                        # Skip invalid entries
-                        if name and not name.startswith("-") and name not in ["Name", "S", "Status"]:
-                            packages.append((name, desc, "zypper"))
-                            logger.debug(f"Found Zypper package: {name}")
-            elif in_results and line and not line.startswith("Loading") and not line.startswith("Retrieving"):
-                # Alternative format: simple list without table
-                # Try to parse as "name : description" format
-                if " | " in line:
-                    parts = line.split(" | ", 1)
-                    if len(parts) >= 1:
-                        name = parts[0].strip()
-                        desc = parts[1].strip() if len(parts) > 1 else "Package from openSUSE repository"
-                        
-                        if name and not name.startswith("-"):
-                            packages.append((name, desc, "zypper"))
-                            logger.debug(f"Found Zypper package: {name}")
-
-        logger.info(f"Zypper search completed: {len(packages)} packages found from {lines_processed} lines")
+        logger.info("Zypper search completed: %d packages found from %d lines", len(packages), lines_processed)
         
         # Cache results if cache manager is available
         if cache_manager and packages:
             cache_manager.set(query, 'zypper', packages)
-            logger.debug(f"Cached {len(packages)} Zypper results")
+            logger.debug("Cached %d Zypper results", len(packages))
         
         return packages
 
     except subprocess.TimeoutExpired:
-        logger.debug(f"Zypper search timed out after {TIMEOUTS['zypper']}s")
+        logger.debug("Zypper search timed out after %ss", TIMEOUTS['zypper'])
         raise TimeoutError("Zypper search timed out. This can happen with large repositories.")
     except (ValidationError, PackageManagerNotFound, TimeoutError, NetworkError, PackageSearchException):
         # Re-raise our specific exceptions
@@ -0,0 +1,66 @@
+"""
+Unit tests for command-line helpers in arjax.
+"""
+
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from arjax.interfaces import cli
+
+
+@pytest.fixture
+def batch_env():
+    """Patch searches so every requested name resolves to a flatpak package."""
+    with patch.object(cli, "detect_distro", return_value="other"), \
+            patch.object(cli, "search_flatpak", side_effect=lambda q: [(q, "desc", "flatpak")]), \
+            patch.object(cli, "search_snap", return_value=[]), \
+            patch.object(cli, "get_top_matches", side_effect=lambda q, results, limit: results), \
+            patch.object(cli, "generate_command", side_effect=lambda pkg, source: f"sudo flatpak install {pkg}"), \
+            patch.object(cli.console, "print") as printed:
+        yield printed
+
+
+def printed_text(printed):
+    """Everything the console mock was asked to print, as one string."""
+    return "\n".join(str(call.args[0]) for call in printed.call_args_list if call.args)
+
+
+class TestBatchInstall:
+    """Tests for batch installation of several packages."""
+
+    def test_runs_each_command_without_shell(self, batch_env):
+        """Test that each validated package is installed from its split command."""
+        with patch.object(cli.subprocess, "run",
+                          return_value=subprocess.CompletedProcess([], 0)) as run:
+            cli.batch_install_packages(["vim", "git"])
+
+        assert [call.args[0] for call in run.call_args_list] == [
+            ["sudo", "flatpak", "install", "vim"],
+            ["sudo", "flatpak", "install", "git"],
+        ]
+        assert "Successful: 2" in printed_text(batch_env)
+
+    def test_unparsable_command_fails_only_that_package(self, batch_env):
+        """Test that an unbalanced quote is recorded as a failure and the batch continues."""
+        with patch.object(cli.subprocess, "run",
+                          return_value=subprocess.CompletedProcess([], 0)) as run:
+            cli.batch_install_packages(["bad'pkg", "vim"])
+
+        assert run.call_count == 1
+        output = printed_text(batch_env)
+        assert "Successful: 1" in output
+        assert "bad'pkg (invalid command: No closing quotation)" in output
+
+    def test_missing_executable_fails_only_that_package(self, batch_env):
+        """Test that a missing sudo or package manager is recorded and the summary still printed."""
+        results = [FileNotFoundError(2, "No such file or directory", "sudo"),
+                   subprocess.CompletedProcess([], 1)]
+        with patch.object(cli.subprocess, "run", side_effect=results):
+            cli.batch_install_packages(["vim", "git"])
+
+        output = printed_text(batch_env)
+        assert "Failed: 2" in output
+        assert "vim (cannot run command: [Errno 2] No such file or directory: 'sudo')" in output
+        assert "git (exit code: 1)" in output
@@ -0,0 +1,72 @@
+"""
+Unit tests for the user configuration manager in arjax.
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from arjax.config.manager import ConfigManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Config manager rooted in a temporary home directory."""
+    with patch.object(Path, "home", return_value=tmp_path):
+        yield ConfigManager()
+
+
+class TestConfigCache:
+    """Tests for the in-process configuration cache."""
+
+    def test_load_reuses_cached_config(self, manager):
+        """Test that repeated loads do not re-read the config file."""
+        manager.set_config_value("user_mode", "advanced")
+
+        with patch("builtins.open", side_effect=AssertionError("config re-read")):
+            assert manager.load_config().user_mode == "advanced"
+
+    def test_returned_config_is_a_copy(self, manager):
+        """Test that mutating a loaded config does not leak into the cache."""
+        config = manager.load_config()
+        config.user_mode = "advanced"
+
+        assert manager.load_config().user_mode == "normal"
+
+    def test_invalidate_picks_up_external_changes(self, manager):
+        """Test that invalidate() forces the next load to hit the file."""
+        manager.load_config()
+        manager.config_file.write_text(json.dumps({"theme_mode": "dark"}), encoding="utf-8")
+
+        assert manager.load_config().theme_mode == "system"
+        manager.invalidate()
+        assert manager.load_config().theme_mode == "dark"
+
+
+class TestConfigBatch:
+    """Tests for batched configuration writes."""
+
+    def test_batch_writes_once(self, manager):
+        """Test that several updates inside a batch are saved in a single write."""
+        with patch.object(manager, "_atomic_write", wraps=manager._atomic_write) as write:
+            with manager.batch():
+                manager.set_config_value("user_mode", "advanced")
+                manager.set_config_value("theme_mode", "dark")
+                assert write.call_count == 0
+
+        assert write.call_count == 1
+        saved = json.loads(manager.config_file.read_text(encoding="utf-8"))
+        assert saved["user_mode"] == "advanced"
+        assert saved["theme_mode"] == "dark"
+
+    def test_failed_batch_discards_changes(self, manager):
+        """Test that an exception inside a batch leaves the file and cache untouched."""
+        with pytest.raises(RuntimeError):
+            with manager.batch():
+                manager.set_config_value("user_mode", "advanced")
+                raise RuntimeError("abort")
+
+        assert not manager.config_file.exists()
+        assert manager.load_config().user_mode == "normal"
@@ -0,0 +1,68 @@
+"""
+Unit tests for the background download manager in arjax.
+"""
+
+import hashlib
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from arjax.package_management.download import DownloadManager
+
+PAYLOAD = bytes(range(256)) * 4096
+
+
+@pytest.fixture
+def file_server(tmp_path):
+    """Serve a single payload file over HTTP on localhost."""
+    served = tmp_path / "served"
+    served.mkdir()
+    (served / "package.bin").write_bytes(PAYLOAD)
+
+    handler = partial(SimpleHTTPRequestHandler, directory=str(served))
+    handler.log_message = lambda *args: None
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/package.bin"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Download manager rooted in a temporary home directory."""
+    with patch.object(Path, "home", return_value=tmp_path):
+        dm = DownloadManager()
+        yield dm
+        dm.shutdown()
+
+
+class TestDownloadWorker:
+    """Tests for the download worker."""
+
+    def test_download_completes_with_checksum(self, manager, file_server):
+        """Test that a finished download records its size and SHA-256."""
+        manager.start_download("pkg", file_server)
+        manager.get_download_status("pkg").future.result(timeout=10)
+
+        job = manager.get_download_status("pkg")
+        assert job.status == "completed"
+        assert job.downloaded_size == len(PAYLOAD)
+        assert job.temp_file.read_bytes() == PAYLOAD
+        assert job.sha256 == hashlib.sha256(PAYLOAD).hexdigest()
+
+    def test_download_moved_to_destination(self, manager, file_server, tmp_path):
+        """Test that a finished download is moved to the requested destination."""
+        destination = tmp_path / "packages" / "package.bin"
+        manager.start_download("pkg", file_server, destination=destination)
+        manager.get_download_status("pkg").future.result(timeout=10)
+
+        job = manager.get_download_status("pkg")
+        assert job.status == "completed"
+        assert destination.read_bytes() == PAYLOAD
+        assert not job.temp_file.exists()
@@ -0,0 +1,149 @@
+"""
+Unit tests for GitHub repository installation helpers in arjax.
+"""
+
+import subprocess
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from arjax.integrations.github import (
+    CMakeHandler,
+    NodeJSHandler,
+    ProjectTypeRegistry,
+    install_many_from_github,
+    validate_github_url,
+)
+
+
+@pytest.fixture
+def registry():
+    """Registry with the built-in project type handlers."""
+    return ProjectTypeRegistry()
+
+
+class TestProjectDetection:
+    """Tests for project type detection from repository contents."""
+
+    @pytest.mark.parametrize("files, expected", [
+        (["pyproject.toml"], "Python"),
+        (["package.json", "Makefile"], "Node.js"),
+        (["yarn.lock"], None),
+        (["CMakeLists.txt", "Makefile"], "CMake"),
+        (["makefile"], "Makefile"),
+        (["main.go"], "Go"),
+        (["main.go", "Cargo.toml"], "Go"),
+        (["main.go", "Makefile"], "Makefile"),
+        (["Cargo.toml"], "Rust"),
+        (["README.md"], None),
+    ])
+    def test_detect_project_type(self, registry, tmp_path, files, expected):
+        """Test that the first matching handler is picked from top-level files."""
+        for name in files:
+            (tmp_path / name).touch()
+
+        handler = registry.detect_project_type(tmp_path)
+        assert (handler.name if handler else None) == expected
+
+
+class TestValidateGithubUrl:
+    """Tests for GitHub repository spec validation."""
+
+    @pytest.mark.parametrize("spec, expected", [
+        ("github:user/repo", "https://github.com/user/repo.git"),
+        ("github:user/repo.git", "https://github.com/user/repo.git"),
+        ("https://github.com/user/repo", "https://github.com/user/repo.git"),
+        ("https://github.com/user/repo.git", "https://github.com/user/repo.git"),
+        ("https://github.com/user/repo/", "https://github.com/user/repo.git"),
+        ("git@github.com:user/repo.git", "git@github.com:user/repo.git"),
+        ("github:user", None),
+        ("https://github.com/user/repo/tree/main", None),
+        ("https://gitlab.com/user/repo", None),
+    ])
+    def test_validate(self, spec, expected):
+        """Test that supported specs map to a clone URL and others are rejected."""
+        assert validate_github_url(spec) == expected
+
+
+class TestNodeJSHandler:
+    """Tests for package.json inspection in the Node.js handler."""
+
+    def test_package_json_flags(self, tmp_path):
+        """Test build script and CLI detection from a parsed package.json."""
+        handler = NodeJSHandler()
+        (tmp_path / "package.json").write_text(
+            '{"name": "tool", "bin": "cli.js", "scripts": {"build": "tsc"}}'
+        )
+
+        package_json = handler._load_package_json(tmp_path)
+        assert handler._has_build_script(package_json)
+        assert handler._is_cli_tool(package_json)
+
+    def test_invalid_package_json(self, tmp_path):
+        """Test that an unreadable package.json is treated as empty."""
+        handler = NodeJSHandler()
+        (tmp_path / "package.json").write_text("{not json")
+
+        package_json = handler._load_package_json(tmp_path)
+        assert package_json == {}
+        assert not handler._has_build_script(package_json)
+        assert not handler._is_cli_tool(package_json)
+
+
+class TestInstallMany:
+    """Tests for installing several repositories at once."""
+
+    def test_results_per_spec(self):
+        """Test that each distinct spec is installed once with a shared lock."""
+        calls = []
+
+        def fake_install(spec, install_lock=None):
+            calls.append((spec, install_lock))
+            return spec != "github:bad/repo"
+
+        with patch("arjax.integrations.github.install_from_github", side_effect=fake_install):
+            results = install_many_from_github(
+                ["github:a/one", "github:bad/repo", "github:a/one"]
+            )
+
+        assert results == {"github:a/one": True, "github:bad/repo": False}
+        assert len(calls) == 2
+        assert calls[0][1] is not None and calls[0][1] is calls[1][1]
+
+    def test_builds_overlap_and_installs_do_not(self, tmp_path):
+        """Test that two CMake builds run concurrently while their install steps are serialized."""
+        running = {"build": 0, "install": 0}
+        peak = {"build": 0, "install": 0}
+        counter_lock = threading.Lock()
+
+        def fake_run(argv, **kwargs):
+            phase = "install" if "install" in argv else "build"
+            with counter_lock:
+                running[phase] += 1
+                peak[phase] = max(peak[phase], running[phase])
+            time.sleep(0.1)
+            with counter_lock:
+                running[phase] -= 1
+            return subprocess.CompletedProcess(argv, 0, stdout="", stderr="")
+
+        install_lock = threading.Lock()
+
+        def install(repo_path):
+            handler = CMakeHandler()
+            handler.install_lock = install_lock
+            return handler.build_and_install(repo_path, tmp_path)
+
+        repos = [tmp_path / "one", tmp_path / "two"]
+        for repo in repos:
+            repo.mkdir()
+        with patch("arjax.integrations.github.subprocess.run", side_effect=fake_run), \
+                patch("arjax.integrations.github.shutil.which", return_value=None):
+            threads = [threading.Thread(target=install, args=(repo,)) for repo in repos]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert peak == {"build": 2, "install": 1}
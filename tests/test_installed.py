@@ -0,0 +1,140 @@
+"""
+Unit tests for installed package tracking in arjax.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from arjax.package_management.installed import InstalledAppsManager, InstalledPackage
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Installed apps manager rooted in a temporary home directory."""
+    with patch.object(Path, "home", return_value=tmp_path):
+        yield InstalledAppsManager()
+
+
+class TestInstalledCache:
+    """Tests for the in-process installed.json cache."""
+
+    def test_reads_reuse_cached_data(self, manager):
+        """Test that reads after a save do not re-parse the file."""
+        manager.add_package(InstalledPackage(name="foo", version="1.0", source="pacman"))
+
+        with patch("builtins.open", side_effect=AssertionError("installed.json re-read")):
+            assert manager.get_package("foo").version == "1.0"
+            assert manager.get_stats()["total_packages"] == 1
+
+    def test_external_change_is_picked_up(self, manager):
+        """Test that a file rewritten by another process invalidates the cache."""
+        manager.add_package(InstalledPackage(name="foo", source="pacman"))
+        manager.get_all_packages()
+
+        data = json.loads(manager.installed_file.read_text(encoding="utf-8"))
+        data["bar"] = dict(data["foo"], name="bar")
+        manager.installed_file.write_text(json.dumps(data), encoding="utf-8")
+        stat = manager.installed_file.stat()
+        os.utime(manager.installed_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert {pkg.name for pkg in manager.get_all_packages()} == {"foo", "bar"}
+
+    def test_failed_save_keeps_cache(self, manager):
+        """Test that a failed write does not leave unsaved updates in the cache."""
+        manager.add_package(InstalledPackage(name="foo", version="1.0", source="pacman"))
+
+        with patch("builtins.open", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                manager.update_package_info("foo", version="2.0")
+
+        assert manager.get_package("foo").version == "1.0"
+
+
+class TestUpdateQueries:
+    """Tests for the update-related package queries."""
+
+    def test_needing_update_check_skips_recent(self, manager):
+        """Test that only stale or never-checked packages need an update check."""
+        manager.add_package(InstalledPackage(name="fresh", source="pacman"))
+        manager.update_package_info("fresh")
+        manager.add_package(InstalledPackage(
+            name="stale", source="pacman", last_update_check=time.time() - 25 * 3600
+        ))
+        manager.add_package(InstalledPackage(name="never", source="pacman"))
+
+        names = {pkg.name for pkg in manager.get_packages_needing_update_check()}
+        assert names == {"stale", "never"}
+
+    def test_packages_with_updates(self, manager):
+        """Test that only packages flagged with an update are returned."""
+        manager.add_package(InstalledPackage(name="foo", source="pacman"))
+        manager.add_package(InstalledPackage(name="bar", source="pacman"))
+        manager.mark_update_available("bar", "2.0")
+
+        assert [pkg.name for pkg in manager.get_packages_with_updates()] == ["bar"]
+
+    def test_legacy_iso_timestamps(self, manager):
+        """Test that ISO timestamps from older files are read as epoch seconds."""
+        manager.installed_file.write_text(json.dumps({
+            "foo": {
+                "name": "foo",
+                "source": "pacman",
+                "install_date": "2024-01-01T00:00:00+00:00",
+                "last_update_check": "2024-01-02T00:00:00Z",
+            }
+        }), encoding="utf-8")
+
+        pkg = manager.get_package("foo")
+        assert pkg.install_date == 1704067200.0
+        assert pkg.last_update_check == 1704153600.0
+        assert [p.name for p in manager.get_packages_needing_update_check()] == ["foo"]
+
+    def test_bulk_update_saves_once(self, manager):
+        """Test that updating several packages rewrites installed.json once."""
+        manager.add_package(InstalledPackage(name="foo", source="pacman"))
+        manager.add_package(InstalledPackage(name="bar", source="pacman"))
+
+        with patch.object(manager, "_atomic_write", wraps=manager._atomic_write) as write:
+            updated = manager.update_packages_info({
+                "foo": {"update_available": True, "available_version": "2.0"},
+                "bar": {"update_available": False},
+                "missing": {"update_available": True},
+            })
+
+        assert updated == 2
+        assert write.call_count == 1
+        assert [pkg.name for pkg in manager.get_packages_with_updates()] == ["foo"]
+
+
+class TestInstalledBatch:
+    """Tests for batched installed.json writes."""
+
+    def test_batch_writes_once(self, manager):
+        """Test that several changes inside a batch are saved in a single write."""
+        with patch.object(manager, "_atomic_write", wraps=manager._atomic_write) as write:
+            with manager.batch():
+                manager.add_package(InstalledPackage(name="foo", source="pacman"))
+                manager.add_package(InstalledPackage(name="bar", source="aur"))
+                manager.remove_package("foo")
+                assert write.call_count == 0
+                assert manager.get_package("bar") is not None
+
+        assert write.call_count == 1
+        saved = json.loads(manager.installed_file.read_text(encoding="utf-8"))
+        assert list(saved) == ["bar"]
+
+    def test_failed_batch_discards_changes(self, manager):
+        """Test that an exception inside a batch leaves the file and cache untouched."""
+        manager.add_package(InstalledPackage(name="foo", source="pacman"))
+
+        with pytest.raises(RuntimeError):
+            with manager.batch():
+                manager.add_package(InstalledPackage(name="bar", source="aur"))
+                raise RuntimeError("abort")
+
+        assert [pkg.name for pkg in manager.get_all_packages()] == ["foo"]
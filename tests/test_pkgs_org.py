@@ -0,0 +1,423 @@
+"""
+Unit tests for the pkgs.org client in arjax.
+"""
+
+import gc
+import threading
+import time
+import weakref
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from arjax.integrations import pkgs_org
+from arjax.integrations.pkgs_org import PkgsOrgClient, get_default_client
+
+SEARCH_HTML = b"""
+<html><body>
+<div class="result"><a href="/download/ubuntu/vim.html">vim</a><small>Vi IMproved</small></div>
+<div class="repo">Ubuntu 22.04 main</div>
+<div class="result"><a href="/package/neovim">neovim</a></div>
+<div class="result"><a href="/download/ubuntu/vim.html">vim</a></div>
+<div class="nav"><a href="/about">About</a></div>
+</body></html>
+"""
+
+
+@pytest.fixture
+def client(tmp_path):
+    """Client with a temporary cache file and no request throttling."""
+    return PkgsOrgClient(cache_file=str(tmp_path / "cache.json"), min_request_interval=0)
+
+
+def fake_response(content, status_code=200, headers=None):
+    """Minimal stand-in for a requests.Response."""
+    resp = MagicMock()
+    resp.status_code = status_code
+    resp.content = content
+    resp.headers = headers or {}
+    return resp
+
+
+class TestHtmlSearch:
+    """Tests for the HTML search fallback."""
+
+    def test_extracts_package_links(self, client):
+        """Test that package links are extracted once with nearby summary and repo text."""
+        client.session.get = MagicMock(return_value=fake_response(SEARCH_HTML))
+
+        results = client._search_html("vim", distro=None, limit=10)
+
+        assert [r["name"] for r in results] == ["vim", "neovim"]
+        assert results[0]["url"] == "https://pkgs.org/download/ubuntu/vim.html"
+        assert results[0]["summary"] == "Vi IMproved"
+        assert results[0]["repo"] == "Ubuntu 22.04 main"
+        assert results[1]["url"] == "https://pkgs.org/package/neovim"
+
+    def test_request_url(self, client):
+        """Test that the query and distro are URL-quoted into the search URL."""
+        client.session.get = MagicMock(return_value=fake_response(SEARCH_HTML))
+        client._search_html("gtk+ 3", distro="ubuntu 22.04", limit=10)
+
+        assert client.session.get.call_args.args[0] == "https://pkgs.org/search/?q=gtk%2B+3&on=ubuntu+22.04"
+
+    def test_respects_limit(self, client):
+        """Test that extraction stops once the limit is reached."""
+        client.session.get = MagicMock(return_value=fake_response(SEARCH_HTML))
+
+        assert len(client._search_html("vim", distro=None, limit=1)) == 1
+
+
+TABLE_HTML = b"""
+<html><body><table>
+<tr><th>Package</th><th>Repository</th></tr>
+<tr><td><a href="/pkg/vim">vim</a></td><td>Debian <b>main</b></td></tr>
+<tr><td>no link</td><td>Arch</td></tr>
+<tr><td><a href="/pkg/gvim">g<!-- x -->vim</a></td><td>Fedora</td></tr>
+<tr><td colspan="2"><a href="/pkg/more">More results</a></td></tr>
+</table></body></html>
+"""
+
+
+def _parsers():
+    """Available search-page parsers: always BeautifulSoup, lxml when installed."""
+    parsers = [pytest.param(pkgs_org._parse_search_soup, id="soup")]
+    if pkgs_org.lxml_html is not None:
+        parsers.append(pytest.param(pkgs_org._parse_search_lxml, id="lxml"))
+    return parsers
+
+
+class TestSearchPageParsers:
+    """Tests that every search-page parser extracts the same results."""
+
+    @pytest.mark.parametrize("parse", _parsers())
+    def test_links(self, parse):
+        """Test package link extraction with summary and repo text."""
+        results = parse(SEARCH_HTML, 10)
+
+        assert [(r["name"], r["summary"], r["repo"]) for r in results] == [
+            ("vim", "Vi IMproved", "Ubuntu 22.04 main"),
+            ("neovim", "", "vim"),
+        ]
+
+    @pytest.mark.parametrize("parse", _parsers())
+    def test_table_fallback(self, parse):
+        """Test that table rows are used when no package links are found."""
+        results = parse(TABLE_HTML, 10)
+
+        assert [(r["name"], r["url"], r["repo"]) for r in results] == [
+            ("vim", "https://pkgs.org/pkg/vim", "Debian main"),
+            ("gvim", "https://pkgs.org/pkg/gvim", "Fedora"),
+        ]
+
+
+class TestDefaultClient:
+    """Tests for the shared process-wide client."""
+
+    def test_default_client_is_shared(self):
+        """Test that the default client is created once and then reused."""
+        with patch.object(pkgs_org, "_DEFAULT_CLIENT", None), \
+                patch.object(pkgs_org, "PkgsOrgClient") as factory:
+            first = get_default_client()
+            second = get_default_client()
+
+        assert first is second
+        factory.assert_called_once_with()
+
+
+class TestDiskCache:
+    """Tests for the file-backed TTL cache."""
+
+    def test_expired_get_does_not_rewrite(self, tmp_path):
+        """Test that reading an expired entry misses without touching the file."""
+        cache = pkgs_org.DiskCache(str(tmp_path / "cache.json"))
+        cache.set("old", ["x"], ttl=-1)
+        cache.set("new", ["y"], ttl=60)
+
+        with patch.object(cache, "_save") as save:
+            assert cache.get("old") is None
+            assert cache.get("new") == ["y"]
+        save.assert_not_called()
+
+    def test_expired_lookups_compact_in_bulk(self, tmp_path, monkeypatch):
+        """Test that expired entries are dropped in memory after enough misses and saved at exit."""
+        monkeypatch.setattr(pkgs_org, "EXPIRED_COMPACT_THRESHOLD", 2)
+        path = tmp_path / "cache.json"
+        cache = pkgs_org.DiskCache(str(path))
+        cache.set("new", ["y"], ttl=60)
+        cache._data["old"] = {"value": ["x"], "expires_at": 0}
+
+        with patch.object(cache, "_save", wraps=cache._save) as save:
+            for _ in range(2):
+                assert cache.get("old") is None
+            assert "old" in cache._data
+            assert cache.get("old") is None
+            save.assert_not_called()
+        assert "old" not in cache._data
+
+        cache._save_if_dirty()
+        assert list(pkgs_org.DiskCache(str(path))._data) == ["new"]
+
+    def test_compaction_without_pruning_stays_clean(self, tmp_path):
+        """Test that compacting a cache with nothing to drop does not schedule a rewrite."""
+        cache = pkgs_org.DiskCache(str(tmp_path / "cache.json"))
+        cache.set("new", ["y"], ttl=60)
+        cache._compact(time.time())
+
+        assert cache._dirty is False
+
+    def test_exit_flush_does_not_keep_caches_alive(self, tmp_path):
+        """Test that caches are flushed at exit without being kept alive until then."""
+        path = tmp_path / "cache.json"
+        cache = pkgs_org.DiskCache(str(path))
+        cache._data["old"] = {"value": ["x"], "expires_at": 0}
+        cache._compact(time.time())
+        pkgs_org._flush_caches()
+        assert path.exists()
+
+        ref = weakref.ref(pkgs_org.DiskCache(str(path)))
+        gc.collect()
+        assert ref() is None
+
+    def test_vacuum_drops_expired(self, tmp_path):
+        """Test that vacuum() removes expired entries from the file."""
+        path = tmp_path / "cache.json"
+        cache = pkgs_org.DiskCache(str(path))
+        cache._data["old"] = {"value": ["x"], "expires_at": 0}
+        cache.set("new", ["y"], ttl=60)
+        cache.vacuum()
+
+        assert list(pkgs_org.DiskCache(str(path))._data) == ["new"]
+
+    def test_expired_entries_with_validators_are_kept(self, tmp_path):
+        """Test that pruning keeps expired entries that can still be revalidated."""
+        path = tmp_path / "cache.json"
+        cache = pkgs_org.DiskCache(str(path))
+        cache._data["plain"] = {"value": ["x"], "expires_at": time.time() - 60}
+        cache._data["tagged"] = {"value": ["y"], "expires_at": time.time() - 60, "etag": '"v1"'}
+        cache.vacuum()
+
+        assert list(pkgs_org.DiskCache(str(path))._data) == ["tagged"]
+
+    def test_round_trip_keeps_unicode(self, tmp_path):
+        """Test that cached values survive a save and reload as compact UTF-8."""
+        path = tmp_path / "cache.json"
+        value = [{"name": "vim", "summary": "Vi IMproved – éditeur"}]
+        pkgs_org.DiskCache(str(path)).set("k", value, ttl=60)
+        assert pkgs_org.DiskCache(str(path)).get("k") == value
+
+        pkgs_org.DiskCache(str(path)).vacuum()
+        assert pkgs_org.DiskCache(str(path)).get("k") == value
+        assert "éditeur" in path.read_text(encoding="utf-8")
+        assert "\n" not in path.read_text(encoding="utf-8")
+
+
+    def test_set_appends_without_rewrite(self, tmp_path):
+        """Test that set() appends to the journal instead of rewriting the cache file."""
+        path = tmp_path / "cache.json"
+        cache = pkgs_org.DiskCache(str(path))
+        with patch.object(cache, "_save") as save:
+            for i in range(10):
+                cache.set(f"k{i}", [i], ttl=60)
+        save.assert_not_called()
+
+        assert not path.exists()
+        assert pkgs_org.DiskCache(str(path)).get("k9") == [9]
+
+    def test_journal_is_folded_into_file(self, tmp_path, monkeypatch):
+        """Test that a long journal is folded into the cache file and removed."""
+        monkeypatch.setattr(pkgs_org, "JOURNAL_COMPACT_THRESHOLD", 3)
+        path = tmp_path / "cache.json"
+        cache = pkgs_org.DiskCache(str(path))
+        for i in range(4):
+            cache.set(f"k{i}", [i], ttl=60)
+
+        assert not (tmp_path / "cache.json.log").exists()
+        assert sorted(pkgs_org.DiskCache(str(path))._data) == ["k0", "k1", "k2", "k3"]
+
+    def test_torn_journal_record_is_skipped(self, tmp_path):
+        """Test that a partially written last journal line does not lose earlier records."""
+        path = tmp_path / "cache.json"
+        pkgs_org.DiskCache(str(path)).set("k", ["v"], ttl=60)
+        with open(tmp_path / "cache.json.log", "ab") as f:
+            f.write(b'["k2", {"value": [')
+
+        assert pkgs_org.DiskCache(str(path)).get("k") == ["v"]
+
+
+class TestSearchFallback:
+    """Tests for combining the JSON endpoint with the HTML fallback."""
+
+    def test_json_results_preferred(self, client):
+        """Test that non-empty JSON results win over the HTML fallback."""
+        client._search_json = MagicMock(return_value=[{"name": "vim"}])
+        client._search_html = MagicMock(return_value=[{"name": "other"}])
+
+        assert client.search("vim") == [{"name": "vim"}]
+
+    def test_fast_json_skips_html(self, client):
+        """Test that the HTML page is not requested when JSON answers within its head start."""
+        client._search_json = MagicMock(return_value=[{"name": "vim"}])
+        client._search_html = MagicMock(return_value=[{"name": "other"}])
+        client.search("vim")
+
+        client._search_html.assert_not_called()
+
+    def test_failed_json_falls_back_to_html(self, client):
+        """Test that a failing JSON request is followed by the HTML fallback."""
+        client._search_json = MagicMock(side_effect=RuntimeError("JSON endpoint returned status 503"))
+        client._search_html = MagicMock(return_value=[{"name": "vim"}])
+
+        assert client.search("vim") == [{"name": "vim"}]
+        client._search_html.assert_called_once()
+
+    def test_html_overlaps_slow_json(self, client, monkeypatch):
+        """Test that the HTML request starts once the JSON head start has run out."""
+        monkeypatch.setattr(pkgs_org, "HTML_HEAD_START", 0.1)
+
+        def slow_json(*args, **kwargs):
+            time.sleep(0.4)
+            raise RuntimeError("JSON endpoint returned status 503")
+
+        def slow_html(*args, **kwargs):
+            time.sleep(0.4)
+            return [{"name": "vim"}]
+
+        client._search_json = slow_json
+        client._search_html = slow_html
+
+        start = time.monotonic()
+        assert client.search("vim") == [{"name": "vim"}]
+        assert time.monotonic() - start < 0.75
+        assert client.search("vim") == [{"name": "vim"}]  # served from cache
+
+    def test_requests_run_on_daemon_threads(self, client, monkeypatch):
+        """Test that in-flight requests never hold up interpreter exit."""
+        monkeypatch.setattr(pkgs_org, "HTML_HEAD_START", 0)
+        daemon = []
+
+        def record(*args, **kwargs):
+            daemon.append(threading.current_thread().daemon)
+            time.sleep(0.1)
+            return []
+
+        client._search_json = record
+        client._search_html = record
+        client.search("vim")
+
+        assert daemon == [True, True]
+
+
+class TestMemoryCache:
+    """Tests for the in-memory tier in front of the disk cache."""
+
+    def test_repeat_search_skips_disk_cache(self, client):
+        """Test that a repeated search is answered without touching the disk cache."""
+        client._search_json = MagicMock(return_value=[{"name": "vim"}])
+        client._search_html = MagicMock(return_value=[])
+        client.search("vim")
+
+        with patch.object(client.cache, "get_record", side_effect=AssertionError("disk lookup")):
+            assert client.search("vim") == [{"name": "vim"}]
+
+    def test_expired_entry_is_refetched(self, client):
+        """Test that memory entries honour the cache TTL."""
+        client.ttl = -1
+        client._search_json = MagicMock(return_value=[{"name": "vim"}])
+        client._search_html = MagicMock(return_value=[])
+        client.search("vim")
+        client.search("vim")
+
+        assert client._search_json.call_count == 2
+
+    def test_size_is_bounded(self, client, monkeypatch):
+        """Test that the oldest searches are evicted once the tier is full."""
+        monkeypatch.setattr(pkgs_org, "MEM_CACHE_SIZE", 2)
+        client._search_json = MagicMock(return_value=[{"name": "x"}])
+        client._search_html = MagicMock(return_value=[])
+        for query in ("a", "b", "c"):
+            client.search(query)
+
+        assert [key[0] for key in client._mem_cache] == ["b", "c"]
+
+
+class TestConditionalRequests:
+    """Tests for ETag/Last-Modified revalidation of expired cache entries."""
+
+    def test_stores_validators_from_response(self, client):
+        """Test that a fresh response's validators are saved with the results."""
+        headers = {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}
+        client.session.get = MagicMock(return_value=fake_response(SEARCH_HTML, headers=headers))
+        client._search_json = MagicMock(side_effect=RuntimeError("JSON endpoint returned status 503"))
+        client.search("vim")
+
+        rec = next(iter(client.cache._data.values()))
+        assert rec["etag"] == '"v1"'
+        assert rec["last_modified"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+        assert rec["source"] == "html"
+
+    def test_not_modified_reuses_expired_value(self, client):
+        """Test that a 304 answer refreshes and returns the expired cached value."""
+        key = client._cache_key_for_search("vim", None, 20)
+        client.cache._data[key] = {"value": [{"name": "vim"}], "expires_at": 0, "etag": '"v1"', "source": "html"}
+        client._search_json = MagicMock(side_effect=RuntimeError("JSON endpoint returned status 503"))
+        client.session.get = MagicMock(return_value=fake_response(b"", status_code=304))
+
+        assert client.search("vim") == [{"name": "vim"}]
+        assert client.session.get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+        assert client.cache.get(key) == [{"name": "vim"}]
+        assert client.cache.get_stale(key)["etag"] == '"v1"'
+
+
+class TestThrottle:
+    """Tests for polite request spacing."""
+
+    def test_first_request_is_not_delayed(self, tmp_path):
+        """Test that a new client never sleeps before its first request."""
+        client = PkgsOrgClient(cache_file=str(tmp_path / "cache.json"), min_request_interval=60)
+        with patch.object(pkgs_org.time, "sleep") as sleep:
+            client._throttle()
+        sleep.assert_not_called()
+
+    def test_spacing_ignores_wall_clock(self, client):
+        """Test that request spacing uses the monotonic clock, not time.time()."""
+        client._min_request_interval = 60
+        client._last_request = time.monotonic()
+        with patch.object(pkgs_org.time, "time", return_value=time.time() + 3600), \
+                patch.object(pkgs_org.time, "sleep") as sleep:
+            client._throttle()
+        assert sleep.call_count == 1
+
+    def test_concurrent_requests_are_spaced(self, client):
+        """Test that requests from several threads still respect the interval."""
+        client._min_request_interval = 0.1
+        threads = [threading.Thread(target=client._throttle) for _ in range(3)]
+        start = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert time.monotonic() - start >= 0.2
+
+
+class TestTransport:
+    """Tests for the HTTP client used by PkgsOrgClient."""
+
+    def test_retries_retryable_statuses(self, client):
+        """Test that statuses urllib3 would retry are retried when httpx is in use."""
+        client._retry_statuses = True
+        client.session.get = MagicMock(side_effect=[
+            fake_response(b"", status_code=503),
+            fake_response(SEARCH_HTML),
+        ])
+        with patch.object(pkgs_org.time, "sleep"):
+            resp = client._get("https://pkgs.org/search/?q=vim")
+
+        assert resp.status_code == 200
+        assert client.session.get.call_count == 2
+
+    @pytest.mark.skipif(not pkgs_org.HAS_HTTP2, reason="httpx with HTTP/2 support not installed")
+    def test_uses_http2_client(self, client):
+        """Test that an httpx client is used when HTTP/2 support is installed."""
+        assert isinstance(client.session, pkgs_org.httpx.Client)
@@ -0,0 +1,142 @@
+"""
+Unit tests for DNF search output parsing in arjax.
+"""
+
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from arjax.core.exceptions import PackageManagerNotFound, PackageSearchException, TimeoutError
+from arjax.search import dnf
+from arjax.search.dnf import search_dnf
+from arjax.search.process import CommandStream
+
+DNF_OUTPUT = """\
+Last metadata expiration check: 0:12:01 ago on Mon 01 Jan 2024.
+======================== Name Exactly Matched: vim ========================
+vim-enhanced.x86_64 : A version of the VIM editor which includes recent enhancements
+vim-common.noarch : The common files needed by any version of the VIM editor
+neovim.aarch64\tVim-fork focused on extensibility
+python3.11-vim.s390x : Python bindings for Vim
+vim-plugin.1.2 : A name with dots but no architecture
+vim-minimal  A minimal version of the VIM editor
+Warning: some repositories were skipped
+Error: Failed to download metadata for repo 'updates'
+last : A package that is really named last
+"""
+
+
+def fake_run(args, **kwargs):
+    """Stand-in for subprocess.run answering dnf --version."""
+    return subprocess.CompletedProcess(args, 0, stdout="4.18.0", stderr="")
+
+
+def fake_stream(output, returncode=0, stderr=""):
+    """Build a CommandStream factory that prints canned dnf output instead of running dnf."""
+    script = (
+        "import sys; sys.stdout.write(sys.argv[1]); sys.stderr.write(sys.argv[2]); "
+        "sys.exit(int(sys.argv[3]))"
+    )
+
+    def factory(args, timeout):
+        return CommandStream([sys.executable, "-c", script, output, stderr, str(returncode)], timeout)
+
+    return factory
+
+
+@pytest.fixture(autouse=True)
+def reset_dnf_probe(monkeypatch):
+    """Forget the cached dnf availability probe between tests."""
+    monkeypatch.setattr(dnf, "_DNF_AVAILABLE", None)
+    monkeypatch.setattr(dnf, "_DNF_PROBE_ERROR", None)
+
+
+class TestSearchDnf:
+    """Tests for parsing dnf search output."""
+
+    def test_parses_classic_and_dnf5_lines(self):
+        """Test that all package line formats are parsed and meta lines skipped."""
+        with patch("arjax.search.dnf.subprocess.run", side_effect=fake_run), \
+                patch("arjax.search.dnf.CommandStream", side_effect=fake_stream(DNF_OUTPUT)):
+            results = search_dnf("vim")
+
+        assert results == [
+            ("vim-enhanced", "A version of the VIM editor which includes recent enhancements", "dnf"),
+            ("vim-common", "The common files needed by any version of the VIM editor", "dnf"),
+            ("neovim", "Vim-fork focused on extensibility", "dnf"),
+            ("python3.11-vim", "Python bindings for Vim", "dnf"),
+            ("vim-plugin.1.2", "A name with dots but no architecture", "dnf"),
+            ("vim-minimal", "A minimal version of the VIM editor", "dnf"),
+            ("last", "A package that is really named last", "dnf"),
+        ]
+
+    def test_max_results_stops_early(self):
+        """Test that parsing stops at max_results and the cut-short run is not an error."""
+        script = "import itertools\nfor i in itertools.count(): print(f'pkg{i}.noarch : Package {i}', flush=True)"
+
+        def endless(args, timeout):
+            return CommandStream([sys.executable, "-c", script], timeout)
+
+        with patch("arjax.search.dnf.subprocess.run", side_effect=fake_run), \
+                patch("arjax.search.dnf.CommandStream", side_effect=endless):
+            results = search_dnf("pkg", max_results=2)
+
+        assert results == [("pkg0", "Package 0", "dnf"), ("pkg1", "Package 1", "dnf")]
+
+    def test_no_matches_exit_code(self):
+        """Test that dnf's 'no matches' exit code yields an empty result."""
+        with patch("arjax.search.dnf.subprocess.run", side_effect=fake_run), \
+                patch("arjax.search.dnf.CommandStream", side_effect=fake_stream("", returncode=1)):
+            assert search_dnf("nothing") == []
+
+    def test_error_uses_stderr(self):
+        """Test that a failing dnf search is reported with its stderr message."""
+        stream = fake_stream("", returncode=2, stderr="Error: Cache disabled")
+        with patch("arjax.search.dnf.subprocess.run", side_effect=fake_run), \
+                patch("arjax.search.dnf.CommandStream", side_effect=stream):
+            with pytest.raises(PackageSearchException, match="makecache"):
+                search_dnf("vim")
+
+    def test_completion_logged_once(self, caplog):
+        """Test that the completion summary is logged a single time."""
+        caplog.set_level("INFO", logger="arjax.search.dnf")
+        with patch("arjax.search.dnf.subprocess.run", side_effect=fake_run), \
+                patch("arjax.search.dnf.CommandStream", side_effect=fake_stream(DNF_OUTPUT)):
+            search_dnf("vim")
+
+        completed = [r for r in caplog.records if r.getMessage().startswith("DNF search completed:")]
+        assert len(completed) == 1
+
+
+class TestDnfProbe:
+    """Tests for the process-wide dnf availability probe."""
+
+    def test_probe_runs_once(self):
+        """Test that dnf --version is only run for the first search."""
+        with patch("arjax.search.dnf.subprocess.run", side_effect=fake_run) as run, \
+                patch("arjax.search.dnf.CommandStream", side_effect=fake_stream(DNF_OUTPUT)):
+            search_dnf("vim")
+            search_dnf("vim")
+
+        assert run.call_count == 1
+
+    def test_missing_dnf_is_remembered(self):
+        """Test that a missing dnf is reported again without re-probing."""
+        with patch("arjax.search.dnf.subprocess.run", side_effect=FileNotFoundError) as run:
+            for _ in range(2):
+                with pytest.raises(PackageManagerNotFound):
+                    search_dnf("vim")
+
+        assert run.call_count == 1
+
+    def test_timeout_is_not_remembered(self):
+        """Test that a probe timeout is retried on the next search."""
+        timeout = subprocess.TimeoutExpired(["dnf", "--version"], 5)
+        with patch("arjax.search.dnf.subprocess.run", side_effect=[timeout, timeout]) as run:
+            for _ in range(2):
+                with pytest.raises(TimeoutError):
+                    search_dnf("vim")
+
+        assert run.call_count == 2
@@ -0,0 +1,59 @@
+"""
+Unit tests for the streaming subprocess helper used by search backends.
+"""
+
+import subprocess
+import sys
+import time
+
+import pytest
+
+from arjax.search.process import CommandStream
+
+
+def python_cmd(code):
+    """Command running a snippet of Python in a fresh interpreter."""
+    return [sys.executable, "-c", code]
+
+
+class TestCommandStream:
+    """Tests for CommandStream."""
+
+    def test_yields_lines_and_returncode(self):
+        """Test that stdout lines are yielded without newlines and the exit code is kept."""
+        code = "import sys; print('a'); print('b'); sys.stderr.write('oops'); sys.exit(3)"
+        with CommandStream(python_cmd(code), timeout=10) as stream:
+            assert list(stream) == ["a", "b"]
+            assert stream.returncode == 3
+            assert stream.stderr == "oops"
+        assert not stream.stopped_early
+
+    def test_early_exit_terminates(self):
+        """Test that leaving the block early stops a command that is still producing output."""
+        code = "import itertools\nfor i in itertools.count(): print(i, flush=True)"
+        start = time.monotonic()
+        with CommandStream(python_cmd(code), timeout=30) as stream:
+            for line in stream:
+                if line == "5":
+                    break
+
+        assert stream.stopped_early
+        assert time.monotonic() - start < 10
+
+    def test_timeout(self):
+        """Test that a command running past its timeout is killed and reported."""
+        code = "import time; print('start', flush=True); time.sleep(30)"
+        with pytest.raises(subprocess.TimeoutExpired):
+            with CommandStream(python_cmd(code), timeout=0.5) as stream:
+                list(stream)
+
+    def test_missing_command(self):
+        """Test that a missing executable raises FileNotFoundError like subprocess.run."""
+        with pytest.raises(FileNotFoundError):
+            CommandStream(["arjax-definitely-missing-command"], timeout=1)
+
+    def test_invalid_utf8_is_replaced(self):
+        """Test that undecodable output bytes are replaced instead of raising."""
+        code = r"import sys; sys.stdout.buffer.write(b'caf\xe9\nok\n')"
+        with CommandStream(python_cmd(code), timeout=10) as stream:
+            assert list(stream) == ["caf\ufffd", "ok"]
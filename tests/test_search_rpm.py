@@ -0,0 +1,95 @@
+"""
+Unit tests for RPM search output parsing in arjax.
+"""
+
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from arjax.search.process import CommandStream
+from arjax.search.rpm import search_rpm
+
+RPM_OUTPUT = "vim-enhanced\t9.0\tA version of the VIM editor\nvim-common\t9.0\tCommon files\twith a tab\n"
+YUM_OUTPUT = """\
+Last metadata expiration check: 0:01:00 ago.
+===================== N/S Matched: vim =====================
+gvim.x86_64 : The VIM version of the vi editor for the X Window System
+vim-X11.x86_64 : The VIM version with X support
+"""
+REPOQUERY_OUTPUT = (
+    "vim-enhanced\t9.0\tA version of the VIM editor\t@System\n\n"
+    "gvim\t9.1\tThe VIM version of the vi editor\tfedora\n\n"
+)
+
+
+def fake_streams(outputs):
+    """CommandStream factory printing canned output per command name instead of running it."""
+    def factory(args, timeout):
+        code = "import sys; sys.stdout.write(sys.argv[1])"
+        return CommandStream([sys.executable, "-c", code, outputs[args[0]]], timeout)
+
+    return factory
+
+
+@pytest.fixture
+def no_dnf():
+    """Pretend dnf is not installed so the rpm/yum path is used."""
+    with patch("arjax.search.rpm.shutil.which", return_value=None):
+        yield
+
+
+@pytest.mark.usefixtures("no_dnf")
+class TestSearchRpm:
+    """Tests for combining rpm and yum search results."""
+
+    def test_installed_then_available(self):
+        """Test that installed packages come first and yum fills up to the limit."""
+        streams = fake_streams({"rpm": RPM_OUTPUT, "yum": YUM_OUTPUT})
+        with patch("arjax.search.rpm.CommandStream", side_effect=streams):
+            results = search_rpm("vim", limit=3)
+
+        assert results == [
+            ("vim-enhanced", "A version of the VIM editor (v9.0)", "RPM (Installed)"),
+            ("vim-common", "Common files\twith a tab (v9.0)", "RPM (Installed)"),
+            ("gvim.x86_64", "The VIM version of the vi editor for the X Window System", "RPM (Available)"),
+        ]
+
+    def test_limit_reached_by_rpm_skips_yum(self):
+        """Test that yum is not run when rpm alone satisfies the limit."""
+        streams = fake_streams({"rpm": RPM_OUTPUT})
+        with patch("arjax.search.rpm.CommandStream", side_effect=streams) as factory:
+            results = search_rpm("vim", limit=1)
+
+        assert [r[0] for r in results] == ["vim-enhanced"]
+        assert factory.call_count == 1
+
+
+class TestSearchRepoquery:
+    """Tests for the single dnf repoquery search."""
+
+    def test_repoquery_replaces_rpm_and_yum(self):
+        """Test that one repoquery call labels installed and available packages."""
+        streams = fake_streams({"dnf": REPOQUERY_OUTPUT})
+        with patch("arjax.search.rpm.shutil.which", return_value="/usr/bin/dnf"), \
+                patch("arjax.search.rpm.CommandStream", side_effect=streams) as factory:
+            results = search_rpm("vim", limit=10)
+
+        assert results == [
+            ("vim-enhanced", "A version of the VIM editor (v9.0)", "RPM (Installed)"),
+            ("gvim", "The VIM version of the vi editor (v9.1)", "RPM (Available)"),
+        ]
+        assert factory.call_count == 1
+
+    def test_failed_repoquery_falls_back(self):
+        """Test that rpm and yum are used when dnf repoquery fails."""
+        def factory(args, timeout):
+            if args[0] == "dnf":
+                return CommandStream([sys.executable, "-c", "raise SystemExit(1)"], timeout)
+            return fake_streams({"rpm": RPM_OUTPUT, "yum": ""})(args, timeout)
+
+        with patch("arjax.search.rpm.shutil.which", return_value="/usr/bin/dnf"), \
+                patch("arjax.search.rpm.CommandStream", side_effect=factory):
+            results = search_rpm("vim", limit=10)
+
+        assert [r[0] for r in results] == ["vim-enhanced", "vim-common"]
@@ -0,0 +1,130 @@
+"""
+Unit tests for Zypper search in arjax.
+"""
+
+import subprocess
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from arjax.core.exceptions import PackageManagerNotFound, PackageSearchException, TimeoutError
+from arjax.search import zypper
+from arjax.search.process import CommandStream
+from arjax.search.zypper import search_zypper
+
+ZYPPER_OUTPUT = """\
+Loading repository data...
+Reading installed packages...
+
+S | Name        | Type    | Version   | Arch   | Repository
+--+-------------+---------+-----------+--------+-----------
+i | vim         | package | 9.0.1894  | x86_64 | Main
+v | vim-data    | package | 9.0.1894  | noarch | Main
+"""
+
+
+def fake_run(args, **kwargs):
+    """Stand-in for subprocess.run answering zypper --version."""
+    return subprocess.CompletedProcess(args, 0, stdout="zypper 1.14.68", stderr="")
+
+
+def fake_stream(output, returncode=0, stderr=""):
+    """Build a CommandStream factory that prints canned zypper output instead of running zypper."""
+    script = (
+        "import sys; sys.stdout.write(sys.argv[1]); sys.stderr.write(sys.argv[2]); "
+        "sys.exit(int(sys.argv[3]))"
+    )
+
+    def factory(args, timeout):
+        return CommandStream([sys.executable, "-c", script, output, stderr, str(returncode)], timeout)
+
+    return factory
+
+
+@pytest.fixture(autouse=True)
+def reset_zypper_probe():
+    """Forget the cached zypper availability probe between tests."""
+    zypper._zypper_probe.cache_clear()
+    yield
+    zypper._zypper_probe.cache_clear()
+
+
+class TestSearchZypper:
+    """Tests for parsing zypper search output."""
+
+    def test_parses_table(self):
+        """Test that package rows of the --details table are parsed."""
+        with patch("arjax.search.zypper.subprocess.run", side_effect=fake_run), \
+                patch("arjax.search.zypper.CommandStream", side_effect=fake_stream(ZYPPER_OUTPUT)):
+            results = search_zypper("vim")
+
+        assert [name for name, _, source in results] == ["vim", "vim-data"]
+        assert {source for _, _, source in results} == {"zypper"}
+
+    def test_empty_status_column(self):
+        """Test that rows for packages that are not installed keep their name."""
+        output = ZYPPER_OUTPUT + '  | "quoted"    | package | 1.0       | noarch | Main\n'
+        with patch("arjax.search.zypper.subprocess.run", side_effect=fake_run), \
+                patch("arjax.search.zypper.CommandStream", side_effect=fake_stream(output)):
+            results = search_zypper("vim")
+
+        assert [name for name, _, _ in results] == ["vim", "vim-data", '"quoted"']
+
+    def test_query_normalized_for_cache_and_command(self):
+        """Test that surrounding whitespace is stripped before caching and searching."""
+        cache = MagicMock()
+        cache.get.return_value = None
+        with patch("arjax.search.zypper.subprocess.run", side_effect=fake_run), \
+                patch("arjax.search.zypper.CommandStream", side_effect=fake_stream(ZYPPER_OUTPUT)) as stream:
+            results = search_zypper("  vim ", cache)
+
+        cache.get.assert_called_once_with("vim", "zypper")
+        cache.set.assert_called_once_with("vim", "zypper", results)
+        assert stream.call_args.args[0][-1] == "vim"
+
+    def test_no_matches_exit_code(self):
+        """Test that zypper's 'no matches' exit code yields an empty result."""
+        with patch("arjax.search.zypper.subprocess.run", side_effect=fake_run), \
+                patch("arjax.search.zypper.CommandStream", side_effect=fake_stream("", returncode=104)):
+            assert search_zypper("nothing") == []
+
+    def test_locked_error_uses_stderr(self):
+        """Test that a locked zypper is reported from its stderr message."""
+        stream = fake_stream("", returncode=7, stderr="System management is locked by PID 42")
+        with patch("arjax.search.zypper.subprocess.run", side_effect=fake_run), \
+                patch("arjax.search.zypper.CommandStream", side_effect=stream):
+            with pytest.raises(PackageSearchException, match="locked"):
+                search_zypper("vim")
+
+
+class TestZypperProbe:
+    """Tests for the process-wide zypper availability probe."""
+
+    def test_probe_runs_once(self):
+        """Test that zypper --version is only run for the first search."""
+        with patch("arjax.search.zypper.subprocess.run", side_effect=fake_run) as run, \
+                patch("arjax.search.zypper.CommandStream", side_effect=fake_stream(ZYPPER_OUTPUT)):
+            search_zypper("vim")
+            search_zypper("vim")
+
+        assert run.call_count == 1
+
+    def test_missing_zypper_is_remembered(self):
+        """Test that a missing zypper is reported again without re-probing."""
+        with patch("arjax.search.zypper.subprocess.run", side_effect=FileNotFoundError) as run:
+            for _ in range(2):
+                with pytest.raises(PackageManagerNotFound):
+                    search_zypper("vim")
+
+        assert run.call_count == 1
+
+    def test_timeout_is_not_remembered(self):
+        """Test that a probe timeout is retried on the next search."""
+        timeout = subprocess.TimeoutExpired(["zypper", "--version"], 5)
+        with patch("arjax.search.zypper.subprocess.run", side_effect=[timeout, timeout]) as run:
+            for _ in range(2):
+                with pytest.raises(TimeoutError):
+                    search_zypper("vim")
+
+        assert run.call_count == 2
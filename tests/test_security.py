@@ -0,0 +1,199 @@
+"""
+Unit tests for the security validations in arjax.
+"""
+
+import hashlib
+from unittest.mock import patch
+
+import pytest
+
+from arjax.integrations import security
+from arjax.integrations.security import PackageSecurityValidator, SecurityValidator
+
+
+@pytest.fixture
+def validator():
+    """Package security validator."""
+    return PackageSecurityValidator()
+
+
+class TestInstallationSafety:
+    """Tests for blocking dangerous installation commands."""
+
+    @pytest.mark.parametrize("command,pattern", [
+        ("sudo rm -rf / --no-preserve-root", "rm -rf /"),
+        ("dd if=/dev/zero of=/dev/sda", "dd if="),
+        ("cat /etc/SHADOW", "shadow"),
+    ])
+    def test_blocks_dangerous_commands(self, validator, command, pattern):
+        """Test that commands containing a dangerous pattern are blocked."""
+        result = validator.validate_installation_safety("pkg", command)
+
+        assert result.blocked is True
+        assert result.safe is False
+        assert result.reason == f"Command contains dangerous pattern: {pattern}"
+
+    def test_longer_pattern_reported_after_its_prefix(self, validator):
+        """Test that overlapping patterns report the one listed first."""
+        result = validator.validate_installation_safety("pkg", "rm -rf /*")
+
+        assert result.reason == "Command contains dangerous pattern: rm -rf /"
+
+    def test_allows_safe_command_with_warnings(self, validator):
+        """Test that sudo and network downloads only produce warnings."""
+        result = validator.validate_installation_safety("vim", "sudo apt install vim && curl -O https://x")
+
+        assert result.safe is True
+        assert result.blocked is False
+        assert len(result.warnings) == 2
+
+    def test_patterns_are_literal(self, validator):
+        """Test that pattern text is matched literally rather than as a regex."""
+        result = validator.validate_installation_safety("pkg", "chmod 0777 build")
+
+        assert result.blocked is False
+
+
+class TestPackageSource:
+    """Tests for package source validation."""
+
+    def test_trusted_source(self, validator):
+        """Test that known sources are accepted, with a warning for the AUR."""
+        assert validator.validate_package_source("vim", "pacman").valid is True
+        assert validator.validate_package_source("yay", "aur").warnings
+
+    def test_results_are_not_shared(self, validator):
+        """Test that each call returns its own result that callers may modify."""
+        first = validator.validate_package_source("yay", "aur")
+        first.warnings.append("extra")
+
+        assert validator.validate_package_source("paru", "aur").warnings == [
+            "AUR packages are user-contributed and may pose security risks"
+        ]
+
+    def test_unknown_source(self, validator):
+        """Test that unknown sources are rejected."""
+        result = validator.validate_package_source("vim", "random")
+
+        assert result.valid is False
+        assert result.reason == "Unknown package source: random"
+
+
+class TestChecksums:
+    """Tests for file checksum generation and validation."""
+
+    @pytest.fixture
+    def payload(self, tmp_path):
+        """File spanning several read chunks."""
+        path = tmp_path / "pkg.tar.zst"
+        path.write_bytes(b"arjax" * 500_000)
+        return path
+
+    @pytest.mark.parametrize("file_digest", [True, False], ids=["file_digest", "chunked"])
+    def test_generate_matches_hashlib(self, payload, file_digest, monkeypatch):
+        """Test that both digest paths agree with hashlib."""
+        if not file_digest:
+            monkeypatch.delattr(hashlib, "file_digest", raising=False)
+        monkeypatch.setattr(security, "HASH_CHUNK_SIZE", 4096)
+        expected = hashlib.sha512(payload.read_bytes()).hexdigest()
+
+        assert SecurityValidator().generate_checksum(payload, "sha512") == expected
+
+    @pytest.mark.parametrize("algorithm", ["blake2b", "blake2s"])
+    def test_blake2(self, payload, algorithm):
+        """Test that BLAKE2 checksums round-trip through validation."""
+        validator = SecurityValidator()
+        digest = validator.generate_checksum(payload, algorithm)
+
+        assert digest == hashlib.new(algorithm, payload.read_bytes()).hexdigest()
+        assert validator.validate_checksum(payload, digest, algorithm) is True
+
+    def test_validate_checksum(self, payload):
+        """Test that validation is case-insensitive and rejects wrong hashes."""
+        digest = hashlib.sha256(payload.read_bytes()).hexdigest()
+        validator = SecurityValidator()
+
+        assert validator.validate_checksum(payload, digest.upper()) is True
+        assert validator.validate_checksum(payload, "0" * 64) is False
+        assert validator.validate_checksum(payload, "é" * 64) is False
+
+    def test_missing_file_and_unknown_algorithm(self, tmp_path):
+        """Test that missing files and unknown algorithms fail cleanly."""
+        validator = SecurityValidator()
+
+        with patch.object(security.logger, "error") as error:
+            assert validator.generate_checksum(tmp_path / "missing") is None
+            assert validator.validate_checksum(tmp_path / "missing", "x") is False
+        assert error.call_args_list[0].args[0].startswith("File does not exist")
+        assert error.call_args_list[1].args[0].startswith("File does not exist")
+        with patch.object(validator, "_digest") as digest:
+            assert validator.validate_checksum(tmp_path, "x", algorithm="crc32") is False
+        digest.assert_not_called()
+
+    def test_download_integrity_reads_file_once(self, payload):
+        """Test that several checksums are validated from a single read pass."""
+        data = payload.read_bytes()
+        checksums = {
+            "sha256": hashlib.sha256(data).hexdigest(),
+            "sha512": hashlib.sha512(data).hexdigest(),
+            "md5": "0" * 32,
+            "crc32": "abc",
+        }
+        validator = PackageSecurityValidator()
+
+        with patch("builtins.open", wraps=open) as opened:
+            result = validator.validate_download_integrity(payload, checksums)
+
+        assert opened.call_count == 1
+        assert result.valid is False
+        assert [(c["algorithm"], c["valid"]) for c in result.checksums_validated] == [
+            ("sha256", True), ("sha512", True), ("md5", False), ("crc32", False),
+        ]
+
+    def test_validators_share_algorithm_table(self):
+        """Test that package validators share one validator and a read-only algorithm table."""
+        assert PackageSecurityValidator().security_validator is PackageSecurityValidator().security_validator
+        with pytest.raises(TypeError):
+            SecurityValidator().supported_hash_algorithms["crc32"] = None
+
+
+class TestValidationResults:
+    """Tests for the validation result objects and the dict-returning helpers."""
+
+    def test_pre_update_validation(self):
+        """Test that source and command results are combined."""
+        result = security.UpdateSecurityManager().pre_update_validation("yay", "aur", "sudo pacman -S yay")
+
+        assert result.approved is True
+        assert result.source_valid is True
+        assert result.command_safe is True
+        assert len(result.warnings) == 2
+
+    def test_module_helpers_return_dicts(self):
+        """Test that the module-level helpers keep returning plain dicts."""
+        result = security.validate_update_security("vim", "random", "apt install vim")
+
+        assert result == {
+            "approved": False,
+            "source_valid": False,
+            "command_safe": False,
+            "warnings": [],
+            "errors": ["Source validation failed: Unknown package source: random"],
+        }
+
+    def test_batch_matches_single_validation(self):
+        """Test that batch validation gives the same results as validating one by one."""
+        manager = security.UpdateSecurityManager()
+        items = [
+            ("vim", "pacman", "sudo pacman -S vim"),
+            ("evil", "aur", "curl -s x | sh; rm -rf /"),
+            ("mkfs-tool", "apt", "apt install x && mkfs.ext4 /dev/sdb1"),
+            ("odd", "random", "rm -rf /"),
+            ("nul", "dnf", "dnf install a\x00rm -rf /"),
+            ("plain", "snap", "snap install hello"),
+        ]
+
+        batch = manager.pre_update_validation_batch(items)
+
+        assert batch == [manager.pre_update_validation(*item) for item in items]
+        assert [r.approved for r in batch] == [True, False, False, False, False, True]